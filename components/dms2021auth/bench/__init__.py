@@ -0,0 +1,2 @@
+""" Benchmark suite of the authentication service.
+"""
@@ -0,0 +1,327 @@
+""" Benchmark suite of the authentication service.
+
+Run from the service directory with `python3 -m bench --help` for details.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional
+from bench.baseline import Baseline
+from bench.benchapp import BenchApp
+from bench.compactbench import CompactBench
+from bench.explainchecker import ExplainChecker
+from bench.loadrunner import LoadRunner
+from bench.loginstorm import LoginStorm
+from bench.lookupbench import LookupBench
+from bench.replicabench import ReplicaBench
+from bench.requestchecks import RequestChecks
+from bench.scenarios import Scenarios
+from bench.seeder import Seeder
+from bench.serverbench import ServerBench
+from bench.sessionstorebench import SessionStoreBench
+from bench.startupbench import StartupBench
+
+SUITES = ('core', 'profiles', 'kdf', 'metrics', 'servers', 'startup', 'storm', 'lookups',
+          'compact', 'replica', 'stores')
+
+# Configuration variants compared by the suites
+PROFILES: Dict[str, Dict] = {
+    'default': {'sqlite': None},
+    'tuned': {}
+}
+KDFS: Dict[str, Dict] = {
+    'pbkdf2-100000': {'password_hashing': {'algorithm': 'pbkdf2_sha256', 'iterations': 100000}},
+    'pbkdf2-260000': {'password_hashing': {'algorithm': 'pbkdf2_sha256', 'iterations': 260000}},
+    'pbkdf2-600000': {'password_hashing': {'algorithm': 'pbkdf2_sha256', 'iterations': 600000}},
+    'scrypt': {'password_hashing': {'algorithm': 'scrypt'}}
+}
+
+# Configuration variants whose requests are checked
+CHECKED: Dict[str, Dict] = {
+    'opaque_tokens': {},
+    'signed_tokens': {'signed_tokens': {'key': 'benchmark-signing-key-of-32-characters'}}
+}
+
+# Logins of a storm only race if they are not queued behind their password hashes
+STORM: Dict = {'password_hashing': {'algorithm': 'pbkdf2_sha256', 'iterations': 1000}}
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python3 -m bench', description='Benchmarks the authentication service.'
+    )
+    parser.add_argument('--suite', action='append', choices=SUITES + ('all',),
+                        help='Suite to run (repeatable; core by default).')
+    parser.add_argument('--users', type=int, default=10000,
+                        help='Users seeded (10000 by default).')
+    parser.add_argument('--sessions', type=int,
+                        help='Sessions seeded (as many as users by default). Only one per '
+                        'user is active.')
+    parser.add_argument('--concurrency', default='1,8,64',
+                        help='Comma-separated numbers of threads (1,8,64 by default).')
+    parser.add_argument('--connections', default='64,256,1024',
+                        help='Comma-separated numbers of connections of the servers suite '
+                        '(64,256,1024 by default).')
+    parser.add_argument('--duration', type=float, default=2.0,
+                        help='Measured seconds of every run (2 by default).')
+    parser.add_argument('--warmup', type=float, default=0.5,
+                        help='Warm-up seconds of every run (0.5 by default).')
+    parser.add_argument('--repeats', type=int, default=9,
+                        help='Runs with and without metrics in the metrics suite, and starts '
+                        'in the startup suite (9 by default).')
+    parser.add_argument('--storm-logins', type=int, default=64,
+                        help='Simultaneous logins per user in the storm suite (64 by default).')
+    parser.add_argument('--storm-rounds', type=int, default=3,
+                        help='Storms per user in the storm suite (3 by default).')
+    parser.add_argument('--lookups', type=int, default=20000,
+                        help='Lookups of each kind in the lookups suite (20000 by default).')
+    parser.add_argument('--replica-writers', type=int, default=8,
+                        help='Threads granting and revoking rights in the replica suite (8 by '
+                        'default).')
+    parser.add_argument('--max-metrics-overhead', type=float, default=0.02,
+                        help='Maximum throughput fraction lost to the metrics (0.02 by default).')
+    parser.add_argument('--baseline', default=os.path.join('bench', 'baseline.json'),
+                        help='Baseline file (bench/baseline.json by default).')
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help='Throughput fraction that may be lost against the baseline '
+                        '(0.3 by default).')
+    parser.add_argument('--latency-tolerance', type=float, default=1.0,
+                        help='p99 latency fraction that may be added against the baseline '
+                        '(1.0 by default).')
+    parser.add_argument('--no-compare', action='store_true',
+                        help='Do not compare the results with the baseline.')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store the results as the new baseline.')
+    parser.add_argument('--output', help='File where the JSON report is also written.')
+    parser.add_argument('--work-dir',
+                        help='Directory for the databases and configurations (a temporary '
+                        'one by default).')
+    return parser.parse_args()
+
+
+def load(work_dir: str, template: str, name: str, overrides: Optional[Dict] = None) -> BenchApp:
+    variant_dir: str = os.path.join(work_dir, name)
+    os.makedirs(variant_dir, exist_ok=True)
+    database: str = os.path.join(variant_dir, 'dmsauth.db')
+    BenchApp.copy_database(template, database)
+    return BenchApp(variant_dir, database, overrides)
+
+
+def run_scenarios(bench_app: BenchApp, seed: Dict, names: List[str], concurrencies: List[int],
+                  runner: LoadRunner, prefix: str, results: Dict) -> None:
+    scenarios: Scenarios = Scenarios(bench_app, seed)
+    for name in names:
+        for concurrency in concurrencies:
+            key: str = prefix + name + '/c' + str(concurrency)
+            results[key] = runner.run(scenarios.get(name), concurrency)
+            print(key + ': ' + json.dumps(results[key]), file=sys.stderr)
+
+
+def run_metrics(args: argparse.Namespace, work_dir: str, template: str, seed: Dict,
+                runner: LoadRunner) -> Dict:
+    # Runs with and without metrics are interleaved, so drifts affect both alike
+    throughputs: Dict[str, List[float]] = {'off': [], 'on': []}
+    for _ in range(args.repeats):
+        for variant in ('off', 'on'):
+            bench_app: BenchApp = load(
+                work_dir, template, 'metrics-' + variant, {'metrics': {'enabled': variant == 'on'}}
+            )
+            try:
+                result: Dict = runner.run(Scenarios(bench_app, seed).get('has_right'), 1)
+            finally:
+                bench_app.close()
+            throughputs[variant].append(result['throughput'])
+    off: float = statistics.median(throughputs['off'])
+    on: float = statistics.median(throughputs['on'])
+    overhead: float = round(1 - on / off, 4) if off > 0 else 0.0
+    return {
+        'throughput_off': off,
+        'throughput_on': on,
+        'overhead': overhead,
+        'limit': args.max_metrics_overhead,
+        'passed': overhead <= args.max_metrics_overhead
+    }
+
+
+def main() -> int:
+    args: argparse.Namespace = parse_arguments()
+    suites: List[str] = list(SUITES) if 'all' in (args.suite or []) else args.suite or ['core']
+    concurrencies: List[int] = [int(value) for value in args.concurrency.split(',')]
+    sessions: int = args.users if args.sessions is None else args.sessions
+    runner: LoadRunner = LoadRunner(args.duration, args.warmup)
+    report: Dict = {
+        'meta': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'users': args.users,
+            'sessions': sessions,
+            'duration': args.duration,
+            'warmup': args.warmup,
+            'suites': suites,
+            'timestamp': datetime.now().isoformat(timespec='seconds')
+        },
+        'results': {}
+    }
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        work_dir: str = args.work_dir or temporary_dir
+        template: str = os.path.join(work_dir, 'template.db')
+        BenchApp.remove_database(template)
+        bench_app: BenchApp = BenchApp(work_dir, template)
+        try:
+            seed: Dict = Seeder(bench_app).seed(args.users, sessions)
+        finally:
+            bench_app.close()
+
+        if 'core' in suites:
+            bench_app = load(work_dir, template, 'core')
+            explain_checker: ExplainChecker = ExplainChecker(bench_app.get('db'))
+            try:
+                run_scenarios(bench_app, seed, list(Scenarios.NAMES), concurrencies, runner,
+                              'core/', report['results'])
+            finally:
+                bench_app.close()
+            report['explain'] = explain_checker.check(os.path.join(work_dir, 'core', 'dmsauth.db'))
+            failures.extend(
+                'Full table scan: ' + entry['statement']
+                for entry in report['explain'] if entry['full_scan']
+            )
+            report['request_checks'] = {}
+            for name, overrides in CHECKED.items():
+                bench_app = load(work_dir, template, 'checks-' + name, overrides)
+                try:
+                    report['request_checks'][name] = RequestChecks(bench_app).run()
+                finally:
+                    bench_app.close()
+                failures.extend(
+                    'Request check (' + name + ') ' + failed
+                    for failed in report['request_checks'][name]['failed']
+                )
+        if 'profiles' in suites:
+            for name, overrides in PROFILES.items():
+                bench_app = load(work_dir, template, 'profile-' + name, overrides)
+                try:
+                    run_scenarios(bench_app, seed, ['login', 'has_right'], concurrencies, runner,
+                                  'profiles/' + name + '/', report['results'])
+                finally:
+                    bench_app.close()
+        if 'kdf' in suites:
+            for name, overrides in KDFS.items():
+                bench_app = load(work_dir, template, 'kdf-' + name, overrides)
+                try:
+                    # The seeded hashes are upgraded to the variant cost by their first login
+                    client = bench_app.client()
+                    for username in seed['login_users']:
+                        client.post('/sessions',
+                                    data={'username': username, 'password': Seeder.PASSWORD})
+                    run_scenarios(bench_app, seed, ['login'], concurrencies, runner,
+                                  'kdf/' + name + '/', report['results'])
+                finally:
+                    bench_app.close()
+        if 'metrics' in suites:
+            report['metrics_overhead'] = run_metrics(args, work_dir, template, seed, runner)
+            if not report['metrics_overhead']['passed']:
+                failures.append(
+                    'Metrics overhead: ' + str(report['metrics_overhead']['overhead'])
+                )
+        if 'servers' in suites:
+            server_bench: ServerBench = ServerBench(
+                work_dir, template, args.duration, args.warmup
+            )
+            for target in ServerBench.TARGETS:
+                for connections, result in server_bench.run(
+                    target, seed['bulk_users'],
+                    [int(value) for value in args.connections.split(',')]
+                ).items():
+                    report['results']['servers/' + target + '/conn' + connections] = result
+        if 'startup' in suites:
+            for name, result in StartupBench(work_dir, template, args.repeats).run().items():
+                report['results']['startup/' + name] = result
+        if 'storm' in suites:
+            bench_app = load(work_dir, template, 'storm', STORM)
+            try:
+                storm: Dict = LoginStorm(bench_app, seed['login_users'], args.storm_rounds).run(
+                    args.storm_logins
+                )
+            finally:
+                bench_app.close()
+            report['results']['storm/login/c' + str(args.storm_logins)] = storm
+            if storm['split'] > 0 or storm['duplicated'] > 0:
+                failures.append(
+                    'Login storm: ' + str(storm['split']) + ' storms with several tokens, '
+                    + str(storm['duplicated']) + ' users with several active sessions'
+                )
+        if 'lookups' in suites:
+            bench_app = load(work_dir, template, 'lookups')
+            try:
+                for name, result in LookupBench(bench_app, seed, args.lookups).run().items():
+                    report['results']['lookups/' + name] = result
+            finally:
+                bench_app.close()
+        if 'compact' in suites:
+            compact: Dict[str, Dict] = CompactBench(work_dir, template, seed, args.lookups).run()
+            report['storage_sizes'] = compact.pop('sizes')
+            for name, result in compact.items():
+                report['results']['compact/' + name] = result
+            if compact['migration']['window_errors'] > 0:
+                failures.append(
+                    'Requests made until the restart after the move: '
+                    + json.dumps(compact['migration']['window'])
+                )
+        if 'replica' in suites:
+            for name, result in ReplicaBench(
+                work_dir, template, seed, runner, args.replica_writers
+            ).run(concurrencies).items():
+                report['results']['replica/' + name] = result
+                print('replica/' + name + ': ' + json.dumps(result), file=sys.stderr)
+        if 'stores' in suites:
+            stores: Dict[str, Dict]
+            stores, store_results = SessionStoreBench(work_dir, template, seed, runner).run(
+                concurrencies
+            )
+            report['store_checks'] = stores
+            failures.extend(
+                'Session store ' + backend + ': ' + failed
+                for backend, checks in sorted(stores.items()) for failed in checks['failed']
+            )
+            for name, result in store_results.items():
+                report['results']['stores/' + name] = result
+                print('stores/' + name + ': ' + json.dumps(result), file=sys.stderr)
+
+    failures.extend(
+        name + ': ' + str(result['errors']) + ' failed operations'
+        for name, result in sorted(report['results'].items()) if result['errors'] > 0
+    )
+    baseline: Baseline = Baseline(args.baseline)
+    if not args.no_compare and not args.update_baseline:
+        try:
+            failures.extend(
+                'Regression in ' + regression for regression in baseline.compare(
+                    report, args.tolerance, args.latency_tolerance
+                )
+            )
+        except ValueError as error:
+            print('Not compared with the baseline: ' + str(error), file=sys.stderr)
+    if args.update_baseline:
+        baseline.save(report)
+    output: str = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as stream:
+            stream.write(output + '\n')
+    print(output)
+    for failure in failures:
+        print('FAILED: ' + failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
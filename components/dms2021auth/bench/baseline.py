@@ -0,0 +1,88 @@
+""" Baseline class module.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+
+class Baseline():
+    """ Class responsible of the stored benchmark results that later runs are
+    compared with.
+
+    Results are only comparable with a baseline taken with the same amount of
+    seeded data and measuring period; it is also specific to the machine that
+    took it.
+    """
+
+    # The meta values that must match for the results to be comparable
+    COMPARABLE = ('users', 'sessions', 'duration')
+
+    def __init__(self, path: str):
+        """ Constructor method.
+        ---
+        Parameters:
+            - path: The path of the baseline JSON file.
+        """
+        self.__path: str = path
+
+    def load(self) -> Optional[Dict]:
+        """ Loads the baseline.
+        ---
+        Returns:
+            The baseline report dictionary, or None if there is none.
+        """
+        if not os.path.exists(self.__path):
+            return None
+        with open(self.__path, 'r') as stream:
+            return json.load(stream)
+
+    def save(self, report: Dict) -> None:
+        """ Stores a report as the baseline.
+        ---
+        Parameters:
+            - report: The benchmark report dictionary.
+        """
+        with open(self.__path, 'w') as stream:
+            json.dump(report, stream, indent=2, sort_keys=True)
+            stream.write('\n')
+
+    def compare(
+        self, report: Dict, throughput_tolerance: float, latency_tolerance: float
+    ) -> List[str]:
+        """ Compares a report with the baseline.
+        ---
+        Parameters:
+            - report: The benchmark report dictionary.
+            - throughput_tolerance: The fraction of the baseline throughput that may be lost.
+            - latency_tolerance: The fraction of the baseline p99 latency that may be added.
+        Returns:
+            A list with a description of every regression.
+        Throws:
+            - A `ValueError` if there is no baseline or it is not comparable.
+        """
+        baseline: Optional[Dict] = self.load()
+        if baseline is None:
+            raise ValueError('There is no baseline at ' + self.__path)
+        for key in Baseline.COMPARABLE:
+            if baseline['meta'].get(key) != report['meta'].get(key):
+                raise ValueError(
+                    'The baseline was taken with ' + key + '=' + str(baseline['meta'].get(key))
+                    + ', not ' + str(report['meta'].get(key))
+                )
+        regressions: List[str] = []
+        for name, result in sorted(report['results'].items()):
+            expected: Optional[Dict] = baseline['results'].get(name)
+            if expected is None:
+                continue
+            if result['throughput'] < expected['throughput'] * (1 - throughput_tolerance):
+                regressions.append(
+                    name + ': throughput ' + str(result['throughput']) + ' ops/s, baseline '
+                    + str(expected['throughput']) + ' ops/s'
+                )
+            if result['p99_ms'] > expected['p99_ms'] * (1 + latency_tolerance):
+                regressions.append(
+                    name + ': p99 ' + str(result['p99_ms']) + ' ms, baseline '
+                    + str(expected['p99_ms']) + ' ms'
+                )
+        return regressions
@@ -0,0 +1,129 @@
+""" BenchApp class module.
+"""
+
+import os
+import runpy
+import shutil
+from typing import Any, Dict, Optional
+import yaml  # type: ignore
+from sqlalchemy.orm import clear_mappers  # type: ignore
+
+BIN_DIR: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bin')
+
+
+class BenchApp():
+    """ Class responsible of loading the service of `bin/dms2021auth` against a
+    benchmark database, to drive it in-process with the Flask test client.
+
+    Only one instance can be in use at a time, as the database records are
+    mapped again by each one.
+    """
+
+    def __init__(self, work_dir: str, database: str, overrides: Optional[Dict] = None):
+        """ Constructor method.
+
+        Writes the configuration and loads the service (without serving it).
+        ---
+        Parameters:
+            - work_dir: The directory where the configuration is written.
+            - database: The path of the SQLite database file.
+            - overrides: Configuration values replacing or extending the benchmark ones.
+        """
+        config_home: str = BenchApp.write_config(work_dir, database, overrides)
+        os.environ['XDG_CONFIG_HOME'] = config_home
+        clear_mappers()
+        self.__globals: Dict[str, Any] = runpy.run_path(
+            os.path.join(BIN_DIR, 'dms2021auth'), run_name='dms2021auth_bench'
+        )
+
+    def get(self, name: str) -> Any:
+        """ Gets an object created by the service script.
+        ---
+        Parameters:
+            - name: The name of the global (e.g., `app`, `db`, `password_hasher`).
+        Returns:
+            The object.
+        """
+        return self.__globals[name]
+
+    def client(self):
+        """ Creates a test client of the service.
+        ---
+        Returns:
+            A new Flask test client. Each thread must use its own one.
+        """
+        return self.__globals['app'].test_client()
+
+    def close(self) -> None:
+        """ Stops the service workers and releases the session store and the database.
+        """
+        self.__globals['password_hasher'].shutdown()
+        self.__globals['session_store'].close()
+        self.__globals['db'].close()
+
+    @staticmethod
+    def write_config(
+        work_dir: str, database: str, overrides: Optional[Dict] = None, port: int = 5000
+    ) -> str:
+        """ Writes a benchmark configuration file.
+        ---
+        Parameters:
+            - work_dir: The directory where the configuration is written.
+            - database: The path of the SQLite database file.
+            - overrides: Configuration values replacing or extending the benchmark ones;
+                         sections are merged.
+            - port: The service port.
+        Returns:
+            The directory to use as `XDG_CONFIG_HOME`.
+        """
+        config: Dict = {
+            'db_connection_string': 'sqlite:///' + os.path.abspath(database),
+            'host': '127.0.0.1',
+            'port': port,
+            'debug': False,
+            'salt': 'benchmark',
+            'sqlite': {
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'cache_size': -16000,
+                'mmap_size': 268435456,
+                'busy_timeout': 5000,
+                'temp_store': 'MEMORY'
+            }
+        }
+        for key, value in (overrides or {}).items():
+            if value is None:
+                config.pop(key, None)
+            elif isinstance(value, dict) and isinstance(config.get(key), dict):
+                config[key] = dict(config[key], **value)
+            else:
+                config[key] = value
+        config_home: str = os.path.join(work_dir, 'config')
+        os.makedirs(os.path.join(config_home, 'dms2021auth'), exist_ok=True)
+        with open(os.path.join(config_home, 'dms2021auth', 'config.yml'), 'w') as stream:
+            yaml.safe_dump(config, stream)
+        return config_home
+
+    @staticmethod
+    def copy_database(source: str, target: str) -> None:
+        """ Copies a closed SQLite database, with its journal files if any.
+        ---
+        Parameters:
+            - source: The path of the database to copy.
+            - target: The path of the copy.
+        """
+        BenchApp.remove_database(target)
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(source + suffix):
+                shutil.copyfile(source + suffix, target + suffix)
+
+    @staticmethod
+    def remove_database(path: str) -> None:
+        """ Removes an SQLite database, with its journal files if any.
+        ---
+        Parameters:
+            - path: The path of the database to remove.
+        """
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
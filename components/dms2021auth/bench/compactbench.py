@@ -0,0 +1,188 @@
+""" CompactBench class module.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+from dms2021core.data import UserRightName
+from dms2021auth.data.db.storagecompactor import StorageCompactor
+from bench.benchapp import BenchApp
+from bench.loadrunner import LoadRunner
+from bench.lookupbench import LookupBench
+from bench.seeder import Seeder
+
+
+class CompactBench():
+    """ Class responsible of comparing the default and compact storage layouts.
+
+    The seeded database is moved to the compact layout while login users log
+    in and out concurrently. Then, a user logs in to the service yet to notice
+    the move, which must refuse requests once it checks the layout; after the
+    rows are converted and the service is restarted in the compact layout, that
+    session must be usable. The space taken by the sessions and rights tables
+    and their indexes, and the lookups latency, are measured in both layouts.
+    Databases are vacuumed before being measured, so both are packed alike.
+    """
+
+    TABLES = ('user_sessions', 'user_rights')
+    # The period between the storage layout checks of the service being moved
+    CHECK_INTERVAL = 5.0
+
+    def __init__(self, work_dir: str, template: str, seed: Dict, lookups: int):
+        """ Constructor method.
+        ---
+        Parameters:
+            - work_dir: The directory where the configurations and databases are written.
+            - template: The path of the seeded database.
+            - seed: The seeded data, as returned by `Seeder.seed`.
+            - lookups: The number of measured lookups of each kind.
+        """
+        self.__work_dir: str = work_dir
+        self.__template: str = template
+        self.__seed: Dict = seed
+        self.__lookups: int = lookups
+
+    def run(self) -> Dict[str, Dict]:
+        """ Takes the measurements.
+        ---
+        Returns:
+            A dictionary with the `sizes` of each layout (bytes by table and index,
+            and their total), the summary of the operations run during the move
+            (`migration`, with the seconds taken to copy and to replace the tables),
+            and the lookups of each layout (see `LookupBench.run`).
+        """
+        results: Dict[str, Dict] = {'sizes': {}}
+        for layout in ('default', 'compact'):
+            layout_dir: str = os.path.join(self.__work_dir, 'compact-' + layout)
+            os.makedirs(layout_dir, exist_ok=True)
+            database: str = os.path.join(layout_dir, 'dmsauth.db')
+            BenchApp.copy_database(self.__template, database)
+            if layout == 'compact':
+                results['migration'] = self.__migrate(layout_dir, database)
+            results['sizes'][layout] = CompactBench.__sizes(database)
+            bench_app: BenchApp = BenchApp(
+                layout_dir, database, {'compact_storage': layout == 'compact'}
+            )
+            try:
+                for name, result in LookupBench(bench_app, self.__seed, self.__lookups).run(
+                ).items():
+                    results['lookups/' + layout + '/' + name] = result
+            finally:
+                bench_app.close()
+        return results
+
+    def __migrate(self, layout_dir: str, database: str) -> Dict:
+        """ Moves a database to the compact layout while users log in and out.
+        ---
+        Parameters:
+            - layout_dir: The directory where the configuration is written.
+            - database: The path of the database.
+        Returns:
+            The summary of the logins and logouts made meanwhile, with the seconds
+            taken to copy (`copy_s`) and to replace the tables (`swap_s`), and the
+            outcome of the requests made until the service is restarted (`window`,
+            with the number of unexpected ones as `window_errors`).
+        """
+        bench_app: BenchApp = BenchApp(
+            layout_dir, database, {'storage_layout_check_interval': CompactBench.CHECK_INTERVAL}
+        )
+        latencies: List[float] = []
+        errors: List[int] = [0]
+        done: threading.Event = threading.Event()
+
+        def worker() -> None:
+            client = bench_app.client()
+            usernames: List[str] = self.__seed['login_users']
+            index: int = 0
+            while not done.is_set():
+                start: float = time.perf_counter()
+                response = client.post('/sessions', data={
+                    'username': usernames[index % len(usernames)], 'password': Seeder.PASSWORD
+                })
+                succeeded: bool = response.status_code == 200
+                if succeeded:
+                    succeeded = client.delete('/sessions', data={
+                        'session_id': json.loads(response.get_data(as_text=True))['session_id']
+                    }).status_code == 200
+                latencies.append(time.perf_counter() - start)
+                if not succeeded:
+                    errors[0] += 1
+                index += 1
+
+        thread: threading.Thread = threading.Thread(target=worker, daemon=True)
+        usernames: List[str] = self.__seed['login_users']
+        window: Dict = {}
+        try:
+            compactor: StorageCompactor = StorageCompactor(bench_app.get('db'), 5000, 60)
+            start: float = time.perf_counter()
+            thread.start()
+            compactor.copy()
+            done.set()
+            thread.join()
+            client = bench_app.client()
+            # The layout is checked by this request, so it is not checked again
+            # until the window logins are made
+            time.sleep(CompactBench.CHECK_INTERVAL)
+            client.get('/users/' + usernames[0] + '/rights/' + UserRightName.AdminUsers.name)
+            swap_start: float = time.perf_counter()
+            compactor.swap()
+            end: float = time.perf_counter()
+            response = client.post(
+                '/sessions', data={'username': usernames[0], 'password': Seeder.PASSWORD}
+            )
+            window['login'] = response.status_code
+            token: str = json.loads(response.get_data(as_text=True))['session_id'] \
+                if response.status_code == 200 else ''
+            time.sleep(CompactBench.CHECK_INTERVAL)
+            window['refused_login'] = client.post(
+                '/sessions', data={'username': usernames[1], 'password': Seeder.PASSWORD}
+            ).status_code
+            window['converted'] = compactor.convert()
+        finally:
+            done.set()
+            bench_app.close()
+        bench_app = BenchApp(layout_dir, database, {'compact_storage': True})
+        try:
+            client = bench_app.client()
+            window['logout_after_restart'] = client.delete(
+                '/sessions', data={'session_id': token}
+            ).status_code
+            window['login_after_restart'] = client.post(
+                '/sessions', data={'username': usernames[0], 'password': Seeder.PASSWORD}
+            ).status_code
+        finally:
+            bench_app.close()
+        result: Dict = LoadRunner.summarize(latencies, errors[0], swap_start - start)
+        result['copy_s'] = round(swap_start - start, 3)
+        result['swap_s'] = round(end - swap_start, 3)
+        result['window'] = window
+        result['window_errors'] = sum((
+            window['login'] != 200, window['refused_login'] == 200, window['converted'] != 1,
+            window['logout_after_restart'] != 200, window['login_after_restart'] != 200
+        ))
+        return result
+
+    @staticmethod
+    def __sizes(database: str) -> Dict[str, int]:
+        """ Measures the space taken by the sessions and rights tables and their indexes.
+        ---
+        Parameters:
+            - database: The path of the database, which is vacuumed first.
+        Returns:
+            A dictionary with the bytes taken by every table and index, and their `total`.
+        """
+        connection: sqlite3.Connection = sqlite3.connect(database)
+        try:
+            connection.execute('VACUUM')
+            sizes: Dict[str, int] = dict(connection.execute(
+                'SELECT name, SUM(pgsize) FROM dbstat WHERE name IN ('
+                'SELECT name FROM sqlite_master WHERE tbl_name IN (?, ?)'
+                ') GROUP BY name', CompactBench.TABLES
+            ).fetchall())
+        finally:
+            connection.close()
+        sizes['total'] = sum(sizes.values())
+        return sizes
@@ -0,0 +1,87 @@
+""" ExplainChecker class module.
+"""
+
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Tuple
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.queryprofiler import QueryProfiler
+
+
+class ExplainChecker():
+    """ Class responsible of checking the query plans of the statements run by the
+    service.
+
+    The first occurrence of every distinct statement (see
+    `QueryProfiler.normalize`) is captured with its parameters, and its plan is
+    obtained with `EXPLAIN QUERY PLAN`. A plan fails the check if it scans a
+    whole seeded table, instead of searching it with an index.
+    """
+
+    TABLES = ('users', 'user_rights', 'user_sessions', 'revoked_tokens')
+
+    __FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)\b(?! USING)')
+
+    def __init__(self, schema: Schema):
+        """ Constructor method.
+
+        Starts capturing the statements run in the schema.
+        ---
+        Parameters:
+            - schema: The database schema of the service.
+        """
+        self.__lock: threading.Lock = threading.Lock()
+        self.__statements: Dict[str, Tuple[str, Tuple]] = {}
+        schema.listen('before_cursor_execute', self.__capture)
+
+    def check(self, database: str) -> List[Dict]:
+        """ Gets the plans of the captured statements.
+        ---
+        Parameters:
+            - database: The path of the SQLite database file.
+        Returns:
+            A list with a dictionary per statement, with the normalized `statement`,
+            its `plan` lines and whether it scans a whole seeded table (`full_scan`).
+        """
+        connection: sqlite3.Connection = sqlite3.connect(database)
+        results: List[Dict] = []
+        try:
+            with self.__lock:
+                statements: List[Tuple[str, Tuple[str, Tuple]]] = sorted(self.__statements.items())
+            for normalized, (statement, parameters) in statements:
+                plan: List[str] = [
+                    row[3] for row in connection.execute('EXPLAIN QUERY PLAN ' + statement,
+                                                         parameters)
+                ]
+                results.append({
+                    'statement': normalized,
+                    'plan': plan,
+                    'full_scan': any(
+                        match is not None and match.group(1) in ExplainChecker.TABLES
+                        for match in map(ExplainChecker.__FULL_SCAN.match, plan)
+                    )
+                })
+        finally:
+            connection.close()
+        return results
+
+    def __capture(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+        """ Engine listener capturing the first occurrence of every query.
+        ---
+        Parameters:
+            - statement: The statement string.
+            - parameters: The statement parameters.
+            - executemany: Whether the parameters hold several sets of them.
+        """
+        if not statement.lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE')):
+            return
+        normalized: str = QueryProfiler.normalize(statement)
+        if normalized in self.__statements:
+            return
+        if executemany:
+            parameters = parameters[0]
+        with self.__lock:
+            self.__statements.setdefault(normalized, (statement, tuple(parameters)))
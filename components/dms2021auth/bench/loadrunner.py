@@ -0,0 +1,126 @@
+""" LoadRunner class module.
+"""
+
+import gc
+import math
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class LoadRunner():
+    """ Class responsible of running an operation from several threads at once and
+    measuring its throughput and latency.
+
+    Each thread runs its own operation (as made by a factory) in a loop: first
+    during a warm-up period and then during the measured period. Only the
+    operations completed within the measured period are accounted. An
+    operation returns whether it succeeded, and raises `StopIteration` once
+    there is nothing left to do.
+    """
+
+    def __init__(self, duration: float, warmup: float):
+        """ Constructor method.
+        ---
+        Parameters:
+            - duration: The measured period, in seconds.
+            - warmup: The warm-up period, in seconds.
+        """
+        self.__duration: float = duration
+        self.__warmup: float = warmup
+
+    def run(self, make_operation: Callable[[], Callable[[], bool]], concurrency: int) -> Dict:
+        """ Runs the operation.
+        ---
+        Parameters:
+            - make_operation: Called once per thread (in that thread) to make its operation.
+            - concurrency: The number of threads.
+        Returns:
+            A dictionary with the number of measured `ops`, the `errors` among them,
+            the `throughput` (operations per second), the `p50_ms` and `p99_ms`
+            latencies, and whether the operations were `exhausted` before the end.
+        """
+        barrier: threading.Barrier = threading.Barrier(concurrency + 1)
+        latencies: List[List[float]] = [[] for _ in range(concurrency)]
+        errors: List[int] = [0] * concurrency
+        # The time each thread ran out of operations, if it did
+        exhausted: List[Optional[float]] = [None] * concurrency
+        # The measured period [start, end], known once every thread is ready
+        period: List[float] = [0.0, 0.0]
+
+        def worker(index: int) -> None:
+            operation: Callable[[], bool] = make_operation()
+            barrier.wait()
+            measured: List[float] = latencies[index]
+            try:
+                start: float = time.perf_counter()
+                while start < period[1]:
+                    succeeded: bool = operation()
+                    end: float = time.perf_counter()
+                    if period[0] <= end <= period[1]:
+                        measured.append(end - start)
+                        if not succeeded:
+                            errors[index] += 1
+                    start = end
+            except StopIteration:
+                exhausted[index] = time.perf_counter()
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=worker, args=(index,), daemon=True)
+            for index in range(concurrency)
+        ]
+        # Collections of the garbage left by earlier runs would be accounted to this one
+        gc.collect()
+        gc.freeze()
+        for thread in threads:
+            thread.start()
+        period[0] = time.perf_counter() + self.__warmup
+        period[1] = period[0] + self.__duration
+        barrier.wait()
+        for thread in threads:
+            thread.join()
+        gc.unfreeze()
+        elapsed: float = self.__duration
+        if all(time_out is not None for time_out in exhausted):
+            elapsed = min(max(time_out or 0.0 for time_out in exhausted) - period[0], elapsed)
+        return LoadRunner.summarize(
+            [value for values in latencies for value in values], sum(errors),
+            max(elapsed, 1e-9), any(time_out is not None for time_out in exhausted)
+        )
+
+    @staticmethod
+    def summarize(latencies: List[float], errors: int, elapsed: float,
+                  exhausted: bool = False) -> Dict:
+        """ Summarizes the measured operations.
+        ---
+        Parameters:
+            - latencies: The latency of each operation, in seconds.
+            - errors: The number of failed operations.
+            - elapsed: The measured period, in seconds.
+            - exhausted: Whether the operations ran out before the end of the period.
+        Returns:
+            The summary dictionary (see `run`).
+        """
+        latencies = sorted(latencies)
+        return {
+            'ops': len(latencies),
+            'errors': errors,
+            'throughput': round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+            'p50_ms': round(LoadRunner.percentile(latencies, 50) * 1000, 3),
+            'p99_ms': round(LoadRunner.percentile(latencies, 99) * 1000, 3),
+            'exhausted': exhausted
+        }
+
+    @staticmethod
+    def percentile(values: List[float], rank: float) -> float:
+        """ Gets a percentile with the nearest-rank method.
+        ---
+        Parameters:
+            - values: The sorted values.
+            - rank: The percentile rank, from 0 to 100.
+        Returns:
+            The percentile value, or 0 if there are no values.
+        """
+        if not values:
+            return 0.0
+        return values[max(math.ceil(rank / 100 * len(values)), 1) - 1]
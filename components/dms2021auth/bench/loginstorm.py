@@ -0,0 +1,118 @@
+""" LoginStorm class module.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import func, select  # type: ignore
+from dms2021auth.data.db.results import UserSession
+from bench.benchapp import BenchApp
+from bench.loadrunner import LoadRunner
+from bench.seeder import Seeder
+
+
+class LoginStorm():
+    """ Class responsible of logging the same users in from many threads at once,
+    checking that each user keeps a single active session.
+
+    The sessions opened by every storm are closed afterwards, so the logins of
+    the next one race to create them again. All the logins of a storm must
+    succeed and get the same token.
+    """
+
+    def __init__(self, bench_app: BenchApp, usernames: List[str], rounds: int):
+        """ Constructor method.
+        ---
+        Parameters:
+            - bench_app: The loaded service.
+            - usernames: The users logged in (with the seeded password).
+            - rounds: The number of storms per user.
+        """
+        self.__bench_app: BenchApp = bench_app
+        self.__usernames: List[str] = usernames
+        self.__rounds: int = rounds
+
+    def run(self, concurrency: int) -> Dict:
+        """ Runs the storms.
+        ---
+        Parameters:
+            - concurrency: The number of simultaneous logins per user.
+        Returns:
+            The summary of the logins (see `LoadRunner.summarize`), with the number of
+            storms in which a user got several tokens (`split`) and of users left with
+            several active sessions (`duplicated`).
+        """
+        latencies: List[float] = []
+        errors: int = 0
+        split: int = 0
+        elapsed: float = 0.0
+        clients = [self.__bench_app.client() for _ in range(concurrency)]
+        for _ in range(self.__rounds):
+            for username in self.__usernames:
+                tokens: List[Optional[str]]
+                times: List[float]
+                tokens, times = self.__storm(clients, username)
+                elapsed += max(times)
+                latencies.extend(times)
+                errors += tokens.count(None)
+                issued: Set[str] = {token for token in tokens if token is not None}
+                if len(issued) > 1:
+                    split += 1
+                for token in issued:
+                    clients[0].delete('/sessions', data={'session_id': token})
+        result: Dict = LoadRunner.summarize(latencies, errors, elapsed)
+        result['split'] = split
+        result['duplicated'] = self.__count_duplicated()
+        return result
+
+    @staticmethod
+    def __storm(clients: List, username: str) -> Tuple[List[Optional[str]], List[float]]:
+        """ Logs a user in from a thread per client, all released at once.
+        ---
+        Parameters:
+            - clients: The test clients, one per login.
+            - username: The user name string.
+        Returns:
+            A tuple with the token got by each login (None if it failed) and its latency.
+        """
+        tokens: List[Optional[str]] = [None] * len(clients)
+        times: List[float] = [0.0] * len(clients)
+        barrier: threading.Barrier = threading.Barrier(len(clients))
+
+        def worker(index: int) -> None:
+            barrier.wait()
+            start: float = time.perf_counter()
+            response = clients[index].post(
+                '/sessions', data={'username': username, 'password': Seeder.PASSWORD}
+            )
+            times[index] = time.perf_counter() - start
+            if response.status_code == 200:
+                tokens[index] = json.loads(response.get_data(as_text=True))['session_id']
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=worker, args=(index,), daemon=True)
+            for index in range(len(clients))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return (tokens, times)
+
+    def __count_duplicated(self) -> int:
+        """ Counts the users with several active sessions in the database.
+        ---
+        Returns:
+            The number of users.
+        """
+        table = UserSession.get_table()
+        session = self.__bench_app.get('db').new_session()
+        try:
+            return len(session.execute(
+                select([table.c.username]).where(
+                    table.c.active == True  # pylint: disable=singleton-comparison
+                ).group_by(table.c.username).having(func.count() > 1)
+            ).fetchall())
+        finally:
+            session.close()
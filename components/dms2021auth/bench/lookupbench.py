@@ -0,0 +1,141 @@
+""" LookupBench class module.
+"""
+
+import gc
+import itertools
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List
+from dms2021core.data import UserRightName
+from dms2021auth.data.db.results import User
+from dms2021auth.data.db.resultsets import Lookups, UserRights, UserSessions
+from bench.benchapp import BenchApp
+from bench.loadrunner import LoadRunner
+
+Lookup = Callable[[object, str], object]
+
+
+class LookupBench():
+    """ Class responsible of measuring the single-row lookups, both through the
+    ORM and through the `Lookups` read path.
+
+    Each lookup is run with a new key every time, in a single thread, and the
+    identity map is cleared between lookups as if each one came from a new
+    request. Latencies are measured first; the memory allocated by each lookup
+    is measured afterwards in separate runs, as tracing it slows them down.
+    """
+
+    # Lookup name -> (key kind, ORM lookup, read path lookup)
+    LOOKUPS: Dict[str, tuple] = {
+        'session_by_token': (
+            'tokens',
+            UserSessions.find_session_by_token,
+            Lookups.find_active_session
+        ),
+        'session_for_user': (
+            'bulk_users',
+            UserSessions.find_session_for_user,
+            Lookups.find_active_session_for_user
+        ),
+        'password_hash': (
+            'bulk_users',
+            lambda session, username: session.query(User).filter_by(username=username).first(),
+            Lookups.find_password_hash
+        ),
+        'right': (
+            'bulk_users',
+            lambda session, username: UserRights.find_right(
+                session, username, UserRightName.AdminUsers
+            ),
+            Lookups.find_rights
+        )
+    }
+
+    def __init__(self, bench_app: BenchApp, seed: Dict, lookups: int):
+        """ Constructor method.
+        ---
+        Parameters:
+            - bench_app: The loaded service.
+            - seed: The seeded data, as returned by `Seeder.seed`.
+            - lookups: The number of measured lookups of each kind.
+        """
+        self.__bench_app: BenchApp = bench_app
+        self.__seed: Dict = seed
+        self.__lookups: int = lookups
+
+    def run(self) -> Dict[str, Dict]:
+        """ Takes the measurements.
+        ---
+        Returns:
+            A dictionary with the summary (see `LoadRunner.summarize`) of each lookup
+            and path (e.g., `session_by_token/orm` and `session_by_token/core`), with
+            the mean bytes allocated at most at once by a lookup (`peak_bytes`).
+        """
+        results: Dict[str, Dict] = {}
+        session = self.__bench_app.get('db').new_session()
+        try:
+            for name, (keys, orm_lookup, core_lookup) in LookupBench.LOOKUPS.items():
+                for path, lookup in (('orm', orm_lookup), ('core', core_lookup)):
+                    # Warms up the statement caches and the database pages
+                    self.__time(session, lookup, self.__seed[keys], self.__lookups // 10 + 1)
+                    latencies: List[float] = self.__time(
+                        session, lookup, self.__seed[keys], self.__lookups
+                    )
+                    result: Dict = LoadRunner.summarize(latencies, 0, sum(latencies))
+                    result['peak_bytes'] = self.__peak_bytes(
+                        session, lookup, self.__seed[keys], self.__lookups
+                    )
+                    results[name + '/' + path] = result
+        finally:
+            session.close()
+        return results
+
+    @staticmethod
+    def __time(session, lookup: Lookup, keys: List[str], count: int) -> List[float]:
+        """ Times every lookup.
+        ---
+        Parameters:
+            - session: The session object.
+            - lookup: The lookup function.
+            - keys: The keys looked up, in turns.
+            - count: The number of lookups.
+        Returns:
+            The latency of each lookup, in seconds.
+        """
+        latencies: List[float] = []
+        cycle: Iterator[str] = itertools.cycle(keys)
+        gc.collect()
+        for _ in range(count):
+            key: str = next(cycle)
+            session.expunge_all()
+            start: float = time.perf_counter()
+            lookup(session, key)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    @staticmethod
+    def __peak_bytes(session, lookup: Lookup, keys: List[str], count: int) -> int:
+        """ Measures the memory allocated by the lookups.
+        ---
+        Parameters:
+            - session: The session object.
+            - lookup: The lookup function.
+            - keys: The keys looked up, in turns.
+            - count: The number of lookups.
+        Returns:
+            The mean of the most bytes allocated at once during a lookup.
+        """
+        peaks: List[int] = []
+        cycle: Iterator[str] = itertools.cycle(keys)
+        tracemalloc.start()
+        try:
+            for _ in range(count):
+                key: str = next(cycle)
+                session.expunge_all()
+                # Clearing the traces resets the peak too
+                tracemalloc.clear_traces()
+                lookup(session, key)
+                peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+        return sum(peaks) // max(len(peaks), 1)
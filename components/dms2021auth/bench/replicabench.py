@@ -0,0 +1,113 @@
+""" ReplicaBench class module.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from bench.benchapp import BenchApp
+from bench.loadrunner import LoadRunner
+from bench.scenarios import Scenarios
+
+
+class ReplicaBench():
+    """ Class responsible of measuring the rights checks while other threads grant
+    and revoke rights without a pause, with every statement sent to the primary
+    database and with the checks sent to a read replica.
+
+    The replica is a read-only connection to the same SQLite file, in WAL mode.
+    The caches are disabled, so every check reads the database.
+    """
+
+    VARIANTS = ('primary', 'replica')
+
+    def __init__(self, work_dir: str, template: str, seed: Dict, runner: LoadRunner,
+                 writers: int):  # pylint: disable=too-many-arguments
+        """ Constructor method.
+        ---
+        Parameters:
+            - work_dir: The directory where the configurations and databases are written.
+            - template: The path of the seeded database.
+            - seed: The seeded data, as returned by `Seeder.seed`.
+            - runner: The runner of the rights checks.
+            - writers: The number of threads granting and revoking rights.
+        """
+        self.__work_dir: str = work_dir
+        self.__template: str = template
+        self.__seed: Dict = seed
+        self.__runner: LoadRunner = runner
+        self.__writers: int = writers
+
+    def run(self, concurrencies: List[int]) -> Dict[str, Dict]:
+        """ Takes the measurements.
+        ---
+        Parameters:
+            - concurrencies: The numbers of threads checking rights.
+        Returns:
+            A dictionary with the summary (see `LoadRunner.summarize`) of the checks of
+            each variant and concurrency (e.g., `replica/c8`), and of the writes made
+            meanwhile (e.g., `replica/c8/writes`).
+        """
+        results: Dict[str, Dict] = {}
+        for variant in ReplicaBench.VARIANTS:
+            variant_dir: str = os.path.join(self.__work_dir, 'replica-' + variant)
+            os.makedirs(variant_dir, exist_ok=True)
+            database: str = os.path.join(variant_dir, 'dmsauth.db')
+            BenchApp.copy_database(self.__template, database)
+            overrides: Dict = {'session_cache': {'capacity': 0}, 'rights_cache': {'capacity': 0}}
+            if variant == 'replica':
+                overrides['db_read_connection_string'] = (
+                    'sqlite:///file:' + os.path.abspath(database) + '?mode=ro&uri=true'
+                )
+            bench_app: BenchApp = BenchApp(variant_dir, database, overrides)
+            try:
+                scenarios: Scenarios = Scenarios(bench_app, self.__seed)
+                for concurrency in concurrencies:
+                    key: str = variant + '/c' + str(concurrency)
+                    results[key], results[key + '/writes'] = self.__measure(
+                        scenarios, concurrency
+                    )
+            finally:
+                bench_app.close()
+        return results
+
+    def __measure(self, scenarios: Scenarios, concurrency: int) -> Tuple[Dict, Dict]:
+        """ Runs the rights checks while the writer threads grant and revoke rights.
+        ---
+        Parameters:
+            - scenarios: The scenarios of the loaded service.
+            - concurrency: The number of threads checking rights.
+        Returns:
+            A tuple with the summaries of the checks and of the writes.
+        """
+        latencies: List[List[float]] = [[] for _ in range(self.__writers)]
+        errors: List[int] = [0] * self.__writers
+        done: threading.Event = threading.Event()
+
+        def writer(index: int) -> None:
+            operation: Callable[[], bool] = scenarios.get('grant_revoke')()
+            while not done.is_set():
+                start: float = time.perf_counter()
+                succeeded: bool = operation()
+                latencies[index].append(time.perf_counter() - start)
+                if not succeeded:
+                    errors[index] += 1
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=writer, args=(index,), daemon=True)
+            for index in range(self.__writers)
+        ]
+        start: float = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        try:
+            checks: Dict = self.__runner.run(scenarios.get('has_right'), concurrency)
+        finally:
+            done.set()
+            for thread in threads:
+                thread.join()
+        writes: Dict = LoadRunner.summarize(
+            [value for values in latencies for value in values], sum(errors),
+            time.perf_counter() - start
+        )
+        return (checks, writes)
@@ -0,0 +1,122 @@
+""" RequestChecks class module.
+"""
+
+import json
+from typing import Callable, Dict, List, Tuple
+from bench.benchapp import BenchApp
+from bench.seeder import Seeder
+
+
+class RequestChecks():
+    """ Class responsible of checking how the service answers requests that are
+    not benchmarked, through its REST API.
+
+    Every check is run, each one with the session of the administrator.
+    """
+
+    # A token in the signed token format, but with characters that cannot be signed
+    NON_ASCII_TOKEN = '\u00e9.abc'
+
+    def __init__(self, bench_app: BenchApp):
+        """ Constructor method.
+        ---
+        Parameters:
+            - bench_app: The loaded service.
+        """
+        self.__bench_app: BenchApp = bench_app
+        self.__admin_token: str = ''
+
+    def run(self) -> Dict:
+        """ Runs the checks.
+        ---
+        Returns:
+            A dictionary with the number of `checks`, the names of those `passed`, and
+            the names and errors of those `failed`.
+        """
+        checks: List[Tuple[str, Callable[[], None]]] = [
+            ('list_users', self.__check_list_users),
+            ('list_sessions', self.__check_list_sessions),
+            ('validate_non_ascii', self.__check_validate_non_ascii),
+            ('logout_non_ascii', self.__check_logout_non_ascii)
+        ]
+        response = self.__bench_app.client().post(
+            '/sessions', data={'username': Seeder.ADMIN, 'password': Seeder.PASSWORD}
+        )
+        self.__admin_token = json.loads(response.get_data(as_text=True))['session_id']
+        report: Dict = {'checks': len(checks), 'passed': [], 'failed': []}
+        for name, check in checks:
+            try:
+                check()
+            except Exception as error:  # pylint: disable=broad-except
+                report['failed'].append(name + ': ' + repr(error))
+                continue
+            report['passed'].append(name)
+        return report
+
+    def __check_list_users(self) -> None:
+        """ Users are listed to a requestor identified by the header only.
+        """
+        self.__check_listing('/users', 'users')
+
+    def __check_list_sessions(self) -> None:
+        """ Sessions are listed to a requestor identified by the header only.
+        """
+        self.__check_listing('/sessions', 'sessions')
+
+    def __check_validate_non_ascii(self) -> None:
+        """ Tokens with non-ASCII characters are not valid sessions.
+        """
+        response = self.__bench_app.client().post(
+            '/sessions/validate', json=[RequestChecks.NON_ASCII_TOKEN]
+        )
+        RequestChecks.__expect(
+            response.status_code == 200
+            and not json.loads(response.get_data(as_text=True))[0]['valid'],
+            'validating answered ' + str(response.status_code)
+        )
+
+    def __check_logout_non_ascii(self) -> None:
+        """ Tokens with non-ASCII characters are not sessions that can be closed.
+        """
+        response = self.__bench_app.client().delete(
+            '/sessions', data={'session_id': RequestChecks.NON_ASCII_TOKEN}
+        )
+        RequestChecks.__expect(
+            response.status_code == 401, 'logging out answered ' + str(response.status_code)
+        )
+
+    def __check_listing(self, path: str, attribute: str) -> None:
+        """ Checks that a listing reads the requestor session from the `X-Session-Id`
+        header, and not from the URL.
+        ---
+        Parameters:
+            - path: The listing path.
+            - attribute: The attribute of the listed items in the response.
+        """
+        client = self.__bench_app.client()
+        response = client.get(
+            path, query_string={'limit': 2}, headers={'X-Session-Id': self.__admin_token}
+        )
+        RequestChecks.__expect(
+            response.status_code == 200
+            and len(json.loads(response.get_data(as_text=True))[attribute]) == 2,
+            'listing with the header answered ' + str(response.status_code)
+        )
+        response = client.get(path, query_string={'session_id': self.__admin_token})
+        RequestChecks.__expect(
+            response.status_code == 401,
+            'listing with the session in the URL answered ' + str(response.status_code)
+        )
+
+    @staticmethod
+    def __expect(condition: bool, message: str) -> None:
+        """ Fails a check unless a condition holds.
+        ---
+        Parameters:
+            - condition: The condition.
+            - message: The description of the failure.
+        Throws:
+            - AssertionError: If the condition does not hold.
+        """
+        if not condition:
+            raise AssertionError(message)
@@ -0,0 +1,128 @@
+""" Scenarios class module.
+"""
+
+import itertools
+import json
+import random
+import threading
+from typing import Callable, Dict, Iterator, List
+from dms2021core.data import UserRightName
+from bench.benchapp import BenchApp
+from bench.seeder import Seeder
+
+Operation = Callable[[], bool]
+
+
+class Scenarios():
+    """ Class responsible of making the benchmarked operations.
+
+    Each scenario is a factory of operations, called once per thread, so that
+    every thread drives the service with its own test client.
+    """
+
+    # The scenarios in the order they are run (`logout` consumes the seeded sessions)
+    NAMES = ('login', 'has_right', 'grant_revoke', 'create_user', 'logout')
+
+    def __init__(self, bench_app: BenchApp, seed: Dict):
+        """ Constructor method.
+        ---
+        Parameters:
+            - bench_app: The loaded service.
+            - seed: The seeded data, as returned by `Seeder.seed`.
+        """
+        self.__bench_app: BenchApp = bench_app
+        self.__seed: Dict = seed
+        self.__lock: threading.Lock = threading.Lock()
+        self.__counter: Iterator[int] = itertools.count()
+        self.__tokens: Iterator[str] = iter(seed['tokens'])
+        response = bench_app.client().post(
+            '/sessions', data={'username': Seeder.ADMIN, 'password': Seeder.PASSWORD}
+        )
+        self.__admin_token: str = json.loads(response.get_data(as_text=True))['session_id']
+
+    def get(self, name: str) -> Callable[[], Operation]:
+        """ Gets the operations factory of a scenario.
+        ---
+        Parameters:
+            - name: The scenario name (one of `NAMES`).
+        Returns:
+            The operations factory.
+        """
+        return getattr(self, '_Scenarios__' + name)
+
+    def __next(self) -> int:
+        """ Gets a number not used before by any thread.
+        ---
+        Returns:
+            The number.
+        """
+        with self.__lock:
+            return next(self.__counter)
+
+    def __login(self) -> Operation:
+        """ Logs in the users with real passwords, in turns.
+        """
+        client = self.__bench_app.client()
+        usernames: Iterator[str] = itertools.cycle(self.__seed['login_users'])
+        for _ in range(self.__next() % len(self.__seed['login_users'])):
+            next(usernames)
+
+        def operation() -> bool:
+            return client.post('/sessions', data={
+                'username': next(usernames), 'password': Seeder.PASSWORD
+            }).status_code == 200
+        return operation
+
+    def __has_right(self) -> Operation:
+        """ Checks random rights of random users (a quarter of the checks succeed).
+        """
+        client = self.__bench_app.client()
+        generator: random.Random = random.Random(self.__next())
+        usernames: List[str] = self.__seed['bulk_users']
+
+        def operation() -> bool:
+            return client.get(
+                '/users/' + generator.choice(usernames) + '/rights/' + UserRightName.AdminUsers.name
+            ).status_code in (200, 404)
+        return operation
+
+    def __grant_revoke(self) -> Operation:
+        """ Grants and revokes a right to a user of the thread, alternately.
+        """
+        client = self.__bench_app.client()
+        usernames: List[str] = self.__seed['bulk_users']
+        path: str = (
+            '/users/' + usernames[self.__next() % len(usernames)] + '/rights/'
+            + UserRightName.AdminSensors.name
+        )
+        methods: Iterator[Callable] = itertools.cycle((client.post, client.delete))
+
+        def operation() -> bool:
+            return next(methods)(
+                path, data={'session_id': self.__admin_token}
+            ).status_code == 200
+        return operation
+
+    def __create_user(self) -> Operation:
+        """ Creates new users.
+        """
+        client = self.__bench_app.client()
+
+        def operation() -> bool:
+            return client.post('/users', data={
+                'username': 'new' + str(self.__next()),
+                'password': Seeder.PASSWORD,
+                'session_id': self.__admin_token
+            }).status_code == 200
+        return operation
+
+    def __logout(self) -> Operation:
+        """ Logs out the seeded sessions, until none is left.
+        """
+        client = self.__bench_app.client()
+
+        def operation() -> bool:
+            with self.__lock:
+                token: str = next(self.__tokens)
+            return client.delete('/sessions', data={'session_id': token}).status_code == 200
+        return operation
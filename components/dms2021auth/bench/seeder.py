@@ -0,0 +1,110 @@
+""" Seeder class module.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Dict, Iterator, List
+from dms2021core.data import UserRightName
+from dms2021auth.data.db.results import User, UserRight, UserSession
+from bench.benchapp import BenchApp
+
+
+class Seeder():
+    """ Class responsible of filling a benchmark database.
+
+    Every bulk user gets a placeholder password (none can log in), so millions
+    of them can be created quickly; a few login users and the administrator
+    get real password hashes. Each bulk user has at most one active session.
+    """
+
+    PASSWORD = 'benchmark'
+    ADMIN = 'admin'
+    LOGIN_USERS = 16
+    CHUNK_SIZE = 10000
+
+    def __init__(self, bench_app: BenchApp):
+        """ Constructor method.
+        ---
+        Parameters:
+            - bench_app: The loaded service, whose database is filled.
+        """
+        self.__bench_app: BenchApp = bench_app
+
+    def seed(self, users: int, sessions: int) -> Dict:
+        """ Fills the database.
+        ---
+        Parameters:
+            - users: The number of bulk users.
+            - sessions: The number of sessions of the bulk users. Those beyond the
+                        number of users are inactive.
+        Returns:
+            A dictionary with the names of the `login_users` and `bulk_users`
+            (a sample, to pick from), and the `tokens` of the active sessions.
+        """
+        hasher = self.__bench_app.get('password_hasher')
+        login_users: List[str] = ['login' + str(index) for index in range(Seeder.LOGIN_USERS)]
+        privileged: List[Dict] = [
+            {'username': username, 'password': hasher.hash(username, Seeder.PASSWORD)}
+            for username in [Seeder.ADMIN] + login_users
+        ]
+        tokens: List[str] = []
+        session = self.__bench_app.get('db').new_session()
+        try:
+            session.execute(User.get_table().insert(), privileged)
+            session.execute(UserRight.get_table().insert(), [
+                {'username': Seeder.ADMIN, 'right': right}
+                for right in (UserRightName.AdminUsers, UserRightName.AdminRights)
+            ])
+            for chunk in Seeder.__chunks(users):
+                session.execute(User.get_table().insert(), [
+                    {'username': Seeder.bulk_user(index), 'password': '!'} for index in chunk
+                ])
+                # One in four users can administer the users
+                session.execute(UserRight.get_table().insert(), [
+                    {'username': Seeder.bulk_user(index), 'right': UserRightName.AdminUsers}
+                    for index in chunk if index % 4 == 0
+                ])
+            now: datetime = datetime.now()
+            for chunk in Seeder.__chunks(sessions):
+                rows: List[Dict] = [{
+                    'token': token,
+                    'session_key': UserSession.key_of(token),
+                    'username': Seeder.bulk_user(index % max(users, 1)),
+                    'active': index < users,
+                    'active_username': Seeder.bulk_user(index) if index < users else None,
+                    'created': now,
+                    'updated': now
+                } for index, token in ((index, str(uuid.uuid4())) for index in chunk)]
+                tokens.extend(row['token'] for row in rows if row['active'])
+                session.execute(UserSession.get_table().insert(), rows)
+            session.commit()
+        finally:
+            session.close()
+        return {
+            'login_users': login_users,
+            'bulk_users': [Seeder.bulk_user(index) for index in range(min(users, 100000))],
+            'tokens': tokens
+        }
+
+    @staticmethod
+    def bulk_user(index: int) -> str:
+        """ Gets the name of a bulk user.
+        ---
+        Parameters:
+            - index: The user index.
+        Returns:
+            The user name string.
+        """
+        return 'user' + str(index).zfill(7)
+
+    @staticmethod
+    def __chunks(count: int) -> Iterator[range]:
+        """ Splits a number of rows in chunks inserted at once.
+        ---
+        Parameters:
+            - count: The number of rows.
+        Returns:
+            An iterator of index ranges.
+        """
+        for start in range(0, count, Seeder.CHUNK_SIZE):
+            yield range(start, min(start + Seeder.CHUNK_SIZE, count))
@@ -0,0 +1,252 @@
+""" ServerBench class module.
+"""
+
+import asyncio
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+from dms2021core.data import UserRightName
+from bench.benchapp import BIN_DIR, BenchApp
+from bench.loadrunner import LoadRunner
+
+
+class ServerBench():
+    """ Class responsible of benchmarking the service servers, each one run in its own
+    process and driven through actual connections.
+
+    Every client connection sends user right checks one after another, reusing
+    the connection while the server keeps it alive, and is reopened otherwise.
+    """
+
+    # Target name -> (script, configuration overrides)
+    TARGETS: Dict[str, Tuple[str, Dict]] = {
+        'flask': ('dms2021auth', {'server': {'mode': 'development'}}),
+        'prefork': ('dms2021auth', {'server': {'mode': 'prefork'}}),
+        'async': ('dms2021auth-async', {})
+    }
+    STARTUP_TIMEOUT = 60.0
+
+    def __init__(self, work_dir: str, template: str, duration: float, warmup: float):
+        """ Constructor method.
+        ---
+        Parameters:
+            - work_dir: The directory where the configurations and databases are written.
+            - template: The path of the seeded database, copied for every server.
+            - duration: The measured period of every run, in seconds.
+            - warmup: The warm-up period of every run, in seconds.
+        """
+        self.__work_dir: str = work_dir
+        self.__template: str = template
+        self.__duration: float = duration
+        self.__warmup: float = warmup
+
+    def run(self, target: str, usernames: List[str], connection_counts: List[int]) -> Dict:
+        """ Starts a server and benchmarks it with several numbers of connections.
+        ---
+        Parameters:
+            - target: The server to benchmark (one of `TARGETS`).
+            - usernames: The users whose rights are checked.
+            - connection_counts: The numbers of concurrent connections.
+        Returns:
+            A dictionary with the summary of each run (see `LoadRunner.run`) by
+            number of connections, including the number of `starved` connections
+            (those that completed no request while measuring).
+        """
+        process, port = self.start(target, 'server-' + target)
+        try:
+            return {
+                str(connections): asyncio.run(
+                    self.__drive(port, usernames, connections)
+                ) for connections in connection_counts
+            }
+        finally:
+            ServerBench.stop(process)
+
+    def start(self, target: str, name: str) -> Tuple[subprocess.Popen, int]:
+        """ Starts a server and waits until it answers requests.
+        ---
+        Parameters:
+            - target: The server to start (one of `TARGETS`).
+            - name: The name of the directory where its configuration, database (copied
+                    on the first start) and log are written.
+        Returns:
+            A tuple with the server process and port.
+        Throws:
+            - A `RuntimeError` if the server exits or does not answer in time.
+        """
+        script, overrides = ServerBench.TARGETS[target]
+        target_dir: str = os.path.join(self.__work_dir, name)
+        os.makedirs(target_dir, exist_ok=True)
+        database: str = os.path.join(target_dir, 'dmsauth.db')
+        if not os.path.exists(database):
+            BenchApp.copy_database(self.__template, database)
+        port: int = ServerBench.__free_port()
+        env: Dict[str, str] = dict(os.environ)
+        env['XDG_CONFIG_HOME'] = BenchApp.write_config(target_dir, database, overrides, port)
+        env['XDG_CACHE_HOME'] = os.path.join(target_dir, 'cache')
+        with open(os.path.join(target_dir, 'server.log'), 'a') as log:
+            process: subprocess.Popen = subprocess.Popen(
+                [sys.executable, os.path.join(BIN_DIR, script)],
+                env=env, stdout=log, stderr=subprocess.STDOUT
+            )
+        try:
+            ServerBench.__wait_ready(process, port)
+        except RuntimeError:
+            ServerBench.stop(process)
+            raise
+        return process, port
+
+    @staticmethod
+    def stop(process: subprocess.Popen) -> None:
+        """ Stops a server, killing it if it does not stop in time.
+        ---
+        Parameters:
+            - process: The server process.
+        """
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=ServerBench.STARTUP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    @staticmethod
+    def __wait_ready(process: subprocess.Popen, port: int) -> None:
+        """ Waits until a server answers requests.
+        ---
+        Parameters:
+            - process: The server process.
+            - port: The server port.
+        Throws:
+            - A `RuntimeError` if the server exits or does not answer in time.
+        """
+        deadline: float = time.monotonic() + ServerBench.STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError('The server exited with code ' + str(process.returncode))
+            try:
+                with urllib.request.urlopen('http://127.0.0.1:' + str(port) + '/', timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError('The server did not start in time')
+
+    async def __drive(self, port: int, usernames: List[str], connections: int) -> Dict:
+        """ Sends requests through many connections at once.
+        ---
+        Parameters:
+            - port: The server port.
+            - usernames: The users whose rights are checked.
+            - connections: The number of concurrent connections.
+        Returns:
+            The summary of the run.
+        """
+        loop = asyncio.get_running_loop()
+        start: float = loop.time() + self.__warmup
+        end: float = start + self.__duration
+        results: List[Tuple[List[float], int]] = await asyncio.gather(*[
+            self.__connection(port, usernames, random.Random(index), start, end)
+            for index in range(connections)
+        ])
+        summary: Dict = LoadRunner.summarize(
+            [latency for latencies, _ in results for latency in latencies],
+            sum(errors for _, errors in results), self.__duration
+        )
+        summary['starved'] = sum(1 for latencies, _ in results if not latencies)
+        del summary['exhausted']
+        return summary
+
+    @staticmethod
+    async def __connection(
+        port: int, usernames: List[str], generator: random.Random, start: float, end: float
+    ) -> Tuple[List[float], int]:
+        """ Sends requests through a client connection until the end of a run.
+        ---
+        Parameters:
+            - port: The server port.
+            - usernames: The users whose rights are checked.
+            - generator: The random numbers generator of the connection.
+            - start: The loop time when measuring starts.
+            - end: The loop time when the run ends.
+        Returns:
+            A tuple with the latencies of the requests completed while measuring, in
+            seconds, and the number of them that failed.
+        """
+        loop = asyncio.get_running_loop()
+        latencies: List[float] = []
+        errors: int = 0
+        streams: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+        while loop.time() < end:
+            begin: float = loop.time()
+            status: int = 0
+            try:
+                if streams is None:
+                    streams = await asyncio.open_connection('127.0.0.1', port)
+                reader, writer = streams
+                writer.write((
+                    'GET /users/' + generator.choice(usernames) + '/rights/'
+                    + UserRightName.AdminUsers.name + ' HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n'
+                ).encode('ascii'))
+                status, keep_alive = await ServerBench.__read_response(reader)
+                if not keep_alive:
+                    writer.close()
+                    streams = None
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                if streams is not None:
+                    streams[1].close()
+                    streams = None
+                await asyncio.sleep(0.01)
+            finish: float = loop.time()
+            if start <= finish <= end:
+                latencies.append(finish - begin)
+                if status not in (200, 404):
+                    errors += 1
+        if streams is not None:
+            streams[1].close()
+        return latencies, errors
+
+    @staticmethod
+    async def __read_response(reader: asyncio.StreamReader) -> Tuple[int, bool]:
+        """ Reads a response.
+        ---
+        Parameters:
+            - reader: The connection reader.
+        Returns:
+            A tuple with the response status code and whether the connection is kept alive.
+        """
+        head: List[str] = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+        version, status = head[0].split(' ')[:2]
+        headers: Dict[str, str] = {}
+        for line in head[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip().lower()
+        keep_alive: bool = version == 'HTTP/1.1' and headers.get('connection') != 'close'
+        if headers.get('transfer-encoding') == 'chunked':
+            while True:
+                size: int = int((await reader.readline()).split(b';')[0], 16)
+                await reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif 'content-length' in headers:
+            await reader.readexactly(int(headers['content-length']))
+        else:
+            await reader.read()
+            keep_alive = False
+        return int(status), keep_alive
+
+    @staticmethod
+    def __free_port() -> int:
+        """ Finds a free TCP port.
+        ---
+        Returns:
+            The port number.
+        """
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            return probe.getsockname()[1]
@@ -0,0 +1,169 @@
+""" SessionStoreBench class module.
+"""
+
+import glob
+import itertools
+import os
+import random
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Tuple
+from dms2021auth.data.db import Schema
+from dms2021auth.data.sessionstore import SessionStore
+from bench.benchapp import BenchApp
+from bench.loadrunner import LoadRunner
+from bench.seeder import Seeder
+from bench.sessionstorechecks import SessionStoreChecks
+
+
+class SessionStoreBench():
+    """ Class responsible of checking and measuring every session store backend.
+
+    Each backend is first checked (see `SessionStoreChecks`) on a copy of the
+    seeded database, and then measured on another copy, holding an active
+    session of every sampled bulk user. Store operations are called directly,
+    not through the service, with the session cache disabled:
+    - `owner`: finding the owner of a random active session.
+    - `login`: reopening the active session of a random user and touching it.
+    - `cycle`: opening a session of a user of the thread and closing it.
+    """
+
+    BACKENDS = ('sql', 'memory', 'dbm')
+    OPERATIONS = ('owner', 'login', 'cycle')
+
+    def __init__(self, work_dir: str, template: str, seed: Dict, runner: LoadRunner):
+        """ Constructor method.
+        ---
+        Parameters:
+            - work_dir: The directory where the configurations and databases are written.
+            - template: The path of the seeded database.
+            - seed: The seeded data, as returned by `Seeder.seed`.
+            - runner: The runner of the store operations.
+        """
+        self.__work_dir: str = work_dir
+        self.__template: str = template
+        self.__seed: Dict = seed
+        self.__runner: LoadRunner = runner
+        self.__lock: threading.Lock = threading.Lock()
+        self.__counter: Iterator[int] = itertools.count()
+
+    def run(self, concurrencies: List[int]) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """ Checks and measures the backends.
+        ---
+        Parameters:
+            - concurrencies: The numbers of threads running the operations.
+        Returns:
+            A tuple with the checks report of each backend (see `SessionStoreChecks.run`),
+            and the summary (see `LoadRunner.summarize`) of each backend, operation and
+            concurrency (e.g., `dbm/owner/c8`).
+        """
+        checks: Dict[str, Dict] = {}
+        results: Dict[str, Dict] = {}
+        for backend in SessionStoreBench.BACKENDS:
+            bench_app: BenchApp = self.__load(
+                backend, 'checks', {'session_touch': {'flush_interval': 0}}
+            )
+            try:
+                checks[backend] = SessionStoreChecks(
+                    bench_app.get('session_store'), bench_app.get('db'),
+                    self.__seed['login_users'][:5], Seeder.ADMIN
+                ).run()
+            finally:
+                bench_app.close()
+            bench_app = self.__load(backend, 'timing', {'session_cache': {'capacity': 0}})
+            try:
+                store: SessionStore = bench_app.get('session_store')
+                schema: Schema = bench_app.get('db')
+                tokens: List[str] = self.__open_sessions(backend, store)
+                for operation in SessionStoreBench.OPERATIONS:
+                    for concurrency in concurrencies:
+                        results[backend + '/' + operation + '/c' + str(concurrency)] = \
+                            self.__runner.run(
+                                self.__operations(operation, store, schema, tokens), concurrency
+                            )
+            finally:
+                bench_app.close()
+        return (checks, results)
+
+    def __load(self, backend: str, purpose: str, overrides: Dict) -> BenchApp:
+        """ Loads the service with a backend on a new copy of the seeded database.
+        ---
+        Parameters:
+            - backend: The session store backend.
+            - purpose: The name of the copy (`checks` or `timing`).
+            - overrides: Further configuration values.
+        Returns:
+            The loaded service.
+        """
+        variant_dir: str = os.path.join(self.__work_dir, 'stores-' + backend + '-' + purpose)
+        os.makedirs(variant_dir, exist_ok=True)
+        database: str = os.path.join(variant_dir, 'dmsauth.db')
+        BenchApp.copy_database(self.__template, database)
+        sessions_path: str = os.path.join(variant_dir, 'sessions')
+        for path in glob.glob(sessions_path + '*'):
+            os.remove(path)
+        return BenchApp(variant_dir, database, dict(overrides, session_store={
+            'backend': backend, 'path': sessions_path
+        }))
+
+    def __open_sessions(self, backend: str, store: SessionStore) -> List[str]:
+        """ Gets an active session of every sampled bulk user.
+        ---
+        Parameters:
+            - backend: The session store backend.
+            - store: The session store.
+        Returns:
+            The list of session tokens.
+        """
+        if backend == 'sql':
+            # Already seeded in the database
+            return list(self.__seed['tokens'])
+        return [store.open_session(username)[0] for username in self.__seed['bulk_users']]
+
+    def __operations(
+        self, name: str, store: SessionStore, schema: Schema, tokens: List[str]
+    ) -> Callable[[], Callable[[], bool]]:
+        """ Gets the operations factory of a store operation.
+        ---
+        Parameters:
+            - name: The operation name (one of `OPERATIONS`).
+            - store: The session store.
+            - schema: The schema, whose thread session is removed after every operation,
+                      as at the end of a request.
+            - tokens: The tokens of the active sessions.
+        Returns:
+            The operations factory.
+        """
+        usernames: List[str] = self.__seed['bulk_users']
+
+        def make_operation() -> Callable[[], bool]:
+            with self.__lock:
+                index: int = next(self.__counter)
+            generator: random.Random = random.Random(index)
+            username: str = usernames[-1 - index % len(usernames)]
+
+            def owner() -> bool:
+                token: str = generator.choice(tokens)
+                return token in store.find_sessions_owners([token])
+
+            def login() -> bool:
+                token, created = store.open_session(generator.choice(usernames))
+                if not created:
+                    store.touch_session(token, datetime.now())
+                return True
+
+            def cycle() -> bool:
+                store.close_session(store.open_session(username)[0])
+                return True
+
+            function: Callable[[], bool] = {'owner': owner, 'login': login, 'cycle': cycle}[name]
+
+            def operation() -> bool:
+                try:
+                    return function()
+                except Exception:  # pylint: disable=broad-except
+                    return False
+                finally:
+                    schema.remove_session()
+            return operation
+        return make_operation
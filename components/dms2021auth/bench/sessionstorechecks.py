@@ -0,0 +1,276 @@
+""" SessionStoreChecks class module.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.exc import SessionNotFoundError
+from dms2021auth.data.db.results import UserSession
+from dms2021auth.data.db.resultsets import UserRights
+from dms2021auth.data.sessionstore import SessionStore
+
+
+class SessionStoreChecks():
+    """ Class responsible of checking that a session store behaves as the
+    `SessionStore` interface describes, whatever its backend.
+
+    The checks are run in order, each one building on the sessions left by the
+    previous ones, against users with no active session. A failed check stops
+    the run, as the rest depend on it.
+    """
+
+    CONCURRENT_OPENS = 16
+
+    def __init__(self, store: SessionStore, schema: Schema, usernames: List[str], admin: str):
+        """ Constructor method.
+        ---
+        Parameters:
+            - store: The session store checked.
+            - schema: The schema of the database holding the users and their rights.
+            - usernames: At least 5 users with no active session.
+            - admin: A user with some rights and no active session.
+        """
+        self.__store: SessionStore = store
+        self.__schema: Schema = schema
+        self.__usernames: List[str] = usernames
+        self.__admin: str = admin
+        self.__tokens: Dict[str, str] = {}
+
+    def run(self) -> Dict:
+        """ Runs the checks.
+        ---
+        Returns:
+            A dictionary with the number of `checks`, the names of those `passed`, and
+            the name and error of the `failed` one, if any.
+        """
+        checks: List[Tuple[str, Callable[[], None]]] = [
+            ('open_reuses_active', self.__check_open_reuses_active),
+            ('find_owners', self.__check_find_owners),
+            ('rights_masks', self.__check_rights_masks),
+            ('touch', self.__check_touch),
+            ('close', self.__check_close),
+            ('reopen', self.__check_reopen),
+            ('iter_sessions', self.__check_iter_sessions),
+            ('concurrent_open', self.__check_concurrent_open),
+            ('expire_idle', self.__check_expire_idle),
+            ('purge_inactive', self.__check_purge_inactive)
+        ]
+        report: Dict = {'checks': len(checks), 'passed': [], 'failed': []}
+        for name, check in checks:
+            try:
+                check()
+            except Exception as error:  # pylint: disable=broad-except
+                report['failed'].append(name + ': ' + repr(error))
+                break
+            finally:
+                self.__schema.remove_session()
+            report['passed'].append(name)
+        return report
+
+    def __check_open_reuses_active(self) -> None:
+        """ Opening a session creates it, and opening it again reuses it.
+        """
+        username: str = self.__usernames[0]
+        token, created = self.__store.open_session(username)
+        SessionStoreChecks.__expect(created, 'the first session was not created')
+        reused, created = self.__store.open_session(username)
+        SessionStoreChecks.__expect(
+            reused == token and not created, 'the active session was not reused'
+        )
+        self.__tokens['first'] = token
+
+    def __check_find_owners(self) -> None:
+        """ The owners of the active sessions are found, and unknown tokens left out.
+        """
+        owners: Dict[str, str] = self.__store.find_sessions_owners(
+            [self.__tokens['first'], 'unknown-token']
+        )
+        SessionStoreChecks.__expect(
+            owners == {self.__tokens['first']: self.__usernames[0]},
+            'unexpected owners ' + repr(owners)
+        )
+
+    def __check_rights_masks(self) -> None:
+        """ The owners of the active sessions are found along with their rights.
+        """
+        token, _ = self.__store.open_session(self.__admin)
+        mask: int = UserRights.get_rights_mask(self.__schema.get_session(), self.__admin)
+        SessionStoreChecks.__expect(mask != 0, 'the administrator has no rights')
+        found: Dict[str, Tuple[str, int]] = self.__store.find_sessions_rights_masks(
+            [token, 'unknown-token']
+        )
+        SessionStoreChecks.__expect(
+            found == {token: (self.__admin, mask)}, 'unexpected rights ' + repr(found)
+        )
+        self.__store.close_session(token)
+
+    def __check_touch(self) -> None:
+        """ Touching a session sets its update time.
+        """
+        timestamp: datetime = datetime.now().replace(microsecond=123456)
+        self.__store.touch_session(self.__tokens['first'], timestamp)
+        row = self.__find_row(self.__tokens['first'])
+        SessionStoreChecks.__expect(
+            row is not None and row[4] == timestamp, 'unexpected row ' + repr(row)
+        )
+
+    def __check_close(self) -> None:
+        """ Closing a session deactivates it; closing it again fails.
+        """
+        before: datetime = datetime.now()
+        self.__store.close_session(self.__tokens['first'])
+        SessionStoreChecks.__expect(
+            not self.__store.find_sessions_owners([self.__tokens['first']]),
+            'the closed session is still active'
+        )
+        row = self.__find_row(self.__tokens['first'])
+        SessionStoreChecks.__expect(
+            row is not None and not row[2] and row[4] >= before, 'unexpected row ' + repr(row)
+        )
+        for token in (self.__tokens['first'], 'unknown-token'):
+            try:
+                self.__store.close_session(token)
+            except SessionNotFoundError:
+                continue
+            raise AssertionError('closing ' + token + ' did not fail')
+
+    def __check_reopen(self) -> None:
+        """ Opening a session after closing the active one creates a new one.
+        """
+        token, created = self.__store.open_session(self.__usernames[0])
+        SessionStoreChecks.__expect(
+            created and token != self.__tokens['first'], 'the closed session was reused'
+        )
+        self.__tokens['second'] = token
+
+    def __check_iter_sessions(self) -> None:
+        """ Sessions are listed by key in ascending order, never by token, and filtered.
+        """
+        for username in self.__usernames[1:3]:
+            self.__store.open_session(username)
+        keys: List[str] = [row[0] for row in self.__store.iter_sessions()]
+        SessionStoreChecks.__expect(
+            keys == sorted(set(keys)) and len(keys) >= 4, 'unexpected listing order'
+        )
+        SessionStoreChecks.__expect(
+            not set(keys) & set(self.__tokens.values()), 'tokens listed'
+        )
+        page: List[str] = [
+            row[0] for row in self.__store.iter_sessions(after=keys[0], limit=2)
+        ]
+        SessionStoreChecks.__expect(page == keys[1:3], 'unexpected page ' + repr(page))
+        SessionStoreChecks.__expect(
+            all(row[2] for row in self.__store.iter_sessions(active_only=True)),
+            'inactive sessions listed as active'
+        )
+        listed: Set[str] = {
+            row[0] for row in self.__store.iter_sessions(username=self.__usernames[0])
+        }
+        SessionStoreChecks.__expect(
+            listed == {
+                UserSession.key_of(self.__tokens['first']),
+                UserSession.key_of(self.__tokens['second'])
+            },
+            'unexpected sessions of the user ' + repr(listed)
+        )
+        listed = {
+            row[0] for row in self.__store.iter_sessions(
+                username=self.__usernames[0], active_only=True
+            )
+        }
+        SessionStoreChecks.__expect(
+            listed == {UserSession.key_of(self.__tokens['second'])},
+            'unexpected active sessions of the user ' + repr(listed)
+        )
+
+    def __check_concurrent_open(self) -> None:
+        """ Simultaneous opens of a user without a session create a single one.
+        """
+        username: str = self.__usernames[3]
+        barrier: threading.Barrier = threading.Barrier(SessionStoreChecks.CONCURRENT_OPENS)
+        results: List[Optional[Tuple[str, bool]]] = [None] * SessionStoreChecks.CONCURRENT_OPENS
+
+        def opener(index: int) -> None:
+            barrier.wait()
+            try:
+                results[index] = self.__store.open_session(username)
+            finally:
+                self.__schema.remove_session()
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=opener, args=(index,))
+            for index in range(SessionStoreChecks.CONCURRENT_OPENS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        SessionStoreChecks.__expect(None not in results, 'some opens failed')
+        tokens: Set[str] = {result[0] for result in results if result is not None}
+        created: int = sum(1 for result in results if result is not None and result[1])
+        SessionStoreChecks.__expect(
+            len(tokens) == 1 and created == 1,
+            str(len(tokens)) + ' tokens, ' + str(created) + ' created'
+        )
+
+    def __check_expire_idle(self) -> None:
+        """ Active sessions not updated lately are deactivated, and the rest kept.
+        """
+        token, _ = self.__store.open_session(self.__usernames[4])
+        self.__store.touch_session(token, datetime.now() - timedelta(days=2))
+        _, expired = self.__store.expire_idle_sessions(datetime.now() - timedelta(days=1), 2)
+        SessionStoreChecks.__expect(expired >= 1, 'no session expired')
+        SessionStoreChecks.__expect(
+            not self.__store.find_sessions_owners([token]), 'the idle session is still active'
+        )
+        SessionStoreChecks.__expect(
+            self.__store.find_sessions_owners([self.__tokens['second']]) == {
+                self.__tokens['second']: self.__usernames[0]
+            },
+            'a recent session expired'
+        )
+        self.__tokens['expired'] = token
+
+    def __check_purge_inactive(self) -> None:
+        """ Inactive sessions not updated lately are deleted, and the rest kept.
+        """
+        self.__store.touch_session(self.__tokens['first'], datetime.now() - timedelta(days=2))
+        _, deleted = self.__store.purge_inactive_sessions(datetime.now() - timedelta(days=1), 2)
+        SessionStoreChecks.__expect(deleted >= 1, 'no session deleted')
+        SessionStoreChecks.__expect(
+            self.__find_row(self.__tokens['first']) is None, 'the old session was kept'
+        )
+        for name in ('second', 'expired'):
+            SessionStoreChecks.__expect(
+                self.__find_row(self.__tokens[name]) is not None,
+                'the ' + name + ' session was deleted'
+            )
+
+    def __find_row(self, token: str) -> Optional[Tuple]:
+        """ Finds a session of the checked users through the listing.
+        ---
+        Parameters:
+            - token: The session token.
+        Returns:
+            The (key, user name, active, created, updated) tuple, or None if not found.
+        """
+        session_key: str = UserSession.key_of(token)
+        for username in self.__usernames:
+            for row in self.__store.iter_sessions(username=username):
+                if row[0] == session_key:
+                    return row
+        return None
+
+    @staticmethod
+    def __expect(condition: bool, message: str) -> None:
+        """ Fails a check unless a condition holds.
+        ---
+        Parameters:
+            - condition: The condition.
+            - message: The description of the failure.
+        Throws:
+            - AssertionError: If the condition does not hold.
+        """
+        if not condition:
+            raise AssertionError(message)
@@ -0,0 +1,108 @@
+""" StartupBench class module.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+from bench.benchapp import BIN_DIR, BenchApp
+from bench.loadrunner import LoadRunner
+from bench.serverbench import ServerBench
+
+
+class StartupBench():
+    """ Class responsible of measuring how long the service and its tools take to
+    start against an already deployed database.
+
+    Measured are loading the service (importing it and building its objects,
+    from a new interpreter, without serving), starting it until it answers
+    `GET /`, and running a command line tool with nothing to do. The first run
+    of each one is a discarded warm-up.
+    """
+
+    __LOAD_SCRIPT = 'import runpy, sys; runpy.run_path(sys.argv[1], run_name="dms2021auth_bench")'
+
+    def __init__(self, work_dir: str, template: str, repeats: int):
+        """ Constructor method.
+        ---
+        Parameters:
+            - work_dir: The directory where the configurations and databases are written.
+            - template: The path of the seeded database.
+            - repeats: The measured runs of each measurement.
+        """
+        self.__work_dir: str = work_dir
+        self.__template: str = template
+        self.__repeats: int = repeats
+
+    def run(self) -> Dict[str, Dict]:
+        """ Takes the measurements.
+        ---
+        Returns:
+            A dictionary with the summary (see `LoadRunner.summarize`) of the `load`,
+            `first_response` and `cli` measurements. Their throughput is the number
+            of starts per second.
+        """
+        startup_dir: str = os.path.join(self.__work_dir, 'startup')
+        os.makedirs(startup_dir, exist_ok=True)
+        database: str = os.path.join(startup_dir, 'dmsauth.db')
+        BenchApp.copy_database(self.__template, database)
+        env: Dict[str, str] = dict(os.environ)
+        env['XDG_CONFIG_HOME'] = BenchApp.write_config(startup_dir, database)
+        env['XDG_CACHE_HOME'] = os.path.join(startup_dir, 'cache')
+        server_bench: ServerBench = ServerBench(self.__work_dir, self.__template, 0, 0)
+
+        def load() -> Optional[float]:
+            begin: float = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, '-c', StartupBench.__LOAD_SCRIPT,
+                 os.path.join(BIN_DIR, 'dms2021auth')],
+                env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+            )
+            return time.perf_counter() - begin if completed.returncode == 0 else None
+
+        def first_response() -> Optional[float]:
+            begin: float = time.perf_counter()
+            try:
+                process, _ = server_bench.start('flask', 'startup-server')
+            except RuntimeError:
+                return None
+            elapsed: float = time.perf_counter() - begin
+            ServerBench.stop(process)
+            return elapsed
+
+        def cli() -> Optional[float]:
+            begin: float = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, os.path.join(BIN_DIR, 'dms2021auth-import-users'), '-'],
+                env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL, check=False
+            )
+            return time.perf_counter() - begin if completed.returncode == 0 else None
+
+        return {
+            'load': self.__measure(load),
+            'first_response': self.__measure(first_response),
+            'cli': self.__measure(cli)
+        }
+
+    def __measure(self, start: Callable[[], Optional[float]]) -> Dict:
+        """ Times several starts.
+        ---
+        Parameters:
+            - start: The function starting (and, once started, stopping) the program;
+                     returns the time it took to start, or None if it failed.
+        Returns:
+            The summary of the starts.
+        """
+        latencies: List[float] = []
+        errors: int = 0
+        for run in range(self.__repeats + 1):
+            elapsed: Optional[float] = start()
+            if run == 0:
+                continue
+            if elapsed is None:
+                errors += 1
+            else:
+                latencies.append(elapsed)
+        return LoadRunner.summarize(latencies, errors, sum(latencies))
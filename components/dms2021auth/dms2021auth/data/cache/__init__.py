@@ -0,0 +1,5 @@
+""" Authentication in-memory caches.
+"""
+
+from .ttllrucache import TtlLruCache
+from .revocationlist import RevocationList
@@ -0,0 +1,65 @@
+""" RevocationList class module.
+"""
+
+import threading
+from typing import Dict, Iterable, Tuple
+
+
+class RevocationList():
+    """ In-memory set of revoked session ids, each one kept until it expires.
+    """
+
+    def __init__(self):
+        """ Constructor method.
+
+        Initializes an empty list.
+        """
+        self.__entries: Dict[str, float] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def add(self, session_id: str, expires: float) -> None:
+        """ Adds a revoked session.
+        ---
+        Parameters:
+            - session_id: The session id string.
+            - expires: The UNIX timestamp after which the revocation is no longer needed.
+        """
+        with self.__lock:
+            self.__entries[session_id] = max(expires, self.__entries.get(session_id, expires))
+
+    def merge(self, entries: Iterable[Tuple[str, float]], now: float) -> None:
+        """ Adds many revoked sessions, dropping the expired ones.
+        ---
+        Parameters:
+            - entries: An iterable of (session id, expiration UNIX timestamp) tuples.
+            - now: The current UNIX timestamp.
+        """
+        with self.__lock:
+            for session_id, expires in entries:
+                self.__entries[session_id] = max(
+                    expires, self.__entries.get(session_id, expires)
+                )
+            self.__entries = {
+                session_id: expires for session_id, expires in self.__entries.items()
+                if expires > now
+            }
+
+    def contains(self, session_id: str) -> bool:
+        """ Determines whether a session is revoked.
+        ---
+        Parameters:
+            - session_id: The session id string.
+        Returns:
+            True if the session is in the list; false otherwise.
+        """
+        with self.__lock:
+            return session_id in self.__entries
+
+    def __len__(self) -> int:
+        """ Gets the number of revoked sessions.
+        ---
+        Returns:
+            The number of sessions in the list.
+        """
+        with self.__lock:
+            return len(self.__entries)
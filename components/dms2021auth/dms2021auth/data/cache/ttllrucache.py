@@ -0,0 +1,115 @@
+""" TtlLruCache class module.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TtlLruCache():
+    """ Thread-safe bounded cache evicting the least recently used entries,
+    whose entries also expire after a fixed time to live.
+    """
+
+    def __init__(self, capacity: int, ttl: float):
+        """ Constructor method.
+
+        Initializes an empty cache.
+        ---
+        Parameters:
+            - capacity: The maximum number of entries held. Must be positive.
+            - ttl: The seconds an entry is valid for after being stored.
+        """
+        if capacity <= 0:
+            raise ValueError('The cache capacity must be positive.')
+        self.__capacity: int = capacity
+        self.__ttl: float = ttl
+        self.__entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__generation: int = 0
+        self.__counters: Dict[str, int] = {
+            'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0
+        }
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """ Gets a cached value.
+        ---
+        Parameters:
+            - key: The entry key.
+        Returns:
+            The cached value, or None if it is not cached or has expired.
+        """
+        with self.__lock:
+            entry: Optional[Tuple[float, Any]] = self.__entries.get(key)
+            if entry is None:
+                self.__counters['misses'] += 1
+                return None
+            if entry[0] <= time.monotonic():
+                del self.__entries[key]
+                self.__counters['expirations'] += 1
+                self.__counters['misses'] += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__counters['hits'] += 1
+            return entry[1]
+
+    def get_generation(self) -> int:
+        """ Gets the current invalidation generation.
+
+        Read it before loading a value from its source and pass it to `put`, so a
+        value loaded while a concurrent invalidation happened is never stored.
+        ---
+        Returns:
+            An integer increased on every invalidation.
+        """
+        return self.__generation
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """ Stores a value, evicting the least recently used entry if the cache is full.
+        ---
+        Parameters:
+            - key: The entry key.
+            - value: The value to store.
+            - generation: If given, the value is only stored if no invalidation
+                          happened since this generation was read.
+        """
+        with self.__lock:
+            if generation is not None and generation != self.__generation:
+                return
+            self.__entries[key] = (time.monotonic() + self.__ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__capacity:
+                self.__entries.popitem(last=False)
+                self.__counters['evictions'] += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """ Removes an entry, if cached.
+        ---
+        Parameters:
+            - key: The entry key.
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.__counters['invalidations'] += 1
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """ Removes every entry.
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.__entries.clear()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """ Gets the cache usage counters.
+        ---
+        Returns:
+            A dictionary with the hits, misses, evictions, expirations and
+            invalidations counts, and the current number of entries.
+        """
+        with self.__lock:
+            statistics: Dict[str, int] = dict(self.__counters)
+            statistics['size'] = len(self.__entries)
+            statistics['capacity'] = self.__capacity
+            return statistics
@@ -1,13 +1,23 @@
 """ AuthConfiguration class module.
 """
 
+import os
+from typing import Optional, Tuple
 from dms2021core.data.config import Configuration
 
 
-class AuthConfiguration(Configuration):
+class AuthConfiguration(Configuration):  # pylint: disable=too-many-public-methods
     """ Class responsible of storing a specific authentication service configuration.
     """
 
+    SQLITE_KEYWORD_PRAGMAS = {
+        'journal_mode': ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'),
+        'synchronous': ('OFF', 'NORMAL', 'FULL', 'EXTRA'),
+        'temp_store': ('DEFAULT', 'FILE', 'MEMORY')
+    }
+    SQLITE_INTEGER_PRAGMAS = ('busy_timeout', 'cache_size', 'mmap_size')
+    METRICS_DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
     def _component_name(self) -> str:
         """ The component name, to categorize the default config path.
         ---
@@ -22,6 +32,28 @@ class AuthConfiguration(Configuration):
         """
 
         Configuration.__init__(self)
+        self.__file_path: Optional[str] = None
+
+    def load_from_file(self, path: str = 'config.yml') -> None:
+        """ Loads the configuration values from a given file.
+
+        This operation will override any previously existing configuration parameters.
+        ---
+        Parameters:
+            - path: A string with the path of the configuration file to load.
+        """
+
+        Configuration.load_from_file(self, path)
+        self.__file_path = path
+
+    def get_file_path(self) -> Optional[str]:
+        """ Gets the path of the file the configuration was loaded from.
+        ---
+        Returns:
+            A string with the file path, or None if it was not loaded from a file.
+        """
+
+        return self.__file_path
 
     def _validate_values(self, values: dict) -> None:
         """ Validates a set of configuration values.
@@ -35,6 +67,174 @@ class AuthConfiguration(Configuration):
             - A `ValueError` exception if validation is not passed.
         """
 
+        AuthConfiguration.__validate_password_hashing(values.get('password_hashing'))
+        AuthConfiguration.__validate_sqlite(values.get('sqlite'))
+        AuthConfiguration.__validate_signed_tokens(values.get('signed_tokens'))
+        AuthConfiguration.__validate_server(values.get('server'))
+        AuthConfiguration.__validate_metrics(values.get('metrics'))
+        AuthConfiguration.__validate_profiler(values.get('profiler'))
+        AuthConfiguration.__validate_session_store(
+            values.get('session_store'), values.get('server')
+        )
+
+    @staticmethod
+    def __validate_password_hashing(hashing_values) -> None:
+        """ Validates the password_hashing configuration section.
+        ---
+        Parameters:
+            - hashing_values: The section value, if any.
+        Throws:
+            - A `ValueError` exception if validation is not passed.
+        """
+
+        if hashing_values is None:
+            return
+        if not isinstance(hashing_values, dict):
+            raise ValueError('The `password_hashing` configuration parameter must be a dictionary.')
+        if hashing_values.get('algorithm') not in (None, 'pbkdf2_sha256', 'scrypt'):
+            raise ValueError('`password_hashing.algorithm` must be pbkdf2_sha256 or scrypt.')
+        if hashing_values.get('executor') not in (None, 'thread', 'process'):
+            raise ValueError('`password_hashing.executor` must be thread or process.')
+
+    @staticmethod
+    def __validate_signed_tokens(signed_tokens_values) -> None:
+        """ Validates the signed_tokens configuration section.
+        ---
+        Parameters:
+            - signed_tokens_values: The section value, if any.
+        Throws:
+            - A `ValueError` exception if validation is not passed.
+        """
+
+        if signed_tokens_values is None:
+            return
+        if not isinstance(signed_tokens_values, dict):
+            raise ValueError('The `signed_tokens` configuration parameter must be a dictionary.')
+        key = signed_tokens_values.get('key')
+        if key is not None and (not isinstance(key, str) or len(key) < 32):
+            raise ValueError('`signed_tokens.key` must be a string of at least 32 characters.')
+
+    @staticmethod
+    def __validate_server(server_values) -> None:
+        """ Validates the server configuration section.
+        ---
+        Parameters:
+            - server_values: The section value, if any.
+        Throws:
+            - A `ValueError` exception if validation is not passed.
+        """
+
+        if server_values is None:
+            return
+        if not isinstance(server_values, dict):
+            raise ValueError('The `server` configuration parameter must be a dictionary.')
+        if server_values.get('mode') not in (None, 'development', 'prefork'):
+            raise ValueError('`server.mode` must be development or prefork.')
+
+    @staticmethod
+    def __validate_metrics(metrics_values) -> None:
+        """ Validates the metrics configuration section.
+        ---
+        Parameters:
+            - metrics_values: The section value, if any.
+        Throws:
+            - A `ValueError` exception if validation is not passed.
+        """
+
+        if metrics_values is None:
+            return
+        if not isinstance(metrics_values, dict):
+            raise ValueError('The `metrics` configuration parameter must be a dictionary.')
+        buckets = metrics_values.get('buckets')
+        if buckets is not None and (
+            not isinstance(buckets, list) or not buckets or not all(
+                isinstance(bound, (int, float)) and not isinstance(bound, bool) and bound > 0
+                for bound in buckets
+            )
+        ):
+            raise ValueError('`metrics.buckets` must be a non-empty list of positive numbers.')
+
+    @staticmethod
+    def __validate_profiler(profiler_values) -> None:
+        """ Validates the profiler configuration section.
+        ---
+        Parameters:
+            - profiler_values: The section value, if any.
+        Throws:
+            - A `ValueError` exception if validation is not passed.
+        """
+
+        if profiler_values is None:
+            return
+        if not isinstance(profiler_values, dict):
+            raise ValueError('The `profiler` configuration parameter must be a dictionary.')
+        enabled = profiler_values.get('enabled')
+        if enabled is not None and not isinstance(enabled, bool):
+            raise ValueError('`profiler.enabled` must be a boolean.')
+        for key in ('slow_threshold', 'reload_interval'):
+            value = profiler_values.get(key)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0
+            ):
+                raise ValueError('`profiler.' + key + '` must be a non-negative number.')
+        for key in ('top', 'max_statements'):
+            value = profiler_values.get(key)
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < 1
+            ):
+                raise ValueError('`profiler.' + key + '` must be a positive integer.')
+
+    @staticmethod
+    def __validate_session_store(session_store_values, server_values) -> None:
+        """ Validates the session_store configuration section.
+        ---
+        Parameters:
+            - session_store_values: The section value, if any.
+            - server_values: The server section value, if any.
+        Throws:
+            - A `ValueError` exception if validation is not passed.
+        """
+
+        if session_store_values is None:
+            return
+        if not isinstance(session_store_values, dict):
+            raise ValueError('The `session_store` configuration parameter must be a dictionary.')
+        backend = session_store_values.get('backend')
+        if backend not in (None, 'sql', 'memory', 'dbm'):
+            raise ValueError('`session_store.backend` must be sql, memory or dbm.')
+        if backend == 'dbm' and not session_store_values.get('path'):
+            raise ValueError('`session_store.path` is required by the dbm backend.')
+        # Worker processes would not share their sessions
+        if backend in ('memory', 'dbm') and isinstance(server_values, dict) \
+                and server_values.get('mode') == 'prefork':
+            raise ValueError('The ' + backend + ' session store cannot be used in prefork mode.')
+
+    @staticmethod
+    def __validate_sqlite(sqlite_values) -> None:
+        """ Validates the sqlite configuration section.
+        ---
+        Parameters:
+            - sqlite_values: The section value, if any.
+        Throws:
+            - A `ValueError` exception if validation is not passed.
+        """
+
+        if sqlite_values is None:
+            return
+        if not isinstance(sqlite_values, dict):
+            raise ValueError('The `sqlite` configuration parameter must be a dictionary.')
+        for key, allowed in AuthConfiguration.SQLITE_KEYWORD_PRAGMAS.items():
+            value = sqlite_values.get(key)
+            if value is not None and str(value).upper() not in allowed:
+                raise ValueError(
+                    'Invalid value for `sqlite.' + key + '`: ' + str(value)
+                    + '. Expected one of ' + ', '.join(allowed) + '.'
+                )
+        for key in AuthConfiguration.SQLITE_INTEGER_PRAGMAS:
+            value = sqlite_values.get(key)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int)):
+                raise ValueError('`sqlite.' + key + '` must be an integer.')
+
     def get_db_connection_string(self) -> str:
         """ Gets the db_connection_string configuration value.
         ---
@@ -44,6 +244,17 @@ class AuthConfiguration(Configuration):
 
         return str(self.get_value('db_connection_string'))
 
+    def get_db_read_connection_string(self) -> Optional[str]:
+        """ Gets the db_read_connection_string configuration value.
+        ---
+        Returns:
+            A string with the value of db_read_connection_string, or None if the hot
+            reads use the same database as the rest.
+        """
+
+        value = self.get_value('db_read_connection_string')
+        return None if value is None else str(value)
+
     def get_service_host(self) -> str:
         """ Gets the host configuration value.
         ---
@@ -80,3 +291,603 @@ class AuthConfiguration(Configuration):
         """
 
         return str(self.get_value('salt') or '')
+
+    def get_compact_storage_flag(self) -> bool:
+        """ Gets whether the database uses the compact storage layout or not.
+        ---
+        Returns:
+            A boolean with the value of compact_storage (false by default).
+        """
+
+        return bool(self.get_value('compact_storage'))
+
+    def get_storage_layout_check_interval(self) -> float:
+        """ Gets the period between the checks of the storage layout of the database tables
+        while the service runs.
+        ---
+        Returns:
+            A float with the value of storage_layout_check_interval, in seconds (1 by default).
+            0 disables the checks.
+        """
+
+        value = self.get_value('storage_layout_check_interval')
+        return 1.0 if value is None else max(float(str(value)), 0.0)
+
+    def get_db_pool_size(self) -> int:
+        """ Gets the number of connections kept open in the database pool.
+        ---
+        Returns:
+            An integer with the value of db_pool.size (5 by default).
+        """
+
+        value = self.get_section_value('db_pool', 'size')
+        return 5 if value is None else int(str(value))
+
+    def get_db_pool_max_overflow(self) -> int:
+        """ Gets the number of connections that can be opened beyond the pool size.
+        ---
+        Returns:
+            An integer with the value of db_pool.max_overflow (10 by default).
+        """
+
+        value = self.get_section_value('db_pool', 'max_overflow')
+        return 10 if value is None else int(str(value))
+
+    def get_db_pool_recycle(self) -> int:
+        """ Gets the age after which pooled connections are replaced.
+        ---
+        Returns:
+            An integer with the value of db_pool.recycle, in seconds
+            (-1 by default, meaning connections are never recycled).
+        """
+
+        value = self.get_section_value('db_pool', 'recycle')
+        return -1 if value is None else int(str(value))
+
+    def get_db_pool_timeout(self) -> float:
+        """ Gets the maximum time to wait for a pooled connection.
+        ---
+        Returns:
+            A float with the value of db_pool.timeout, in seconds (30 by default).
+        """
+
+        value = self.get_section_value('db_pool', 'timeout')
+        return 30.0 if value is None else float(str(value))
+
+    def get_sqlite_journal_mode(self) -> Optional[str]:
+        """ Gets the SQLite journal mode.
+        ---
+        Returns:
+            A string with the value of sqlite.journal_mode (e.g., 'WAL'),
+            or None to keep the SQLite default.
+        """
+
+        value = self.get_section_value('sqlite', 'journal_mode')
+        return None if value is None else str(value).upper()
+
+    def get_sqlite_synchronous(self) -> Optional[str]:
+        """ Gets the SQLite synchronization level.
+        ---
+        Returns:
+            A string with the value of sqlite.synchronous (e.g., 'NORMAL'),
+            or None to keep the SQLite default.
+        """
+
+        value = self.get_section_value('sqlite', 'synchronous')
+        return None if value is None else str(value).upper()
+
+    def get_sqlite_temp_store(self) -> Optional[str]:
+        """ Gets where SQLite keeps its temporary tables and indices.
+        ---
+        Returns:
+            A string with the value of sqlite.temp_store (e.g., 'MEMORY'),
+            or None to keep the SQLite default.
+        """
+
+        value = self.get_section_value('sqlite', 'temp_store')
+        return None if value is None else str(value).upper()
+
+    def get_sqlite_busy_timeout(self) -> Optional[int]:
+        """ Gets how long SQLite waits for a lock before failing.
+        ---
+        Returns:
+            An integer with the value of sqlite.busy_timeout, in milliseconds,
+            or None to keep the SQLite default.
+        """
+
+        value = self.get_section_value('sqlite', 'busy_timeout')
+        return None if value is None else int(str(value))
+
+    def get_sqlite_cache_size(self) -> Optional[int]:
+        """ Gets the SQLite page cache size per connection.
+        ---
+        Returns:
+            An integer with the value of sqlite.cache_size (pages if positive,
+            KiB if negative), or None to keep the SQLite default.
+        """
+
+        value = self.get_section_value('sqlite', 'cache_size')
+        return None if value is None else int(str(value))
+
+    def get_sqlite_mmap_size(self) -> Optional[int]:
+        """ Gets the maximum number of bytes of the database SQLite maps into memory.
+        ---
+        Returns:
+            An integer with the value of sqlite.mmap_size, or None to keep the SQLite default.
+        """
+
+        value = self.get_section_value('sqlite', 'mmap_size')
+        return None if value is None else int(str(value))
+
+    def get_session_cache_capacity(self) -> int:
+        """ Gets the maximum number of session tokens kept in memory.
+        ---
+        Returns:
+            An integer with the value of session_cache.capacity (10000 by default).
+            Zero disables the cache.
+        """
+
+        value = self.get_section_value('session_cache', 'capacity')
+        return 10000 if value is None else int(str(value))
+
+    def get_session_cache_ttl(self) -> float:
+        """ Gets how long a cached session token is trusted without checking the database.
+        ---
+        Returns:
+            A float with the value of session_cache.ttl, in seconds (60 by default).
+        """
+
+        value = self.get_section_value('session_cache', 'ttl')
+        return 60.0 if value is None else float(str(value))
+
+    def get_rights_cache_capacity(self) -> int:
+        """ Gets the maximum number of per-user rights masks kept in memory.
+        ---
+        Returns:
+            An integer with the value of rights_cache.capacity (10000 by default).
+            Zero disables the cache.
+        """
+
+        value = self.get_section_value('rights_cache', 'capacity')
+        return 10000 if value is None else int(str(value))
+
+    def get_rights_cache_ttl(self) -> float:
+        """ Gets how long a cached rights mask is trusted without checking the database.
+        ---
+        Returns:
+            A float with the value of rights_cache.ttl, in seconds (60 by default).
+        """
+
+        value = self.get_section_value('rights_cache', 'ttl')
+        return 60.0 if value is None else float(str(value))
+
+    def get_read_replica_read_after_write(self) -> float:
+        """ Gets how long the keys written by this process keep being read from the
+        primary database instead of the read replica.
+        ---
+        Returns:
+            A float with the value of read_replica.read_after_write, in seconds
+            (5 by default). Zero reads them from the replica right away.
+        """
+
+        value = self.get_section_value('read_replica', 'read_after_write')
+        return 5.0 if value is None else float(str(value))
+
+    def get_read_replica_capacity(self) -> int:
+        """ Gets the maximum number of written keys remembered at once to be read from
+        the primary database.
+        ---
+        Returns:
+            An integer with the value of read_replica.capacity (10000 by default).
+        """
+
+        value = self.get_section_value('read_replica', 'capacity')
+        return 10000 if value is None else int(str(value))
+
+    def get_read_replica_fallback_flag(self) -> bool:
+        """ Gets whether the sessions and users not found in the read replica are looked
+        up again in the primary database or not.
+        ---
+        Returns:
+            A boolean with the value of read_replica.fallback_on_miss (true by default).
+        """
+
+        value = self.get_section_value('read_replica', 'fallback_on_miss')
+        return True if value is None else bool(value)
+
+    def get_session_store_backend(self) -> str:
+        """ Gets where the user sessions are stored.
+        ---
+        Returns:
+            A string with the value of session_store.backend; either `sql` (the database,
+            by default), `memory` or `dbm`.
+        """
+
+        return str(self.get_section_value('session_store', 'backend') or 'sql')
+
+    def get_session_store_path(self) -> Optional[str]:
+        """ Gets the path of the file storing the user sessions with the dbm backend.
+        ---
+        Returns:
+            A string with the value of session_store.path, or None if not set.
+        """
+
+        value = self.get_section_value('session_store', 'path')
+        return None if value is None else str(value)
+
+    def get_password_hashing_algorithm(self) -> str:
+        """ Gets the key derivation function used to hash new passwords.
+        ---
+        Returns:
+            A string with the value of password_hashing.algorithm
+            ('pbkdf2_sha256' by default, or 'scrypt').
+        """
+
+        value = self.get_section_value('password_hashing', 'algorithm')
+        return 'pbkdf2_sha256' if value is None else str(value)
+
+    def get_password_hashing_iterations(self) -> int:
+        """ Gets the number of PBKDF2 iterations of new password hashes.
+        ---
+        Returns:
+            An integer with the value of password_hashing.iterations (260000 by default).
+        """
+
+        value = self.get_section_value('password_hashing', 'iterations')
+        return 260000 if value is None else int(str(value))
+
+    def get_password_hashing_scrypt_cost(self) -> int:
+        """ Gets the scrypt CPU/memory cost (n) of new password hashes.
+        ---
+        Returns:
+            An integer with the value of password_hashing.scrypt_n (16384 by default).
+        """
+
+        value = self.get_section_value('password_hashing', 'scrypt_n')
+        return 16384 if value is None else int(str(value))
+
+    def get_password_hashing_scrypt_block_size(self) -> int:
+        """ Gets the scrypt block size (r) of new password hashes.
+        ---
+        Returns:
+            An integer with the value of password_hashing.scrypt_r (8 by default).
+        """
+
+        value = self.get_section_value('password_hashing', 'scrypt_r')
+        return 8 if value is None else int(str(value))
+
+    def get_password_hashing_scrypt_parallelization(self) -> int:
+        """ Gets the scrypt parallelization factor (p) of new password hashes.
+        ---
+        Returns:
+            An integer with the value of password_hashing.scrypt_p (1 by default).
+        """
+
+        value = self.get_section_value('password_hashing', 'scrypt_p')
+        return 1 if value is None else int(str(value))
+
+    def get_password_hashing_workers(self) -> int:
+        """ Gets the number of workers hashing passwords concurrently.
+        ---
+        Returns:
+            An integer with the value of password_hashing.workers
+            (the number of CPUs by default).
+        """
+
+        value = self.get_section_value('password_hashing', 'workers')
+        return (os.cpu_count() or 1) if value is None else int(str(value))
+
+    def get_password_hashing_executor(self) -> str:
+        """ Gets the kind of workers hashing passwords.
+        ---
+        Returns:
+            A string with the value of password_hashing.executor ('thread' by default,
+            or 'process').
+        """
+
+        value = self.get_section_value('password_hashing', 'executor')
+        return 'thread' if value is None else str(value)
+
+    def get_password_hashing_max_pending(self) -> int:
+        """ Gets the maximum number of password hashing jobs queued or running at once.
+        Further requests wait until one of them finishes.
+        ---
+        Returns:
+            An integer with the value of password_hashing.max_pending
+            (four times the number of workers by default).
+        """
+
+        value = self.get_section_value('password_hashing', 'max_pending')
+        return 4 * self.get_password_hashing_workers() if value is None else int(str(value))
+
+    def get_session_touch_flush_interval(self) -> float:
+        """ Gets the period between the batched writes of session update times.
+        ---
+        Returns:
+            A float with the value of session_touch.flush_interval, in seconds
+            (5 by default). Zero disables buffering, writing every update right away.
+        """
+
+        value = self.get_section_value('session_touch', 'flush_interval')
+        return 5.0 if value is None else float(str(value))
+
+    def get_session_touch_max_entries(self) -> int:
+        """ Gets the number of buffered session updates that triggers an early write.
+        ---
+        Returns:
+            An integer with the value of session_touch.max_entries (1000 by default).
+        """
+
+        value = self.get_section_value('session_touch', 'max_entries')
+        return 1000 if value is None else int(str(value))
+
+    def get_session_touch_max_staleness(self) -> float:
+        """ Gets the maximum time a session update may remain unwritten.
+        ---
+        Returns:
+            A float with the value of session_touch.max_staleness, in seconds (30 by default).
+        """
+
+        value = self.get_section_value('session_touch', 'max_staleness')
+        return 30.0 if value is None else float(str(value))
+
+    def get_session_reaper_interval(self) -> float:
+        """ Gets the period between the runs of the expired sessions reaper.
+        ---
+        Returns:
+            A float with the value of session_reaper.interval, in seconds
+            (300 by default). Zero disables the reaper.
+        """
+
+        value = self.get_section_value('session_reaper', 'interval')
+        return 300.0 if value is None else float(str(value))
+
+    def get_session_reaper_idle_timeout(self) -> float:
+        """ Gets the time after which an unused active session is closed.
+        ---
+        Returns:
+            A float with the value of session_reaper.idle_timeout, in seconds
+            (86400 by default). Zero keeps idle sessions open.
+        """
+
+        value = self.get_section_value('session_reaper', 'idle_timeout')
+        return 86400.0 if value is None else float(str(value))
+
+    def get_session_reaper_retention(self) -> float:
+        """ Gets the time an inactive session is kept before being deleted.
+        ---
+        Returns:
+            A float with the value of session_reaper.retention, in seconds
+            (604800 by default). Zero keeps inactive sessions forever.
+        """
+
+        value = self.get_section_value('session_reaper', 'retention')
+        return 604800.0 if value is None else float(str(value))
+
+    def get_session_reaper_batch_size(self) -> int:
+        """ Gets the number of sessions expired or deleted per transaction.
+        ---
+        Returns:
+            An integer with the value of session_reaper.batch_size (500 by default).
+        """
+
+        value = self.get_section_value('session_reaper', 'batch_size')
+        return 500 if value is None else max(int(str(value)), 1)
+
+    def get_bulk_chunk_size(self) -> int:
+        """ Gets the number of items written per transaction by the bulk operations.
+        ---
+        Returns:
+            An integer with the value of bulk.chunk_size (500 by default).
+        """
+
+        value = self.get_section_value('bulk', 'chunk_size')
+        return 500 if value is None else max(int(str(value)), 1)
+
+    def get_bulk_max_items(self) -> int:
+        """ Gets the maximum number of items accepted by a single bulk request.
+        ---
+        Returns:
+            An integer with the value of bulk.max_items (10000 by default).
+        """
+
+        value = self.get_section_value('bulk', 'max_items')
+        return 10000 if value is None else int(str(value))
+
+    def get_listing_page_size(self) -> int:
+        """ Gets the default number of items of a listing page.
+        ---
+        Returns:
+            An integer with the value of listing.page_size (100 by default).
+        """
+
+        value = self.get_section_value('listing', 'page_size')
+        return 100 if value is None else max(int(str(value)), 1)
+
+    def get_listing_max_page_size(self) -> int:
+        """ Gets the maximum number of items of a listing page.
+        ---
+        Returns:
+            An integer with the value of listing.max_page_size (1000 by default).
+        """
+
+        value = self.get_section_value('listing', 'max_page_size')
+        return 1000 if value is None else max(int(str(value)), 1)
+
+    def get_signed_tokens_key(self) -> Optional[bytes]:
+        """ Gets the key used to sign the session tokens.
+        ---
+        Returns:
+            The bytes of signed_tokens.key, or None if session tokens are not signed (default).
+        """
+
+        value = self.get_section_value('signed_tokens', 'key')
+        return None if value is None else str(value).encode('utf-8')
+
+    def get_signed_tokens_lifetime(self) -> int:
+        """ Gets the time a signed session token is valid for.
+        ---
+        Returns:
+            An integer with the value of signed_tokens.lifetime, in seconds (900 by default).
+        """
+
+        value = self.get_section_value('signed_tokens', 'lifetime')
+        return 900 if value is None else max(int(str(value)), 1)
+
+    def get_signed_tokens_revocation_refresh(self) -> float:
+        """ Gets the period between the reloads of the revoked sessions from the database.
+        ---
+        Returns:
+            A float with the value of signed_tokens.revocation_refresh, in seconds (5 by default).
+        """
+
+        value = self.get_section_value('signed_tokens', 'revocation_refresh')
+        return 5.0 if value is None else float(str(value))
+
+    def get_server_mode(self) -> str:
+        """ Gets how the service is served.
+        ---
+        Returns:
+            A string with the value of server.mode; either `development` (default) or `prefork`.
+        """
+
+        value = self.get_section_value('server', 'mode')
+        return 'development' if value is None else str(value)
+
+    def get_server_workers(self) -> int:
+        """ Gets the number of worker processes of the prefork server.
+        ---
+        Returns:
+            An integer with the value of server.workers (the number of CPUs by default).
+        """
+
+        value = self.get_section_value('server', 'workers')
+        return (os.cpu_count() or 1) if value is None else max(int(str(value)), 1)
+
+    def get_server_threads(self) -> int:
+        """ Gets the number of request threads of each prefork server worker.
+        ---
+        Returns:
+            An integer with the value of server.threads (8 by default).
+        """
+
+        value = self.get_section_value('server', 'threads')
+        return 8 if value is None else max(int(str(value)), 1)
+
+    def get_server_keep_alive(self) -> float:
+        """ Gets the time an idle client connection is kept open by the prefork server.
+        ---
+        Returns:
+            A float with the value of server.keep_alive, in seconds (5 by default).
+            0 closes every connection after its first request.
+        """
+
+        value = self.get_section_value('server', 'keep_alive')
+        return 5.0 if value is None else max(float(str(value)), 0.0)
+
+    def get_server_graceful_timeout(self) -> float:
+        """ Gets the time the prefork server workers have to finish their ongoing requests
+        when stopping.
+        ---
+        Returns:
+            A float with the value of server.graceful_timeout, in seconds (30 by default).
+        """
+
+        value = self.get_section_value('server', 'graceful_timeout')
+        return 30.0 if value is None else max(float(str(value)), 0.0)
+
+    def get_server_db_workers(self) -> int:
+        """ Gets the number of threads running the database work of the asyncio server.
+        ---
+        Returns:
+            An integer with the value of server.db_workers (by default, the maximum
+            number of connections of the database pool).
+        """
+
+        value = self.get_section_value('server', 'db_workers')
+        if value is None:
+            return max(self.get_db_pool_size() + self.get_db_pool_max_overflow(), 1)
+        return max(int(str(value)), 1)
+
+    def get_server_max_body_size(self) -> int:
+        """ Gets the maximum size of a request body accepted by the asyncio server.
+        ---
+        Returns:
+            An integer with the value of server.max_body_size, in bytes (16 MiB by default).
+        """
+
+        value = self.get_section_value('server', 'max_body_size')
+        return 16777216 if value is None else max(int(str(value)), 0)
+
+    def get_metrics_enabled(self) -> bool:
+        """ Gets whether the service metrics are recorded and exposed.
+        ---
+        Returns:
+            A boolean with the value of metrics.enabled (true by default).
+        """
+
+        value = self.get_section_value('metrics', 'enabled')
+        return True if value is None else bool(value)
+
+    def get_metrics_buckets(self) -> Tuple[float, ...]:
+        """ Gets the upper bounds of the latency histogram buckets.
+        ---
+        Returns:
+            A tuple with the values of metrics.buckets, in seconds and ascending order
+            (from 5 ms to 10 s by default).
+        """
+
+        value = self.get_section_value('metrics', 'buckets')
+        if not isinstance(value, list):
+            return AuthConfiguration.METRICS_DEFAULT_BUCKETS
+        return tuple(sorted(float(str(bound)) for bound in value))
+
+    def get_profiler_enabled(self) -> bool:
+        """ Gets whether the database statements are profiled.
+        ---
+        Returns:
+            A boolean with the value of profiler.enabled (false by default).
+        """
+
+        return bool(self.get_section_value('profiler', 'enabled'))
+
+    def get_profiler_slow_threshold(self) -> float:
+        """ Gets the duration above which a profiled statement is logged.
+        ---
+        Returns:
+            A float with the value of profiler.slow_threshold, in seconds (0.1 by default).
+        """
+
+        value = self.get_section_value('profiler', 'slow_threshold')
+        return 0.1 if value is None else max(float(str(value)), 0.0)
+
+    def get_profiler_top(self) -> int:
+        """ Gets the number of statements in the profiler reports.
+        ---
+        Returns:
+            An integer with the value of profiler.top (20 by default).
+        """
+
+        value = self.get_section_value('profiler', 'top')
+        return 20 if value is None else max(int(str(value)), 1)
+
+    def get_profiler_max_statements(self) -> int:
+        """ Gets the maximum number of distinct statements the profiler aggregates.
+        ---
+        Returns:
+            An integer with the value of profiler.max_statements (1000 by default).
+        """
+
+        value = self.get_section_value('profiler', 'max_statements')
+        return 1000 if value is None else max(int(str(value)), 1)
+
+    def get_profiler_reload_interval(self) -> float:
+        """ Gets the period between the checks for changes of the profiler configuration.
+        ---
+        Returns:
+            A float with the value of profiler.reload_interval, in seconds (5 by default).
+            0 disables the checks.
+        """
+
+        value = self.get_section_value('profiler', 'reload_interval')
+        return 5.0 if value is None else max(float(str(value)), 0.0)
@@ -1,4 +1,14 @@
 """ Authentication database-related modules.
 """
 
+from typing import TYPE_CHECKING
+from dms2021auth.lazyimports import LazyImports
 from .schema import Schema
+
+if TYPE_CHECKING:
+    from .asyncschema import AsyncSchema
+
+# The asyncio classes are imported on first use; the threaded service does without them
+__getattr__ = LazyImports(__name__, {
+    'AsyncSchema': '.asyncschema'
+})
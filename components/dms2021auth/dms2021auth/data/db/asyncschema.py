@@ -0,0 +1,84 @@
+""" AsyncSchema class module.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from dms2021auth.data.db.schema import Schema
+
+
+class AsyncSchema():
+    """ Class responsible of running the blocking database work of coroutines.
+
+    The work is run in a bounded pool of threads, so the event loop is never
+    blocked; the session bound to the thread is removed after each job. Jobs
+    run in a copy of the calling context (e.g., to account their queries to
+    the request being served).
+    """
+
+    def __init__(self, schema: Schema, workers: int):
+        """ Constructor method.
+
+        Initializes the threads pool. Threads are started on demand.
+        ---
+        Parameters:
+            - schema: The database schema instance to use.
+            - workers: The maximum number of jobs run concurrently.
+        """
+        self.__schema: Schema = schema
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='db-worker'
+        )
+
+    def get_schema(self) -> Schema:
+        """ Gets the underlying schema.
+        ---
+        Returns:
+            The Schema instance.
+        """
+        return self.__schema
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """ Gets the pool of threads running the database work.
+        ---
+        Returns:
+            The ThreadPoolExecutor instance.
+        """
+        return self.__executor
+
+    async def run(self, function: Callable, *args, **kwargs):
+        """ Runs a function using the database in the threads pool.
+        ---
+        Parameters:
+            - function: The function to run. It may use the scoped session (see
+                        `Schema.get_session`).
+            - args: The function positional arguments.
+            - kwargs: The function keyword arguments.
+        Returns:
+            The function result.
+        """
+        context: contextvars.Context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, context.run, self.__run_job, function, args, kwargs
+        )
+
+    def shutdown(self) -> None:
+        """ Stops the threads, waiting for the pending jobs to finish.
+        """
+        self.__executor.shutdown(wait=True)
+
+    def __run_job(self, function: Callable, args: tuple, kwargs: dict):
+        """ Runs a job in a pool thread, releasing its session afterwards.
+        ---
+        Parameters:
+            - function: The function to run.
+            - args: The function positional arguments.
+            - kwargs: The function keyword arguments.
+        Returns:
+            The function result.
+        """
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.__schema.remove_session()
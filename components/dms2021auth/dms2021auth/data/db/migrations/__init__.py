@@ -0,0 +1,13 @@
+""" Authentication database schema migrations.
+"""
+
+from .migrationbase import MigrationBase
+from .sessionindexesmigration import SessionIndexesMigration
+from .passwordhashlengthmigration import PasswordHashLengthMigration
+from .sessionexpiryindexmigration import SessionExpiryIndexMigration
+from .userrightsversionmigration import UserRightsVersionMigration
+from .revokedtokensmigration import RevokedTokensMigration
+from .singleactivesessionmigration import SingleActiveSessionMigration
+from .sessionkeymigration import SessionKeyMigration
+from .activeusernamemigration import ActiveUsernameMigration
+from .migrator import Migrator
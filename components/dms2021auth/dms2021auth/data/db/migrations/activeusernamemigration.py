@@ -0,0 +1,66 @@
+""" ActiveUsernameMigration class module.
+"""
+
+from typing import Set
+from sqlalchemy import Column, Index, MetaData, String, Table, and_, inspect  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+from dms2021auth.data.db.types import StorageLayout
+
+
+class ActiveUsernameMigration(MigrationBase):
+    """ Adds the user name of the active sessions as a column of its own.
+
+    Databases not supporting partial indexes enforce a single active session
+    per user with a unique index on it instead. In these, the index created
+    by the single active session migration lacked its condition, so it made
+    user names unique across all the sessions; it is dropped.
+    """
+
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+        return 8
+
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+        return 'Active session user names'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Applies the migration.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+        table: Table = metadata.tables['user_sessions']
+        columns = [column['name'] for column in inspect(connection).get_columns(table.name)]
+        if 'active_username' not in columns:
+            connection.execute(
+                'ALTER TABLE user_sessions ADD COLUMN active_username VARCHAR(32)'
+            )
+        connection.execute(table.update().where(and_(
+            table.c.active == True,  # pylint: disable=singleton-comparison
+            table.c.active_username.is_(None)
+        )).values(active_username=table.c.username))
+        if StorageLayout.has_partial_indexes(metadata):
+            return
+        unconditional: str = StorageLayout.index_name(
+            metadata, 'ux_user_sessions_username_active'
+        )
+        existing: Set[str] = {
+            index['name'] for index in inspect(connection).get_indexes(table.name)
+        }
+        if unconditional in existing:
+            # Defined apart, so the index is not added to the mapped table
+            Index(unconditional, Table(
+                table.name, MetaData(), Column('username', String(32))
+            ).c.username).drop(connection)
+        self._create_missing_indexes(connection, table, ['ux_user_sessions_active_username'])
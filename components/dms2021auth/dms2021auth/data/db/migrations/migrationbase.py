@@ -0,0 +1,60 @@
+""" MigrationBase class module.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Set
+from sqlalchemy import MetaData, Table, inspect  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.types import StorageLayout
+
+
+class MigrationBase(ABC):
+    """ Base class for all the schema migrations.
+
+    Migrations must be idempotent, as they can be run against a database whose
+    objects were already deployed (e.g., by the schema creation itself).
+    """
+
+    @abstractmethod
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+
+    @abstractmethod
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+
+    @abstractmethod
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Applies the migration.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+
+    @staticmethod
+    def _create_missing_indexes(connection: Connection, table: Table, names: List[str]) -> None:
+        """ Creates the given indexes of a table, skipping those that already exist.
+        ---
+        Parameters:
+            - connection: The connection to use.
+            - table: The table definition, including its indexes.
+            - names: The names of the indexes to create, as named in the default layout.
+        """
+        existing: Set[str] = {
+            index['name'] for index in inspect(connection).get_indexes(table.name)
+        }
+        layout_names: List[str] = [
+            StorageLayout.index_name(table.metadata, name) for name in names
+        ]
+        for index in table.indexes:
+            if index.name in layout_names and index.name not in existing:
+                index.create(connection)
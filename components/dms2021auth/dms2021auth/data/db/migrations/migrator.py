@@ -0,0 +1,148 @@
+""" Migrator class module.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import Table, MetaData, Column, Integer, String, DateTime  # type: ignore
+from sqlalchemy import select, func  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.exc import IntegrityError  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+from dms2021auth.data.db.migrations.sessionindexesmigration import SessionIndexesMigration
+from dms2021auth.data.db.migrations.passwordhashlengthmigration import \
+    PasswordHashLengthMigration
+from dms2021auth.data.db.migrations.sessionexpiryindexmigration import \
+    SessionExpiryIndexMigration
+from dms2021auth.data.db.migrations.userrightsversionmigration import \
+    UserRightsVersionMigration
+from dms2021auth.data.db.migrations.revokedtokensmigration import RevokedTokensMigration
+from dms2021auth.data.db.migrations.singleactivesessionmigration import \
+    SingleActiveSessionMigration
+from dms2021auth.data.db.migrations.sessionkeymigration import SessionKeyMigration
+from dms2021auth.data.db.migrations.activeusernamemigration import \
+    ActiveUsernameMigration
+
+
+class Migrator():
+    """ Class responsible of upgrading a database to the latest schema version.
+
+    Every applied migration is stamped in the `schema_version` table.
+    """
+
+    def __init__(
+        self, engine: Engine, metadata: MetaData, migrations: Optional[List[MigrationBase]] = None
+    ):
+        """ Constructor method.
+
+        Initializes the migrator, registering the version table in the metadata.
+        ---
+        Parameters:
+            - engine: The engine connected to the database to upgrade.
+            - metadata: The database schema metadata, with all the entities mapped.
+            - migrations: The list of known migrations. Defaults to every migration
+                          shipped with the service.
+        """
+        self.__engine: Engine = engine
+        self.__metadata: MetaData = metadata
+        if migrations is None:
+            migrations = Migrator.default_migrations()
+        self.__migrations: List[MigrationBase] = sorted(
+            migrations, key=lambda migration: migration.get_version()
+        )
+        self.__version_table: Table = Migrator.__version_table_definition(metadata)
+
+    @staticmethod
+    def default_migrations() -> List[MigrationBase]:
+        """ Gets every migration shipped with the service.
+        ---
+        Returns:
+            A list of migrations.
+        """
+        return [
+            SessionIndexesMigration(),
+            PasswordHashLengthMigration(),
+            SessionExpiryIndexMigration(),
+            UserRightsVersionMigration(),
+            RevokedTokensMigration(),
+            SingleActiveSessionMigration(),
+            SessionKeyMigration(),
+            ActiveUsernameMigration()
+        ]
+
+    @staticmethod
+    def __version_table_definition(metadata: MetaData) -> Table:
+        """ Gets the version stamps table definition.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+        Returns:
+            A Table object with the table definition.
+        """
+        if 'schema_version' in metadata.tables:
+            return metadata.tables['schema_version']
+        return Table(
+            'schema_version',
+            metadata,
+            Column('version', Integer, primary_key=True, autoincrement=False),
+            Column('description', String(128), nullable=False),
+            Column('applied', DateTime, nullable=False)
+        )
+
+    def get_latest_version(self) -> int:
+        """ Gets the version of the newest known migration.
+        ---
+        Returns:
+            An integer with the latest schema version, or 0 if there are no migrations.
+        """
+        if not self.__migrations:
+            return 0
+        return self.__migrations[-1].get_version()
+
+    def get_current_version(self) -> int:
+        """ Gets the version the database is currently stamped with.
+        ---
+        Returns:
+            An integer with the current schema version, or 0 if it was never stamped.
+        """
+        self.__version_table.create(self.__engine, checkfirst=True)
+        with self.__engine.connect() as connection:
+            version: Optional[int] = connection.execute(
+                select([func.max(self.__version_table.c.version)])
+            ).scalar()
+        return version or 0
+
+    def is_current(self) -> bool:
+        """ Determines whether the database is stamped with the latest schema version,
+        so it is already deployed and needs no migration.
+        ---
+        Returns:
+            True if the database is up to date; false otherwise.
+        """
+        return self.get_current_version() >= self.get_latest_version()
+
+    def upgrade(self) -> List[int]:
+        """ Applies every pending migration, each one in its own transaction.
+
+        Running it against an up-to-date database does nothing.
+        ---
+        Returns:
+            The list of versions that were applied.
+        """
+        current_version: int = self.get_current_version()
+        applied: List[int] = []
+        for migration in self.__migrations:
+            if migration.get_version() <= current_version:
+                continue
+            try:
+                with self.__engine.begin() as connection:
+                    migration.upgrade(connection, self.__metadata)
+                    connection.execute(self.__version_table.insert(), {
+                        'version': migration.get_version(),
+                        'description': migration.get_description(),
+                        'applied': datetime.now()
+                    })
+            except IntegrityError:
+                # Another process stamped this version concurrently
+                continue
+            applied.append(migration.get_version())
+        return applied
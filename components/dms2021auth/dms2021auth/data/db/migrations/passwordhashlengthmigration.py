@@ -0,0 +1,44 @@
+""" PasswordHashLengthMigration class module.
+"""
+
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+
+
+class PasswordHashLengthMigration(MigrationBase):
+    """ Widens the password column to fit self-describing password hashes.
+    """
+
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+        return 2
+
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+        return 'Password hash length'
+
+    def upgrade(
+        self, connection: Connection, metadata: MetaData
+    ) -> None:  # pylint: disable=unused-argument
+        """ Applies the migration.
+
+        SQLite does not enforce string lengths, so nothing needs to be done there.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+        dialect: str = connection.dialect.name
+        if dialect == 'postgresql':
+            connection.execute('ALTER TABLE users ALTER COLUMN password TYPE VARCHAR(255)')
+        elif dialect == 'mysql':
+            connection.execute('ALTER TABLE users MODIFY password VARCHAR(255) NOT NULL')
@@ -0,0 +1,37 @@
+""" RevokedTokensMigration class module.
+"""
+
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+
+
+class RevokedTokensMigration(MigrationBase):
+    """ Adds the table of the revoked signed session tokens.
+    """
+
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+        return 5
+
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+        return 'Revoked session tokens'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Applies the migration.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+        # Creates its indexes too
+        metadata.tables['revoked_tokens'].create(connection, checkfirst=True)
@@ -0,0 +1,38 @@
+""" SessionExpiryIndexMigration class module.
+"""
+
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+
+
+class SessionExpiryIndexMigration(MigrationBase):
+    """ Adds the index backing the idle and inactive user sessions scans.
+    """
+
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+        return 3
+
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+        return 'User sessions expiry index'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Applies the migration.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+        self._create_missing_indexes(
+            connection, metadata.tables['user_sessions'], ['ix_user_sessions_active_updated']
+        )
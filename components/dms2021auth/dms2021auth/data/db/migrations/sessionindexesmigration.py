@@ -0,0 +1,38 @@
+""" SessionIndexesMigration class module.
+"""
+
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+
+
+class SessionIndexesMigration(MigrationBase):
+    """ Adds the indexes backing the user sessions lookups.
+    """
+
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+        return 1
+
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+        return 'User sessions indexes'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Applies the migration.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+        self._create_missing_indexes(
+            connection, metadata.tables['user_sessions'], ['ix_user_sessions_username_active']
+        )
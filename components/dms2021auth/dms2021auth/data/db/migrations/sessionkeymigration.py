@@ -0,0 +1,64 @@
+""" SessionKeyMigration class module.
+"""
+
+from typing import Dict, List
+from sqlalchemy import MetaData, Table, bindparam, inspect, select  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+from dms2021auth.data.db.results import UserSession
+
+
+class SessionKeyMigration(MigrationBase):
+    """ Adds the key identifying each session in the listings, along with its
+    unique index.
+
+    The key of every existing session is derived from its token, a batch of
+    sessions at a time.
+    """
+
+    BATCH_SIZE = 5000
+
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+        return 7
+
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+        return 'Session listing keys'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Applies the migration.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+        table: Table = metadata.tables['user_sessions']
+        columns = [column['name'] for column in inspect(connection).get_columns(table.name)]
+        if 'session_key' not in columns:
+            connection.execute('ALTER TABLE user_sessions ADD COLUMN session_key VARCHAR(32)')
+        while True:
+            tokens: List[str] = [row[0] for row in connection.execute(
+                select([table.c.token]).where(table.c.session_key.is_(None))
+                .limit(SessionKeyMigration.BATCH_SIZE)
+            )]
+            if not tokens:
+                break
+            keys: List[Dict[str, str]] = [
+                {'old_token': token, 'new_session_key': UserSession.key_of(token)}
+                for token in tokens
+            ]
+            connection.execute(
+                table.update().where(table.c.token == bindparam('old_token')).values(
+                    session_key=bindparam('new_session_key')
+                ), keys
+            )
+        self._create_missing_indexes(connection, table, ['ux_user_sessions_session_key'])
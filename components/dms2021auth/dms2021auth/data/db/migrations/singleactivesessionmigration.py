@@ -0,0 +1,55 @@
+""" SingleActiveSessionMigration class module.
+"""
+
+from datetime import datetime
+from typing import List
+from sqlalchemy import MetaData, Table, and_, func, select  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+
+
+class SingleActiveSessionMigration(MigrationBase):
+    """ Adds the unique index allowing a single active session per user.
+
+    Users with several active sessions (opened by concurrent logins) keep the
+    most recently used one; the rest are deactivated first.
+    """
+
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+        return 6
+
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+        return 'Single active session per user'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Applies the migration.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+        table: Table = metadata.tables['user_sessions']
+        active = table.c.active == True  # pylint: disable=singleton-comparison
+        usernames: List[str] = [row[0] for row in connection.execute(
+            select([table.c.username]).where(active).group_by(table.c.username)
+            .having(func.count() > 1)
+        )]
+        for username in usernames:
+            tokens: List[str] = [row[0] for row in connection.execute(
+                select([table.c.token]).where(and_(table.c.username == username, active))
+                .order_by(table.c.updated.desc(), table.c.token.desc())
+            )]
+            connection.execute(table.update().where(table.c.token.in_(tokens[1:])).values(
+                active=False, updated=datetime.now()
+            ))
+        self._create_missing_indexes(connection, table, ['ux_user_sessions_username_active'])
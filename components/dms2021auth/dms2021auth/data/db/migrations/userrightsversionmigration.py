@@ -0,0 +1,42 @@
+""" UserRightsVersionMigration class module.
+"""
+
+from sqlalchemy import MetaData, inspect  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from dms2021auth.data.db.migrations.migrationbase import MigrationBase
+
+
+class UserRightsVersionMigration(MigrationBase):
+    """ Adds the version of the rights of each user, increased whenever they change.
+    """
+
+    def get_version(self) -> int:
+        """ Gets the schema version this migration upgrades the database to.
+        ---
+        Returns:
+            A positive integer with the version number.
+        """
+        return 4
+
+    def get_description(self) -> str:
+        """ Gets a short human-readable description of the migration.
+        ---
+        Returns:
+            A description string.
+        """
+        return 'User rights version'
+
+    def upgrade(
+        self, connection: Connection, metadata: MetaData
+    ) -> None:  # pylint: disable=unused-argument
+        """ Applies the migration.
+        ---
+        Parameters:
+            - connection: The connection to use, with an already open transaction.
+            - metadata: The database schema metadata, with all the entities mapped.
+        """
+        columns = [column['name'] for column in inspect(connection).get_columns('users')]
+        if 'rights_version' not in columns:
+            connection.execute(
+                'ALTER TABLE users ADD COLUMN rights_version INTEGER NOT NULL DEFAULT 0'
+            )
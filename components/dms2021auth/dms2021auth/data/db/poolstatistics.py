@@ -0,0 +1,75 @@
+""" PoolStatistics class module.
+"""
+
+import threading
+from typing import Dict, Union
+
+
+class PoolStatistics():
+    """ Class responsible of accumulating the connection pool usage statistics.
+    """
+
+    def __init__(self):
+        """ Constructor method.
+
+        Initializes all the counters to zero.
+        """
+        self.__lock: threading.Lock = threading.Lock()
+        self.__connects: int = 0
+        self.__checkouts: int = 0
+        self.__checkins: int = 0
+        self.__timeouts: int = 0
+        self.__total_wait: float = 0.0
+        self.__max_wait: float = 0.0
+
+    def record_connect(self) -> None:
+        """ Records the creation of a new DBAPI connection.
+        """
+        with self.__lock:
+            self.__connects += 1
+
+    def record_checkout(self, wait: float) -> None:
+        """ Records a successful connection checkout.
+        ---
+        Parameters:
+            - wait: The seconds spent waiting for the connection.
+        """
+        with self.__lock:
+            self.__checkouts += 1
+            self.__total_wait += wait
+            self.__max_wait = max(self.__max_wait, wait)
+
+    def record_checkin(self) -> None:
+        """ Records a connection being returned to the pool.
+        """
+        with self.__lock:
+            self.__checkins += 1
+
+    def record_timeout(self, wait: float) -> None:
+        """ Records a checkout that timed out waiting for a connection.
+        ---
+        Parameters:
+            - wait: The seconds spent waiting before giving up.
+        """
+        with self.__lock:
+            self.__timeouts += 1
+            self.__total_wait += wait
+            self.__max_wait = max(self.__max_wait, wait)
+
+    def as_dict(self) -> Dict[str, Union[int, float]]:
+        """ Gets a snapshot of the statistics.
+        ---
+        Returns:
+            A dictionary with the counters and the wait times (in seconds).
+        """
+        with self.__lock:
+            attempts: int = self.__checkouts + self.__timeouts
+            return {
+                'connects': self.__connects,
+                'checkouts': self.__checkouts,
+                'checkins': self.__checkins,
+                'timeouts': self.__timeouts,
+                'total_wait': self.__total_wait,
+                'max_wait': self.__max_wait,
+                'mean_wait': self.__total_wait / attempts if attempts else 0.0
+            }
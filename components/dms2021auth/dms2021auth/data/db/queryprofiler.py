@@ -0,0 +1,301 @@
+""" QueryProfiler class module.
+"""
+
+import functools
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Column  # type: ignore
+from dms2021auth.data.config import AuthConfiguration
+
+
+class QueryProfiler():  # pylint: disable=too-many-instance-attributes
+    """ Class responsible of timing the database statements.
+
+    Statements are aggregated by their normalized text (literals and lists of
+    parameters are collapsed) and by the method issuing them (preferably, a
+    resultset method). Statements slower than a threshold are logged along with
+    their parameters, except for the session tokens and password hashes.
+
+    The `profiler` configuration section is read again whenever the
+    configuration file changes, so profiling can be enabled, disabled or tuned
+    without restarting the service. While disabled, each statement only costs
+    a flag check.
+    """
+
+    # The longest parameters representation written to the slow statements log
+    MAX_LOGGED_PARAMETERS = 500
+    # The statement counted when the maximum number of distinct ones is reached
+    OTHER_STATEMENTS = '(other statements)'
+    # The value logged in place of the credentials (session tokens and password hashes)
+    REDACTED = '<redacted>'
+
+    __CREDENTIAL_PARAMETER = re.compile(r'token|password', re.IGNORECASE)
+
+    __STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+    __NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+    __PARAMETER_LIST = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+    __WHITESPACE = re.compile(r'\s+')
+
+    def __init__(self, config: AuthConfiguration, credential_columns: Sequence[Column] = ()):
+        """ Constructor method.
+
+        Initializes the profiler with the configured settings.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the profiler parameters.
+            - credential_columns: The columns whose values are left out of the slow
+                                  statements log (e.g., the session tokens).
+        """
+        # Parameters compared with or set to a column are bound with its type object
+        self.__credential_types: List = [column.type for column in credential_columns]
+        self.__lock: threading.Lock = threading.Lock()
+        self.__reload_lock: threading.Lock = threading.Lock()
+        self.__file_path: Optional[str] = config.get_file_path()
+        self.__file_mtime: Optional[float] = self.__stat_file()
+        self.__next_reload: float = 0.0
+        # Normalized statement -> [count, total seconds, maximum seconds, callers Counter]
+        self.__statements: Dict[str, List] = {}
+        self.__enabled: bool = False
+        self.__slow_threshold: float = 0.0
+        self.__top: int = 0
+        self.__max_statements: int = 0
+        self.__reload_interval: float = 0.0
+        self.__apply(config)
+
+    def is_enabled(self) -> bool:
+        """ Determines whether the statements are being profiled.
+        ---
+        Returns:
+            True if profiling is enabled; false otherwise.
+        """
+        return self.__enabled
+
+    def before_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+        """ Engine listener noting the time a statement starts.
+        ---
+        Parameters:
+            - conn: The connection running the statement.
+        """
+        if self.__reload_interval > 0 and time.monotonic() >= self.__next_reload:
+            self.reload()
+        if self.__enabled:
+            conn.info['profiler_start'] = time.perf_counter()
+
+    def after_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+        """ Engine listener recording a statement that finished.
+        ---
+        Parameters:
+            - conn: The connection that ran the statement.
+            - statement: The statement string.
+            - context: The execution context of the statement.
+        """
+        start: Optional[float] = conn.info.pop('profiler_start', None)
+        if start is None:
+            return
+        elapsed: float = time.perf_counter() - start
+        normalized: str = QueryProfiler.normalize(statement)
+        caller: str = QueryProfiler.__caller()
+        with self.__lock:
+            entry: Optional[List] = self.__statements.get(normalized)
+            if entry is None:
+                if len(self.__statements) >= self.__max_statements:
+                    normalized = QueryProfiler.OTHER_STATEMENTS
+                entry = self.__statements.setdefault(normalized, [0, 0.0, 0.0, Counter()])
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] = max(entry[2], elapsed)
+            entry[3][caller] += 1
+        if elapsed >= self.__slow_threshold:
+            parameters_repr: str = self.__redacted_parameters(context)
+            if len(parameters_repr) > QueryProfiler.MAX_LOGGED_PARAMETERS:
+                parameters_repr = parameters_repr[:QueryProfiler.MAX_LOGGED_PARAMETERS] + '...'
+            logging.getLogger(__name__).warning(
+                'Slow statement (%.1f ms) from %s: %s; parameters: %s',
+                elapsed * 1000, caller, statement, parameters_repr
+            )
+
+    def get_report(self, top: Optional[int] = None) -> List[Dict]:
+        """ Gets the statements that took the most time.
+        ---
+        Parameters:
+            - top: The number of statements to report. Defaults to `profiler.top`.
+        Returns:
+            A list with a dictionary per statement, in descending order of total time,
+            with the `statement`, its `count`, `total`, `mean` and `max` time (in
+            seconds) and the number of times it was issued by each of its `callers`.
+        """
+        with self.__lock:
+            entries: List[Tuple[str, List]] = sorted(
+                self.__statements.items(), key=lambda item: item[1][1], reverse=True
+            )[:top or self.__top]
+            return [{
+                'statement': statement,
+                'count': count,
+                'total': total,
+                'mean': total / count,
+                'max': maximum,
+                'callers': dict(callers.most_common())
+            } for statement, (count, total, maximum, callers) in entries]
+
+    def log_report(self) -> None:
+        """ Writes the report of the statements that took the most time to the log.
+        """
+        lines: List[str] = [
+            'Database statements profile (pid ' + str(os.getpid()) + ', profiling '
+            + ('enabled' if self.__enabled else 'disabled') + '):'
+        ]
+        for rank, entry in enumerate(self.get_report(), 1):
+            lines.append(
+                str(rank) + '. total ' + format(entry['total'] * 1000, '.1f') + ' ms, count '
+                + str(entry['count']) + ', mean ' + format(entry['mean'] * 1000, '.3f')
+                + ' ms, max ' + format(entry['max'] * 1000, '.3f') + ' ms: '
+                + entry['statement']
+            )
+            lines.extend(
+                '     ' + str(count) + ' from ' + caller
+                for caller, count in entry['callers'].items()
+            )
+        logging.getLogger(__name__).warning('\n'.join(lines))
+
+    def reset(self) -> None:
+        """ Discards the statistics gathered so far.
+        """
+        with self.__lock:
+            self.__statements.clear()
+
+    def reload(self) -> None:
+        """ Applies the profiler configuration again if the configuration file changed.
+        """
+        if not self.__reload_lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            # Another thread is already reloading it
+            return
+        try:
+            self.__next_reload = time.monotonic() + self.__reload_interval
+            mtime: Optional[float] = self.__stat_file()
+            if mtime is None or mtime == self.__file_mtime or self.__file_path is None:
+                return
+            self.__file_mtime = mtime
+            config: AuthConfiguration = AuthConfiguration()
+            try:
+                config.load_from_file(self.__file_path)
+                self.__apply(config)
+            except Exception:  # pylint: disable=broad-except
+                # Possibly a half-written file; the current settings are kept meanwhile
+                logging.getLogger(__name__).exception('Cannot reload the profiler configuration')
+        finally:
+            self.__reload_lock.release()
+
+    def __apply(self, config: AuthConfiguration) -> None:
+        """ Applies the profiler configuration.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the profiler parameters.
+        """
+        # Every value is read before applying any, so invalid ones leave the settings intact
+        slow_threshold: float = config.get_profiler_slow_threshold()
+        top: int = config.get_profiler_top()
+        max_statements: int = config.get_profiler_max_statements()
+        reload_interval: float = config.get_profiler_reload_interval()
+        enabled: bool = config.get_profiler_enabled()
+        self.__slow_threshold = slow_threshold
+        self.__top = top
+        self.__max_statements = max_statements
+        self.__reload_interval = reload_interval
+        self.__next_reload = time.monotonic() + reload_interval
+        if enabled != self.__enabled:
+            logging.getLogger(__name__).warning(
+                'Database statements profiling %s', 'enabled' if enabled else 'disabled'
+            )
+        self.__enabled = enabled
+
+    def __stat_file(self) -> Optional[float]:
+        """ Gets the modification time of the configuration file.
+        ---
+        Returns:
+            The modification time, or None if the file is unknown or cannot be read.
+        """
+        if self.__file_path is None:
+            return None
+        try:
+            return os.stat(self.__file_path).st_mtime
+        except OSError:
+            return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def normalize(statement: str) -> str:
+        """ Normalizes a statement, so those differing only in their literals or in the
+        length of their parameter lists are aggregated together.
+        ---
+        Parameters:
+            - statement: The statement string.
+        Returns:
+            The normalized statement string.
+        """
+        normalized: str = QueryProfiler.__WHITESPACE.sub(' ', statement).strip()
+        normalized = QueryProfiler.__STRING_LITERAL.sub('?', normalized)
+        normalized = QueryProfiler.__NUMBER_LITERAL.sub('?', normalized)
+        return QueryProfiler.__PARAMETER_LIST.sub('IN (?, ...)', normalized)
+
+    def __redacted_parameters(self, context) -> str:
+        """ Represents the parameters of a statement for the slow statements log, leaving
+        the credentials out.
+
+        Parameters are redacted if bound with the type of a credential column, or if
+        their bind names are about tokens or passwords. The parameters of statements
+        issued as plain strings cannot be told apart, so they are not logged.
+        ---
+        Parameters:
+            - context: The execution context of the statement.
+        Returns:
+            The representation string.
+        """
+        compiled = getattr(context, 'compiled', None)
+        if compiled is None:
+            return '(not logged)'
+        redacted: List[str] = [
+            name for name, bind in compiled.binds.items()
+            if QueryProfiler.__CREDENTIAL_PARAMETER.search(name)
+            or any(bind.type is credential_type for credential_type in self.__credential_types)
+        ]
+        parameter_sets: List[Dict] = [{
+            name: QueryProfiler.REDACTED if name in redacted else value
+            for name, value in parameter_set.items()
+        } for parameter_set in context.compiled_parameters]
+        return repr(parameter_sets[0] if len(parameter_sets) == 1 else parameter_sets)
+
+    @staticmethod
+    def __caller() -> str:
+        """ Finds the method issuing the statement being run.
+        ---
+        Returns:
+            The qualified name (e.g., `UserSessions.create`) of the innermost resultset
+            method in the call stack or, failing that, of the innermost function of the
+            service.
+        """
+        frame: Optional[FrameType] = sys._getframe(2)  # pylint: disable=protected-access
+        fallback: str = 'unknown'
+        while frame is not None:
+            module: str = frame.f_globals.get('__name__', '')
+            if module.startswith('dms2021auth.') and module != __name__:
+                code = frame.f_code
+                name: str = getattr(
+                    code, 'co_qualname', module.rpartition('.')[2] + '.' + code.co_name
+                )
+                if module.startswith('dms2021auth.data.db.resultsets.'):
+                    return name
+                if fallback == 'unknown':
+                    fallback = name
+            frame = frame.f_back
+        return fallback
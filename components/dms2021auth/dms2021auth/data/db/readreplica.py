@@ -0,0 +1,88 @@
+""" ReadReplica class module.
+"""
+
+from typing import Hashable, Optional
+from sqlalchemy.engine import Connection, Engine  # type: ignore
+from dms2021auth.data.cache import TtlLruCache
+
+
+class ReadReplica():
+    """ Read-only database serving the hot lookups, so they do not compete with
+    the writes for the connections to the primary database.
+
+    A replica may lag behind the primary. The keys (session tokens and user
+    names) written by this process are read from the primary for a while, so
+    its own writes are seen right away. Lookups finding nothing in the replica
+    (e.g., a session just opened by another process) may be retried in the
+    primary too.
+    """
+
+    def __init__(
+        self, engine: Engine, read_after_write: float, capacity: int, fallback_on_miss: bool
+    ):
+        """ Constructor method.
+        ---
+        Parameters:
+            - engine: The engine connected to the replica.
+            - read_after_write: The seconds a written key is read from the primary.
+            - capacity: The maximum number of written keys remembered at once.
+            - fallback_on_miss: Whether the lookups finding nothing are retried in the
+                                primary or not.
+        """
+        self.__engine: Engine = engine
+        self.__written: Optional[TtlLruCache] = None
+        if read_after_write > 0 and capacity > 0:
+            self.__written = TtlLruCache(capacity, read_after_write)
+        self.__fallback_on_miss: bool = fallback_on_miss
+
+    def get_engine(self) -> Engine:
+        """ Gets the engine connected to the replica.
+        ---
+        Returns:
+            The Engine instance.
+        """
+        return self.__engine
+
+    def connect(self) -> Connection:
+        """ Takes a connection to the replica from the pool.
+
+        Connections are only held while reading, not for the whole request, so
+        requests busy writing do not keep them from the rest.
+        ---
+        Returns:
+            The Connection object, to be closed (e.g., in a `with` statement) once
+            its results are read.
+        """
+        return self.__engine.connect()
+
+    def mark_written(self, key: Hashable) -> None:
+        """ Records that a key was written, so it is read from the primary for a while.
+        ---
+        Parameters:
+            - key: The session token or user name.
+        """
+        if self.__written is not None:
+            self.__written.put(key, True)
+
+    def was_written(self, key: Hashable) -> bool:
+        """ Determines whether a key was written recently by this process or not.
+        ---
+        Parameters:
+            - key: The session token or user name.
+        Returns:
+            True if the key must be read from the primary; false otherwise.
+        """
+        return self.__written is not None and self.__written.get(key) is not None
+
+    def falls_back_on_miss(self) -> bool:
+        """ Determines whether the lookups finding nothing are retried in the primary.
+        ---
+        Returns:
+            True if they are; false otherwise.
+        """
+        return self.__fallback_on_miss
+
+    def close(self) -> None:
+        """ Closes every pooled connection. New connections are opened on demand.
+        """
+        self.__engine.dispose()
@@ -4,3 +4,5 @@
 from .user import User
 from .usersession import UserSession
 from .userright import UserRight
+from .revokedtoken import RevokedToken
+from .sessionrow import SessionRow
@@ -4,7 +4,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict
 from sqlalchemy import Table, MetaData  # type: ignore
-from sqlalchemy.orm import mapper  # type: ignore
+from sqlalchemy.orm import mapper, class_mapper  # type: ignore
 
 
 class ResultBase(ABC):
@@ -26,6 +26,32 @@ class ResultBase(ABC):
             properties=cls._mapping_properties()  # type: ignore
         )
 
+    @classmethod
+    def define_table(cls: type, metadata: MetaData) -> Table:
+        """ Defines the table of the records in a metadata, without mapping this class.
+        ---
+        Parameters:
+            - cls: This class.
+            - metadata: The database schema metadata.
+        Returns:
+            A Table object with the table definition.
+        """
+        return cls._table_definition(metadata)  # type: ignore
+
+    @classmethod
+    def get_table(cls: type) -> Table:
+        """ Gets the table this class is mapped to.
+
+        Useful to build queries on its columns, which are not visible as
+        class attributes to static checkers.
+        ---
+        Parameters:
+            - cls: This class.
+        Returns:
+            The mapped Table object.
+        """
+        return class_mapper(cls).local_table
+
     @staticmethod
     @abstractmethod
     def _table_definition(metadata: MetaData) -> Table:
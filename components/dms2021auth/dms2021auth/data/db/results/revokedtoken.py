@@ -0,0 +1,47 @@
+""" RevokedToken class module.
+"""
+
+from datetime import datetime
+from sqlalchemy import Table, MetaData, Column, DateTime, Index  # type: ignore
+from dms2021auth.data.db.results.resultbase import ResultBase
+from dms2021auth.data.db.types import StorageLayout
+
+
+class RevokedToken(ResultBase):
+    """ Definition and storage of revoked session token ORM records.
+
+    Signed session tokens cannot be invalidated by themselves; their session
+    is recorded here until every token issued for it has expired.
+    """
+
+    def __init__(self, session_id: str, expires: datetime):
+        """ Constructor method.
+
+        Initializes a revoked token record.
+        ---
+        Parameters:
+            - session_id: A string with the id of the session whose tokens are revoked.
+            - expires: A datetime after which every token of the session is expired.
+        """
+        self.session_id: str = session_id
+        self.expires: datetime = expires
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+        ---
+        Parameters:
+            - metadata: The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+        Returns:
+            A Table object with the table definition.
+        """
+        table: Table = Table(
+            'revoked_tokens',
+            metadata,
+            Column('session_id', StorageLayout.token_type(metadata), primary_key=True),
+            Column('expires', DateTime, nullable=False)
+        )
+        # Loading and pruning the unexpired revocations
+        Index(StorageLayout.index_name(metadata, 'ix_revoked_tokens_expires'), table.c.expires)
+        return table
@@ -0,0 +1,22 @@
+""" SessionRow class module.
+"""
+
+
+class SessionRow():  # pylint: disable=too-few-public-methods
+    """ Read-only record of an active user session, as loaded by `Lookups`.
+
+    Unlike `UserSession`, it is not mapped, so loading it involves no identity
+    map or change tracking; changes must go through the ORM resultsets.
+    """
+
+    __slots__ = ('token', 'username')
+
+    def __init__(self, token: str, username: str):
+        """ Constructor method.
+        ---
+        Parameters:
+            - token: A string with the session token.
+            - username: The username owning the session.
+        """
+        self.token: str = token
+        self.username: str = username
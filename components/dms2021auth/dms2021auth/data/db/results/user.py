@@ -2,7 +2,7 @@
 """
 
 from typing import Dict
-from sqlalchemy import Table, MetaData, Column, String  # type: ignore
+from sqlalchemy import Table, MetaData, Column, Integer, String  # type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2021auth.data.db.results.resultbase import ResultBase
 from dms2021auth.data.db.results.usersession import UserSession
@@ -39,7 +39,9 @@ class User(ResultBase):
             'users',
             metadata,
             Column('username', String(32), primary_key=True),
-            Column('password', String(64), nullable=False)
+            Column('password', String(255), nullable=False),
+            # Increased whenever the user rights change
+            Column('rights_version', Integer, nullable=False, default=0, server_default='0')
         )
 
     @staticmethod
@@ -1,9 +1,10 @@
 """ UserRight class module.
 """
 
-from sqlalchemy import Table, MetaData, Column, ForeignKey, String, Enum  # type: ignore
+from sqlalchemy import Table, MetaData, Column, ForeignKey, String  # type: ignore
 from dms2021core.data import UserRightName
 from dms2021auth.data.db.results.resultbase import ResultBase
+from dms2021auth.data.db.types import StorageLayout
 
 
 class UserRight(ResultBase):
@@ -37,5 +38,5 @@ class UserRight(ResultBase):
             metadata,
             Column('username', String(32),
                    ForeignKey('users.username'), primary_key=True),
-            Column('right', Enum(UserRightName), primary_key=True)
+            Column('right', StorageLayout.right_type(metadata), primary_key=True)
         )
@@ -1,11 +1,14 @@
 """ UserSession class module.
 """
 
+import hashlib
 from datetime import datetime
-from sqlalchemy import Table, MetaData, Column, ForeignKey  # type: ignore
+from typing import Optional
+from sqlalchemy import Table, MetaData, Column, ForeignKey, Index  # type: ignore
 from sqlalchemy import String, Boolean, DateTime  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
 from dms2021auth.data.db.results.resultbase import ResultBase
+from dms2021auth.data.db.types import StorageLayout
 
 
 class UserSession(ResultBase):
@@ -26,8 +29,10 @@ class UserSession(ResultBase):
             - updated: The datetime of the time of update.
         """
         self.token: str = token
+        self.session_key: str = UserSession.key_of(token)
         self.username: str = username
         self.active: bool = active
+        self.active_username: Optional[str] = username if active else None
         self.created: datetime = created
         self.updated: datetime = updated
 
@@ -41,44 +46,71 @@ class UserSession(ResultBase):
         Returns:
             A Table object with the table definition.
         """
-        return Table(
+        table: Table = Table(
             'user_sessions',
             metadata,
-            Column('token', String(36), primary_key=True),
+            Column('token', StorageLayout.token_type(metadata), primary_key=True),
             Column('username', String(32),
                    ForeignKey('users.username'), nullable=False),
             Column('active', Boolean, nullable=False, default=True),
             Column('created', DateTime, nullable=False),
-            Column('updated', DateTime, nullable=False)
+            Column('updated', DateTime, nullable=False),
+            Column('session_key', String(32)),
+            # The username while the session is active, and null afterwards
+            Column('active_username', String(32))
         )
+        # Active session of a user (login)
+        Index(StorageLayout.index_name(metadata, 'ix_user_sessions_username_active'),
+              table.c.username, table.c.active)
+        # Idle active sessions and old inactive sessions (expiry)
+        Index(StorageLayout.index_name(metadata, 'ix_user_sessions_active_updated'),
+              table.c.active, table.c.updated)
+        # At most one active session per user, so concurrent logins cannot open two
+        if StorageLayout.has_partial_indexes(metadata):
+            active_only = table.c.active == True  # pylint: disable=singleton-comparison
+            Index(StorageLayout.index_name(metadata, 'ux_user_sessions_username_active'),
+                  table.c.username, unique=True,
+                  sqlite_where=active_only, postgresql_where=active_only)
+        else:
+            # Null values are not compared (filtered out in SQL Server, which does)
+            Index(StorageLayout.index_name(metadata, 'ux_user_sessions_active_username'),
+                  table.c.active_username, unique=True,
+                  mssql_where=table.c.active_username.isnot(None))
+        # Listing by a key that cannot be used as a credential
+        Index(StorageLayout.index_name(metadata, 'ux_user_sessions_session_key'),
+              table.c.session_key, unique=True)
+        return table
 
-    def touch(self, session: Session, timestamp: datetime):
-        """ Updates the update time.
+    @staticmethod
+    def key_of(token: str) -> str:
+        """ Gets the key identifying a session in the listings.
+
+        Unlike the token, the key cannot be used to act on behalf of the session.
         ---
-        Note:
-            Any existing transaction will be committed.
         Parameters:
-            - session: The Session object that was used to retrieve this UserSession.
-            - timestamp: A datetime with the timestamp to use.
+            - token: A string with the session token.
+        Returns:
+            The key string (the first half of the SHA-256 of the token, in hexadecimal).
         """
-        try:
-            self.updated = timestamp
-            session.commit()
-        except:
-            session.rollback()
-            raise
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()[:32]
 
     def deactivate(self, session: Session):
-        """ Deactivates the session.
+        """ Deactivates the session, setting the current time as its update time.
         ---
         Note:
-            Any existing transaction will be committed.
+            Any existing transaction will be committed, and the token will be
+            evicted from the session cache.
         Parameters:
             - session: The Session object that was used to retrieve this UserSession.
         """
         try:
             self.active = False
+            self.active_username = None
+            self.updated = datetime.now()
             session.commit()
         except:
             session.rollback()
             raise
+        session_cache = session.info.get('session_cache')
+        if session_cache is not None:
+            session_cache.invalidate(self.token)
@@ -4,3 +4,5 @@
 from .users import Users
 from .usersessions import UserSessions
 from .userrights import UserRights
+from .revokedtokens import RevokedTokens
+from .lookups import Lookups
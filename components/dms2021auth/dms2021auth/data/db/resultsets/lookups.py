@@ -0,0 +1,202 @@
+""" Lookups class module.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple, Type
+from sqlalchemy import Table, and_, bindparam, select  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from sqlalchemy.engine.interfaces import Compiled, Dialect  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from sqlalchemy.sql.expression import Select  # type: ignore
+from dms2021core.data import UserRightName
+from dms2021auth.data.db.results import User, UserRight, UserSession, SessionRow
+from dms2021auth.data.db.results.resultbase import ResultBase
+from dms2021auth.data.db.readreplica import ReadReplica
+
+
+class Lookups():
+    """ Class responsible of the read-only lookups run on every request.
+
+    They skip the ORM: each statement is compiled once and its rows are read
+    into plain values or `__slots__` records, so no mapped instances are
+    built. Records read this way cannot be modified; writes go through the
+    ORM resultsets instead.
+
+    Lookups asked to use the replica run in the read replica of the session,
+    if any (see `ReadReplica`), unless their key was written recently by this
+    process. The rest run in the primary database, as the writes following
+    them must see the same data.
+    """
+
+    # (Statement name, dialect) -> (table it was built for, compiled statement)
+    __compiled: Dict[Tuple[str, Dialect], Tuple[Table, Compiled]] = {}
+
+    @staticmethod
+    def find_active_session(
+        session: Session, session_token: str, replica: bool = False
+    ) -> Optional[SessionRow]:
+        """ Finds an active session by its token.
+        ---
+        Parameters:
+            - session: The session object.
+            - session_token: The session token.
+            - replica: Whether the read replica may be used or not (default).
+        Returns:
+            The SessionRow found, or None if no matching active session was found.
+        """
+        rows: List = Lookups.__read(
+            session, 'active_session', UserSession, Lookups.__active_session,
+            {'token': session_token}, session_token if replica else None, True
+        )
+        return SessionRow(rows[0][0], rows[0][1]) if rows else None
+
+    @staticmethod
+    def find_active_session_for_user(session: Session, username: str) -> Optional[SessionRow]:
+        """ Finds the active session of a user.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+        Returns:
+            The SessionRow found, or None if the user has no active session.
+        """
+        row = Lookups.__execute(
+            session.connection(), 'active_session_for_user', UserSession,
+            Lookups.__active_session_for_user, {'username': username}
+        ).first()
+        return None if row is None else SessionRow(row[0], row[1])
+
+    @staticmethod
+    def find_password_hash(
+        session: Session, username: str, replica: bool = False
+    ) -> Optional[str]:
+        """ Finds the stored password hash of a user.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+            - replica: Whether the read replica may be used or not (default).
+        Returns:
+            The password hash string, or None if the user does not exist.
+        """
+        rows: List = Lookups.__read(
+            session, 'password_hash', User, Lookups.__password_hash, {'username': username},
+            username if replica else None, True
+        )
+        return rows[0][0] if rows else None
+
+    @staticmethod
+    def find_rights(
+        session: Session, username: str, replica: bool = False
+    ) -> List[UserRightName]:
+        """ Finds all the rights of a user.
+
+        Users without rights are not looked up again in the primary database,
+        as they cannot be told from users missing in the replica.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+            - replica: Whether the read replica may be used or not (default).
+        Returns:
+            The list of rights. It is empty if the user has no rights or does not exist.
+        """
+        return [row[0] for row in Lookups.__read(
+            session, 'rights', UserRight, Lookups.__rights, {'username': username},
+            username if replica else None, False
+        )]
+
+    @staticmethod
+    def __read(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        session: Session, name: str, result_class: Type[ResultBase],
+        build: Callable[[Table], Select], parameters: Dict, key: Optional[str],
+        fallback: bool
+    ) -> List:
+        """ Runs a statement in the read replica, if possible, or in the primary database.
+        ---
+        Parameters:
+            - session: The session object.
+            - name: The statement name.
+            - result_class: The class mapped to the table the statement reads.
+            - build: A function building the statement from that table.
+            - parameters: A dictionary with the values of the bound parameters.
+            - key: The key looked up (a session token or a user name), or None if the
+                   primary database must be used.
+            - fallback: Whether finding no rows in the replica may be retried in the
+                        primary database or not.
+        Returns:
+            The list of rows read.
+        """
+        read_replica: Optional[ReadReplica] = None
+        if key is not None:
+            read_replica = session.info.get('read_replica')
+        if read_replica is not None and not read_replica.was_written(key):
+            with read_replica.connect() as connection:
+                rows: List = Lookups.__execute(
+                    connection, name, result_class, build, parameters
+                ).fetchall()
+            if rows or not (fallback and read_replica.falls_back_on_miss()):
+                return rows
+        return Lookups.__execute(
+            session.connection(), name, result_class, build, parameters
+        ).fetchall()
+
+    @staticmethod
+    def __execute(
+        connection: Connection, name: str, result_class: Type[ResultBase],
+        build: Callable[[Table], Select], parameters: Dict
+    ):
+        """ Runs a statement, compiling it first if it was not compiled yet.
+
+        Statements are compiled for each database they run against, and again
+        if the tables are mapped anew.
+        ---
+        Parameters:
+            - connection: The connection to the database.
+            - name: The statement name.
+            - result_class: The class mapped to the table the statement reads.
+            - build: A function building the statement from that table.
+            - parameters: A dictionary with the values of the bound parameters.
+        Returns:
+            The ResultProxy of the statement.
+        """
+        dialect: Dialect = connection.dialect
+        compiled: Optional[Tuple[Table, Compiled]] = Lookups.__compiled.get((name, dialect))
+        table: Table = result_class.get_table()
+        if compiled is None or compiled[0] is not table:
+            compiled = (table, build(table).compile(dialect=dialect))
+            Lookups.__compiled[(name, dialect)] = compiled
+        return connection.execute(compiled[1], parameters)
+
+    @staticmethod
+    def __active_session(table: Table) -> Select:
+        """ Builds the statement finding an active session by its token.
+        """
+        return select([table.c.token, table.c.username]).where(and_(
+            table.c.token == bindparam('token'),
+            table.c.active == True  # pylint: disable=singleton-comparison
+        ))
+
+    @staticmethod
+    def __active_session_for_user(table: Table) -> Select:
+        """ Builds the statement finding the active session of a user.
+        """
+        return select([table.c.token, table.c.username]).where(and_(
+            table.c.username == bindparam('username'),
+            table.c.active == True  # pylint: disable=singleton-comparison
+        ))
+
+    @staticmethod
+    def __password_hash(table: Table) -> Select:
+        """ Builds the statement finding the password hash of a user.
+        """
+        return select([table.c.password]).where(
+            table.c.username == bindparam('username')
+        )
+
+    @staticmethod
+    def __rights(table: Table) -> Select:
+        """ Builds the statement finding the rights of a user.
+        """
+        return select([table.c.right]).where(
+            table.c.username == bindparam('username')
+        )
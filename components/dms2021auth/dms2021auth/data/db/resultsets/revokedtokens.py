@@ -0,0 +1,69 @@
+""" RevokedTokens class module.
+"""
+
+from datetime import datetime
+from typing import List, Tuple
+from sqlalchemy import Table, select  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2021auth.data.db.results import RevokedToken
+
+
+class RevokedTokens():
+    """ Class responsible of table-level revoked session tokens operations.
+    """
+    @staticmethod
+    def revoke(session: Session, session_id: str, expires: datetime) -> None:
+        """ Revokes the tokens of a session until a given time.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - session_id: The session id string.
+            - expires: A datetime after which every token of the session is expired.
+        """
+        try:
+            revoked_token = session.query(RevokedToken).get(session_id)
+            if revoked_token is None:
+                session.add(RevokedToken(session_id, expires))
+            elif revoked_token.expires < expires:
+                revoked_token.expires = expires
+            session.commit()
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def find_unexpired(session: Session, now: datetime) -> List[Tuple[str, datetime]]:
+        """ Finds the revocations that have not expired yet.
+        ---
+        Parameters:
+            - session: The session object.
+            - now: The current datetime.
+        Returns:
+            A list of (session id, expiration datetime) tuples.
+        """
+        table: Table = RevokedToken.get_table()
+        query = select([table.c.session_id, table.c.expires]).where(table.c.expires > now)
+        return [(row[0], row[1]) for row in session.execute(query)]
+
+    @staticmethod
+    def purge_expired(session: Session, now: datetime) -> int:
+        """ Deletes the expired revocations.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - now: The current datetime.
+        Returns:
+            The number of revocations deleted.
+        """
+        table: Table = RevokedToken.get_table()
+        try:
+            result = session.execute(table.delete().where(table.c.expires <= now))
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        return result.rowcount
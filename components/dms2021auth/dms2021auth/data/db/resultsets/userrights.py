@@ -1,13 +1,17 @@
 """ UserRights class module.
 """
 
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import Table, and_, bindparam, select  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2021core.data import UserRightName
-from dms2021auth.data.db.results import UserRight
+from dms2021core.data import UserRightName, UserRightMask
+from dms2021auth.data.db.results import User, UserRight, UserSession
 from dms2021auth.data.db.exc import UserNotFoundError
+from dms2021auth.data.db.readreplica import ReadReplica
+from dms2021auth.data.db.resultsets.lookups import Lookups
 
 
 class UserRights():
@@ -37,7 +41,9 @@ class UserRights():
         try:
             new_user_right = UserRight(username, right)
             session.add(new_user_right)
+            UserRights.__increase_rights_versions(session, [username])
             session.commit()
+            UserRights.evict_cached_rights(session, username)
             return new_user_right
         except IntegrityError as ex:
             session.rollback()
@@ -66,10 +72,12 @@ class UserRights():
             return
         try:
             session.delete(user_right)
+            UserRights.__increase_rights_versions(session, [username])
             session.commit()
         except:
             session.rollback()
             raise
+        UserRights.evict_cached_rights(session, username)
 
     @staticmethod
     def find_right(session: Session, username: str, right: UserRightName) -> Optional[UserRight]:
@@ -94,3 +102,337 @@ class UserRights():
             return query.one()
         except NoResultFound:
             return None
+
+    @staticmethod
+    def find_versioned_rights_mask(session: Session, username: str) -> Optional[Tuple[int, int]]:
+        """ Finds all the rights of a user along with their version, in a single query.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+        Returns:
+            A tuple with the version of the user rights (increased whenever any of them
+            changes) and an integer bitmask with the rights, or None if the user does
+            not exist.
+        """
+        users: Table = User.get_table()
+        rights: Table = UserRight.get_table()
+        query = select([users.c.rights_version, rights.c.right]).select_from(
+            users.outerjoin(rights, rights.c.username == users.c.username)
+        ).where(users.c.username == username)
+        rows = session.execute(query).fetchall()
+        if not rows:
+            return None
+        return (
+            rows[0][0],
+            UserRightMask.from_rights(row[1] for row in rows if row[1] is not None)
+        )
+
+    @staticmethod
+    def get_rights_mask(session: Session, username: str) -> int:
+        """ Gets all the rights of a user, trying the rights cache first.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+        Returns:
+            An integer bitmask (see `UserRightMask`) with the rights of the user.
+            It is 0 if the user has no rights or does not exist.
+        """
+        rights_cache = session.info.get('rights_cache')
+        if rights_cache is None:
+            return UserRights.__query_rights_mask(session, username)
+        mask: Optional[int] = rights_cache.get(username)
+        if mask is not None:
+            return mask
+        generation: int = rights_cache.get_generation()
+        mask = UserRights.__query_rights_mask(session, username)
+        rights_cache.put(username, mask, generation)
+        return mask
+
+    @staticmethod
+    def find_session_rights_mask(
+        session: Session, session_token: str
+    ) -> Optional[Tuple[str, int]]:
+        """ Finds the owner of an active session along with all of their rights.
+
+        Cached values are used when present. Otherwise, both are loaded with a single query.
+        ---
+        Parameters:
+            - session: The session object.
+            - session_token: The session token.
+        Returns:
+            A tuple with the user name string and the integer rights bitmask,
+            or None if no matching active session was found.
+        """
+        return UserRights.find_sessions_rights_masks(session, [session_token]).get(session_token)
+
+    @staticmethod
+    def find_sessions_rights_masks(
+        session: Session, session_tokens: List[str]
+    ) -> Dict[str, Tuple[str, int]]:
+        """ Finds the owners of many active sessions along with all of their rights.
+
+        Cached values are used when present. The rest are loaded with a single query.
+        ---
+        Parameters:
+            - session: The session object.
+            - session_tokens: The list of session tokens.
+        Returns:
+            A dictionary mapping the tokens of the active sessions found to a tuple with
+            the user name string and the integer rights bitmask. Tokens not matching an
+            active session are left out.
+        """
+        session_cache = session.info.get('session_cache')
+        rights_cache = session.info.get('rights_cache')
+        found: Dict[str, Tuple[str, int]] = {}
+        missing: List[str] = []
+        for session_token in set(session_tokens):
+            username: Optional[str] = None
+            mask: Optional[int] = None
+            if session_cache is not None:
+                username = session_cache.get(session_token)
+            if username is not None and rights_cache is not None:
+                mask = rights_cache.get(username)
+            if username is not None and mask is not None:
+                found[session_token] = (username, mask)
+            else:
+                missing.append(session_token)
+        if not missing:
+            return found
+
+        session_generation: Optional[int] = None
+        if session_cache is not None:
+            session_generation = session_cache.get_generation()
+        rights_generation: Optional[int] = None
+        if rights_cache is not None:
+            rights_generation = rights_cache.get_generation()
+        owners, masks = UserRights.__query_sessions_rights_masks(session, missing)
+        for session_token, username in owners.items():
+            found[session_token] = (username, masks[username])
+            if session_cache is not None:
+                session_cache.put(session_token, username, session_generation)
+        if rights_cache is not None:
+            for username, mask in masks.items():
+                rights_cache.put(username, mask, rights_generation)
+        return found
+
+    @staticmethod
+    def apply_changes(
+        session: Session, changes: List[Tuple[str, UserRightName, bool]]
+    ) -> List[str]:
+        """ Grants and revokes many rights in a single transaction.
+
+        Changes are applied as if they were made one after another, but only the
+        net difference is written: a single insert of the granted rights (ignoring
+        those granted concurrently) and a single batched delete of the revoked ones.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - changes: The list of (user name, right, grant) tuples; grant is True to
+                       grant the right, or False to revoke it.
+        Returns:
+            The list of outcomes, one per change and in the same order: `granted`,
+            `revoked`, `unchanged` (if the user already had, or lacked, the right),
+            or `user_not_found`.
+        """
+        users: Table = User.get_table()
+        rights: Table = UserRight.get_table()
+        usernames: List[str] = list({username for username, _, _ in changes})
+        try:
+            existing_users: Set[str] = {row[0] for row in session.execute(
+                select([users.c.username]).where(users.c.username.in_(usernames))
+            )}
+            initial: Set[Tuple[str, UserRightName]] = {
+                (row[0], row[1]) for row in session.execute(
+                    select([rights.c.username, rights.c.right]).where(
+                        rights.c.username.in_(usernames)
+                    )
+                )
+            }
+            final: Set[Tuple[str, UserRightName]] = set(initial)
+            outcomes: List[str] = []
+            for username, right, grant in changes:
+                if username not in existing_users:
+                    outcomes.append('user_not_found')
+                elif grant == ((username, right) in final):
+                    outcomes.append('unchanged')
+                elif grant:
+                    final.add((username, right))
+                    outcomes.append('granted')
+                else:
+                    final.remove((username, right))
+                    outcomes.append('revoked')
+            granted: List[Dict] = [
+                {'username': username, 'right': right} for username, right in final - initial
+            ]
+            revoked: List[Dict] = [
+                {'revoked_username': username, 'revoked_right': right}
+                for username, right in initial - final
+            ]
+            if granted:
+                session.execute(UserRights.__insert_ignoring_existing(session, rights), granted)
+            if revoked:
+                session.execute(rights.delete().where(and_(
+                    rights.c.username == bindparam('revoked_username'),
+                    rights.c.right == bindparam('revoked_right')
+                )), revoked)
+            changed: List[str] = list({username for username, _ in (final ^ initial)})
+            if changed:
+                UserRights.__increase_rights_versions(session, changed)
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        for username in changed:
+            UserRights.evict_cached_rights(session, username)
+        return outcomes
+
+    @staticmethod
+    def __insert_ignoring_existing(session: Session, rights: Table):
+        """ Builds an insert statement of user rights that skips the already granted ones.
+        ---
+        Parameters:
+            - session: The session object.
+            - rights: The user rights table.
+        Returns:
+            The insert statement.
+        """
+        dialect: str = session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            # Importing the dialect is slow, and only needed when connected to it
+            # pylint: disable=import-outside-toplevel
+            from sqlalchemy.dialects import postgresql  # type: ignore
+            return postgresql.insert(rights).on_conflict_do_nothing()
+        if dialect == 'sqlite':
+            return rights.insert().prefix_with('OR IGNORE')
+        if dialect == 'mysql':
+            return rights.insert().prefix_with('IGNORE')
+        return rights.insert()
+
+    @staticmethod
+    def evict_cached_rights(session: Session, username: str) -> None:
+        """ Removes the rights of a user from the rights cache, if cached, and reads
+        them from the primary database for a while, as they are about to change.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+        """
+        rights_cache = session.info.get('rights_cache')
+        if rights_cache is not None:
+            rights_cache.invalidate(username)
+        read_replica = session.info.get('read_replica')
+        if read_replica is not None:
+            read_replica.mark_written(username)
+
+    @staticmethod
+    def __increase_rights_versions(session: Session, usernames: List[str]) -> None:
+        """ Increases the version of the rights of the given users, within the ongoing transaction.
+        ---
+        Parameters:
+            - session: The session object.
+            - usernames: The list of user name strings.
+        """
+        users: Table = User.get_table()
+        session.execute(users.update().where(users.c.username.in_(usernames)).values(
+            rights_version=users.c.rights_version + 1
+        ))
+
+    @staticmethod
+    def __query_sessions_rights_masks(
+        session: Session, session_tokens: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """ Loads the owners of many active sessions and their rights from the database.
+
+        They are read from the read replica, if any, except for the sessions and
+        users written recently by this process, and (if so configured) the
+        sessions not found in the replica, which are read from the primary.
+        ---
+        Parameters:
+            - session: The session object.
+            - session_tokens: The list of session tokens.
+        Returns:
+            A tuple with a dictionary mapping the tokens of the active sessions to their
+            owners' user names, and a dictionary mapping these to their rights bitmasks.
+        """
+        read_replica: Optional[ReadReplica] = session.info.get('read_replica')
+        if read_replica is None:
+            return UserRights.__select_sessions_rights_masks(session.connection(), session_tokens)
+        replica_tokens: List[str] = [
+            session_token for session_token in session_tokens
+            if not read_replica.was_written(session_token)
+        ]
+        owners: Dict[str, str] = {}
+        masks: Dict[str, int] = {}
+        if replica_tokens:
+            with read_replica.connect() as connection:
+                owners, masks = UserRights.__select_sessions_rights_masks(
+                    connection, replica_tokens
+                )
+        stale: Set[str] = {username for username in masks if read_replica.was_written(username)}
+        primary_tokens: List[str] = [
+            session_token for session_token in session_tokens
+            if owners.get(session_token) in stale or (
+                session_token not in owners and (
+                    read_replica.falls_back_on_miss()
+                    or read_replica.was_written(session_token)
+                )
+            )
+        ]
+        owners = {
+            session_token: username for session_token, username in owners.items()
+            if username not in stale
+        }
+        masks = {username: mask for username, mask in masks.items() if username not in stale}
+        if primary_tokens:
+            primary_owners, primary_masks = UserRights.__select_sessions_rights_masks(
+                session.connection(), primary_tokens
+            )
+            owners.update(primary_owners)
+            masks.update(primary_masks)
+        return (owners, masks)
+
+    @staticmethod
+    def __select_sessions_rights_masks(
+        connection: Connection, session_tokens: List[str]
+    ) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """ Loads the owners of many active sessions and their rights with a single query.
+        ---
+        Parameters:
+            - connection: The connection to the database.
+            - session_tokens: The list of session tokens.
+        Returns:
+            A tuple with a dictionary mapping the tokens of the active sessions to their
+            owners' user names, and a dictionary mapping these to their rights bitmasks.
+        """
+        sessions: Table = UserSession.get_table()
+        rights: Table = UserRight.get_table()
+        query = select([sessions.c.token, sessions.c.username, rights.c.right]).select_from(
+            sessions.outerjoin(rights, rights.c.username == sessions.c.username)
+        ).where(and_(
+            sessions.c.token.in_(session_tokens),
+            sessions.c.active == True  # pylint: disable=singleton-comparison
+        ))
+        owners: Dict[str, str] = {}
+        masks: Dict[str, int] = {}
+        for session_token, username, right in connection.execute(query):
+            owners[session_token] = username
+            masks.setdefault(username, 0)
+            if right is not None:
+                masks[username] |= UserRightMask.of(right)
+        return (owners, masks)
+
+    @staticmethod
+    def __query_rights_mask(session: Session, username: str) -> int:
+        """ Loads all the rights of a user from the database.
+        ---
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+        Returns:
+            An integer bitmask with the rights of the user.
+        """
+        return UserRightMask.from_rights(Lookups.find_rights(session, username, replica=True))
@@ -1,12 +1,12 @@
 """ Users class module.
 """
 
-import hashlib
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import Table, select  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
-from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2021auth.data.db.results import User
-from dms2021auth.data.db.exc import UserExistsError
+from dms2021auth.data.db.exc import UserExistsError, UserNotFoundError
 
 
 class Users():
@@ -41,32 +41,103 @@ class Users():
                 ) from ex
 
     @staticmethod
-    def user_exists(session: Session, username: str, password_hash: str) -> bool:
-        """ Determines whether a user exists or not.
+    def update_password_hash(session: Session, username: str, password_hash: str) -> None:
+        """ Replaces the stored password hash of a user.
         ---
+        Note:
+            Any existing transaction will be committed.
         Parameters:
             - session: The session object.
             - username: The user name string.
-            - password_hash: The password hash string.
+            - password_hash: The new password hash string.
+        Throws:
+            - UserNotFoundError: If the user does not exist.
+        """
+        try:
+            updated: int = session.query(User).filter_by(username=username).update(
+                {'password': password_hash}, synchronize_session='fetch'
+            )
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        if updated == 0:
+            raise UserNotFoundError()
+
+    @staticmethod
+    def find_existing_usernames(session: Session, usernames: List[str]) -> Set[str]:
+        """ Finds which of the given user names already exist.
+        ---
+        Parameters:
+            - session: The session object.
+            - usernames: The list of user name strings to look for.
         Returns:
-            True if a user with the given credentials exists; false otherwise.
+            The set of user name strings that exist.
         """
+        if not usernames:
+            return set()
+        table: Table = User.get_table()
+        query = select([table.c.username]).where(table.c.username.in_(usernames))
+        return {row[0] for row in session.execute(query)}
+
+    @staticmethod
+    def create_many(session: Session, users: List[Tuple[str, str]]) -> Set[str]:
+        """ Creates several user records in a single transaction, skipping the existing ones.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - users: The list of (user name, password hash) tuples. User names must not be
+                     empty, and a user name appearing more than once is created only once.
+        Returns:
+            The set of user name strings that were created.
+        """
+        existing: Set[str] = Users.find_existing_usernames(
+            session, [username for username, _ in users]
+        )
+        rows: Dict[str, Dict[str, str]] = {}
+        for username, password_hash in users:
+            if username not in existing and username not in rows:
+                rows[username] = {'username': username, 'password': password_hash}
+        if not rows:
+            return set()
         try:
-            query = session.query(User).filter_by(username=username, password=password_hash)
-            query.one()
-        except NoResultFound:
-            return False
-        return True
+            session.execute(User.get_table().insert(), list(rows.values()))
+            session.commit()
+            return set(rows.keys())
+        except IntegrityError:
+            # Some were created concurrently; fall back to creating them one by one
+            session.rollback()
+        created: Set[str] = set()
+        for row in rows.values():
+            try:
+                Users.create(session, row['username'], row['password'])
+                created.add(row['username'])
+            except UserExistsError:
+                session.rollback()
+        return created
 
     @staticmethod
-    def hash_password(password: str, suffix: str = '', salt: str = '') -> str:
-        """ A password hashing function compatible with the schema.
+    def iter_usernames(
+        session: Session, after: Optional[str] = None, limit: Optional[int] = None
+    ) -> Iterator[str]:
+        """ Iterates over the user names, in ascending order.
+
+        Rows are read from the database as the iterator is advanced.
         ---
         Parameters:
-            - password: The password string.
-            - suffix: An optional suffix string.
-            - salt: An optional salt string.
+            - session: The session object.
+            - after: If set, only the user names following it are retrieved.
+            - limit: If set, the maximum number of user names retrieved.
         Returns:
-            A string with the hashed password.
+            An iterator of user name strings.
         """
-        return hashlib.sha256(bytes(password + suffix + salt, 'utf-8')).hexdigest()
+        table: Table = User.get_table()
+        query = select([table.c.username]).order_by(table.c.username)
+        if after is not None:
+            query = query.where(table.c.username > after)
+        if limit is not None:
+            query = query.limit(limit)
+        for row in session.execute(query.execution_options(stream_results=True)):
+            yield row[0]
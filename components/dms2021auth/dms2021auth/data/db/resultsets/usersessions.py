@@ -2,12 +2,15 @@
 """
 
 import uuid
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import Table, and_, select  # type: ignore
+from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2021auth.data.db.exc import SessionNotFoundError
-from dms2021auth.data.db.results import UserSession
+from dms2021auth.data.db.results import UserSession, SessionRow
+from dms2021auth.data.db.resultsets.lookups import Lookups
 
 
 class UserSessions():
@@ -42,6 +45,75 @@ class UserSessions():
             session.rollback()
             raise ex
 
+    @staticmethod
+    def open_session_for_user(
+        session: Session, username: str, attempts: int = 3
+    ) -> Tuple[str, bool]:
+        """ Gets the active session of a user, creating it if there is none.
+
+        A user can only have one active session (enforced by a unique index), so
+        when a concurrent call creates it first, the insertion fails and the
+        session created by the other call is returned instead.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - username: The user name string.
+            - attempts: The maximum number of insertions tried.
+        Returns:
+            A tuple with the token of the active session and whether it was created
+            by this call.
+        Throws:
+            - IntegrityError: If the session could not be created nor found
+                              (e.g., the user does not exist).
+        """
+        user_session: Optional[SessionRow] = Lookups.find_active_session_for_user(
+            session, username
+        )
+        while user_session is None:
+            attempts -= 1
+            try:
+                token: str = UserSessions.create(session, username).token
+            except IntegrityError:
+                # The rollback ended the transaction, so the winner's session is visible
+                user_session = Lookups.find_active_session_for_user(session, username)
+                if user_session is None and attempts <= 0:
+                    raise
+                continue
+            # The replica may lag, so the new session is read from the primary for a while
+            read_replica = session.info.get('read_replica')
+            if read_replica is not None:
+                read_replica.mark_written(token)
+            return (token, True)
+        return (user_session.token, False)
+
+    @staticmethod
+    def touch_session(session: Session, session_token: str, timestamp: datetime) -> None:
+        """ Updates the update time of a session.
+        ---
+        Note:
+            If the session has a touch buffer, the update is buffered and written
+            later on. Otherwise, any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - session_token: The session token.
+            - timestamp: A datetime with the timestamp to use.
+        """
+        touch_buffer = session.info.get('touch_buffer')
+        if touch_buffer is not None:
+            touch_buffer.record(session_token, timestamp)
+            return
+        table: Table = UserSession.get_table()
+        try:
+            session.execute(table.update().where(table.c.token == session_token).values(
+                updated=timestamp
+            ))
+            session.commit()
+        except:
+            session.rollback()
+            raise
+
     @staticmethod
     def find_session_for_user(session: Session, username: str) -> Optional[UserSession]:
         """ Attempts to find an active session for a given user.
@@ -79,6 +151,65 @@ class UserSessions():
         except NoResultFound:
             return None
 
+    @staticmethod
+    def find_active_session_owner(session: Session, session_token: str) -> Optional[str]:
+        """ Finds the owner of an active session, trying the session cache first and
+        then the read replica, if any.
+        ---
+        Parameters:
+            - session: The session object.
+            - session_token: The session token.
+        Returns:
+            The user name string, or None if no matching active session was found.
+        """
+        session_cache = session.info.get('session_cache')
+        user_session: Optional[SessionRow]
+        if session_cache is None:
+            user_session = Lookups.find_active_session(session, session_token, replica=True)
+            return None if user_session is None else user_session.username
+        username: Optional[str] = session_cache.get(session_token)
+        if username is not None:
+            return username
+        generation: int = session_cache.get_generation()
+        user_session = Lookups.find_active_session(session, session_token, replica=True)
+        if user_session is None:
+            return None
+        session_cache.put(session_token, user_session.username, generation)
+        return user_session.username
+
+    @staticmethod
+    def get_active_session_owner(session: Session, session_token: str) -> str:
+        """ Gets the owner of the active session identified by the given token.
+        ---
+        Parameters:
+            - session: The session object.
+            - session_token: The token identifying the session.
+        Returns:
+            The user name string.
+        Throws:
+            - SessionNotFound: When the provided session was not found or is inactive.
+        """
+        username: Optional[str] = UserSessions.find_active_session_owner(session, session_token)
+        if username is None:
+            raise SessionNotFoundError()
+        return username
+
+    @staticmethod
+    def evict_cached_session(session: Session, session_token: str) -> None:
+        """ Removes a token from the session cache, if cached, and reads it from the
+        primary database for a while, as the session is about to change.
+        ---
+        Parameters:
+            - session: The session object.
+            - session_token: The session token.
+        """
+        session_cache = session.info.get('session_cache')
+        if session_cache is not None:
+            session_cache.invalidate(session_token)
+        read_replica = session.info.get('read_replica')
+        if read_replica is not None:
+            read_replica.mark_written(session_token)
+
     @staticmethod
     def get_active_user_session(session: Session, session_token: str) -> UserSession:
         """ Gets the active user session identified by the given token.
@@ -96,3 +227,131 @@ class UserSessions():
         if user_session is None:
             raise SessionNotFoundError()
         return user_session
+
+    @staticmethod
+    def expire_idle_sessions(
+        session: Session, idle_since: datetime, batch_size: int
+    ) -> Tuple[int, int]:
+        """ Deactivates the active sessions not updated since a given time.
+
+        Sessions are processed in batches, each one committed on its own, so the
+        table is never locked for long.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - idle_since: A datetime; active sessions last updated before it are deactivated.
+            - batch_size: The maximum number of sessions deactivated per transaction.
+        Returns:
+            A tuple with the number of sessions scanned and deactivated.
+        """
+        table: Table = UserSession.get_table()
+        scanned: int = 0
+        expired: int = 0
+        while True:
+            try:
+                tokens: List[str] = [row[0] for row in session.execute(
+                    select([table.c.token]).where(and_(
+                        table.c.active == True,  # pylint: disable=singleton-comparison
+                        table.c.updated < idle_since
+                    )).limit(batch_size)
+                )]
+                if tokens:
+                    # Sessions updated meanwhile are no longer idle and are left alone
+                    result = session.execute(table.update().where(and_(
+                        table.c.token.in_(tokens),
+                        table.c.active == True,  # pylint: disable=singleton-comparison
+                        table.c.updated < idle_since
+                    )).values(active=False, active_username=None, updated=datetime.now()))
+                    expired += result.rowcount
+                session.commit()
+            except Exception as ex:
+                session.rollback()
+                raise ex
+            for token in tokens:
+                UserSessions.evict_cached_session(session, token)
+            scanned += len(tokens)
+            if len(tokens) < batch_size:
+                return (scanned, expired)
+
+    @staticmethod
+    def purge_inactive_sessions(
+        session: Session, inactive_since: datetime, batch_size: int
+    ) -> Tuple[int, int]:
+        """ Deletes the inactive sessions not updated since a given time.
+
+        Sessions are deleted in batches, each one committed on its own, so the
+        table is never locked for long.
+        ---
+        Note:
+            Any existing transaction will be committed.
+        Parameters:
+            - session: The session object.
+            - inactive_since: A datetime; inactive sessions last updated before it are deleted.
+            - batch_size: The maximum number of sessions deleted per transaction.
+        Returns:
+            A tuple with the number of sessions scanned and deleted.
+        """
+        table: Table = UserSession.get_table()
+        scanned: int = 0
+        deleted: int = 0
+        while True:
+            try:
+                tokens: List[str] = [row[0] for row in session.execute(
+                    select([table.c.token]).where(and_(
+                        table.c.active == False,  # pylint: disable=singleton-comparison
+                        table.c.updated < inactive_since
+                    )).limit(batch_size)
+                )]
+                if tokens:
+                    result = session.execute(table.delete().where(and_(
+                        table.c.token.in_(tokens),
+                        table.c.active == False  # pylint: disable=singleton-comparison
+                    )))
+                    deleted += result.rowcount
+                session.commit()
+            except Exception as ex:
+                session.rollback()
+                raise ex
+            scanned += len(tokens)
+            if len(tokens) < batch_size:
+                return (scanned, deleted)
+
+    @staticmethod
+    def iter_sessions(
+        session: Session,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        username: Optional[str] = None,
+        active_only: bool = False
+    ) -> Iterator[Tuple[str, str, bool, datetime, datetime]]:
+        """ Iterates over the user sessions, in ascending order of their keys
+        (see `UserSession.key_of`).
+
+        Rows are read from the database as the iterator is advanced.
+        ---
+        Parameters:
+            - session: The session object.
+            - after: If set, only the sessions whose key follows it are retrieved.
+            - limit: If set, the maximum number of sessions retrieved.
+            - username: If set, only the sessions of this user are retrieved.
+            - active_only: Whether only active sessions should be retrieved or not (default).
+        Returns:
+            An iterator of (key, user name, active, created, updated) tuples.
+        """
+        table: Table = UserSession.get_table()
+        query = select([
+            table.c.session_key, table.c.username, table.c.active, table.c.created,
+            table.c.updated
+        ]).order_by(table.c.session_key)
+        if after is not None:
+            query = query.where(table.c.session_key > after)
+        if username is not None:
+            query = query.where(table.c.username == username)
+        if active_only:
+            query = query.where(table.c.active == True)  # pylint: disable=singleton-comparison
+        if limit is not None:
+            query = query.limit(limit)
+        for row in session.execute(query.execution_options(stream_results=True)):
+            yield (row[0], row[1], row[2], row[3], row[4])
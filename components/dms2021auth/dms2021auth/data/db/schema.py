@@ -1,36 +1,39 @@
 """ Schema class module.
 """
 
-from sqlalchemy import create_engine, event  # type: ignore
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Union
+from sqlalchemy import LargeBinary, MetaData, create_engine, event, inspect  # type: ignore
 from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.engine.url import make_url, URL  # type: ignore
 from sqlalchemy.ext.declarative import declarative_base  # type: ignore
-from sqlalchemy.orm import sessionmaker  # type: ignore
+from sqlalchemy.orm import sessionmaker, scoped_session  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2021auth.data.config import AuthConfiguration
-from dms2021auth.data.db.results import User, UserSession, UserRight
+from dms2021auth.data.cache import TtlLruCache
+from dms2021auth.data.db.results import User, UserSession, UserRight, RevokedToken
+from dms2021auth.data.db.migrations import Migrator
+from dms2021auth.data.db.queryprofiler import QueryProfiler
+from dms2021auth.data.db.readreplica import ReadReplica
+from dms2021auth.data.db.sessiontouchbuffer import SessionTouchBuffer
+from dms2021auth.data.db.timedqueuepool import TimedQueuePool
+from dms2021auth.data.db.types import StorageLayout
 
 
-# Required for SQLite to enforce FK integrity when supported
-@event.listens_for(Engine, 'connect')
-def set_sqlite_pragma(dbapi_connection, connection_record):  # pylint: disable=unused-argument
-    """ Sets the SQLite foreign keys enforcement pragma on connection.
-    ---
-    Parameters:
-        - dbapi_connection: The connection to the database API.
-    """
-    cursor = dbapi_connection.cursor()
-    cursor.execute('PRAGMA foreign_keys = ON;')
-    cursor.close()
-
-
-class Schema():
+class Schema():  # pylint: disable=too-many-instance-attributes
     """ Class responsible of the schema initialization and session generation.
     """
 
     def __init__(self, config: AuthConfiguration):
         """ Constructor method.
 
-        Initializes the schema, deploying it if necessary.
+        Initializes the schema, deploying it and applying any pending migration if necessary
+        (that is, unless the database is stamped with the latest schema version).
+
+        If a read connection string is configured, the hot lookups are served by that
+        database (see `ReadReplica`), which is never written to.
         ---
         Parameters:
             - config: The `AuthConfiguration` instance with the schema connection parameters.
@@ -41,18 +44,362 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
-        self.__session_maker = sessionmaker(bind=self.__create_engine)
+        url: URL = make_url(db_connection_string)
+        self.__create_engine = create_engine(url, **Schema.__engine_arguments(config, url))
+        if url.get_backend_name() == 'sqlite':
+            self.__sqlite_pragmas: List[str] = Schema.__sqlite_pragma_statements(config)
+            event.listen(self.__create_engine, 'connect', self.__set_sqlite_pragmas)
+        self.__read_engine: Optional[Engine] = None
+        read_connection_string: Optional[str] = config.get_db_read_connection_string()
+        if read_connection_string is not None:
+            read_url: URL = make_url(read_connection_string)
+            self.__read_engine = create_engine(
+                read_url, **Schema.__engine_arguments(config, read_url)
+            )
+            if read_url.get_backend_name() == 'sqlite':
+                self.__sqlite_read_pragmas: List[str] = Schema.__sqlite_pragma_statements(
+                    config, read_only=True
+                )
+                event.listen(self.__read_engine, 'connect', self.__set_sqlite_read_pragmas)
+
+        Schema.__map_entities(
+            self.__declarative_base.metadata, config.get_compact_storage_flag(),
+            url.get_backend_name()
+        )
+        migrator: Migrator = Migrator(self.__create_engine, self.__declarative_base.metadata)
+        # Deploying checks every table, so it is skipped if the stamped version is the latest
+        if not migrator.is_current():
+            self.__declarative_base.metadata.create_all(self.__create_engine)
+            migrator.upgrade()
+        Schema.__check_storage_layout(self.__create_engine, config.get_compact_storage_flag())
+        # The tables may be moved to another layout while the service runs (see
+        # `StorageCompactor`); then, requests are refused instead of writing rows
+        # in the layout they left
+        self.__compact: bool = config.get_compact_storage_flag()
+        self.__layout_check_interval: float = config.get_storage_layout_check_interval()
+        self.__next_layout_check: float = time.monotonic() + self.__layout_check_interval
+        self.__layout_lock: threading.Lock = threading.Lock()
+        self.__layout_changed: bool = False
+
+        # Attached once deployed, as it is about the statements serving the requests
+        self.__query_profiler: QueryProfiler = QueryProfiler(config, [
+            User.get_table().c.password, UserSession.get_table().c.token,
+            RevokedToken.get_table().c.session_id
+        ])
+        self.listen('before_cursor_execute', self.__query_profiler.before_execute)
+        self.listen('after_cursor_execute', self.__query_profiler.after_execute)
+
+        self.__session_cache: Optional[TtlLruCache] = None
+        if config.get_session_cache_capacity() > 0:
+            self.__session_cache = TtlLruCache(
+                config.get_session_cache_capacity(), config.get_session_cache_ttl()
+            )
+        self.__rights_cache: Optional[TtlLruCache] = None
+        if config.get_rights_cache_capacity() > 0:
+            self.__rights_cache = TtlLruCache(
+                config.get_rights_cache_capacity(), config.get_rights_cache_ttl()
+            )
+
+        self.__touch_buffer: Optional[SessionTouchBuffer] = None
+        if config.get_session_touch_flush_interval() > 0:
+            self.__touch_buffer = SessionTouchBuffer(
+                self.__create_engine, UserSession.get_table(),
+                config.get_session_touch_flush_interval(),
+                config.get_session_touch_max_entries(),
+                config.get_session_touch_max_staleness()
+            )
+        self.__read_replica: Optional[ReadReplica] = None
+        if self.__read_engine is not None:
+            self.__read_replica = ReadReplica(
+                self.__read_engine, config.get_read_replica_read_after_write(),
+                config.get_read_replica_capacity(), config.get_read_replica_fallback_flag()
+            )
+        # These are reachable from every session so the resultsets can use them
+        self.__session_maker = sessionmaker(bind=self.__create_engine, info={
+            'session_cache': self.__session_cache,
+            'rights_cache': self.__rights_cache,
+            'touch_buffer': self.__touch_buffer,
+            'read_replica': self.__read_replica
+        })
+        self.__scoped_session = scoped_session(self.__session_maker)
+
+    @staticmethod
+    def __map_entities(metadata: MetaData, compact: bool, dialect: str) -> None:
+        """ Maps every entity to its table, in the storage layout of the database.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+            - compact: Whether the compact layout is configured or not.
+            - dialect: The name of the database dialect.
+        """
+        StorageLayout.set_compact(metadata, compact)
+        StorageLayout.set_dialect(metadata, dialect)
+        User.map(metadata)
+        UserSession.map(metadata)
+        UserRight.map(metadata)
+        RevokedToken.map(metadata)
+
+    @staticmethod
+    def __check_storage_layout(engine: Engine, compact: bool) -> None:
+        """ Verifies that the database tables are in the configured storage layout.
+        ---
+        Parameters:
+            - engine: The engine connected to the database.
+            - compact: Whether the compact layout is configured or not.
+        Throws:
+            - RuntimeError: If the tables are in the other layout.
+        """
+        if Schema.__has_compact_tables(engine) != compact:
+            raise RuntimeError(
+                'The database tables are not in the ' + ('compact' if compact else 'default')
+                + ' storage layout; see `dms2021auth-compact-storage`.'
+            )
+
+    @staticmethod
+    def __has_compact_tables(bind) -> bool:
+        """ Determines whether the database tables are in the compact storage layout.
+        ---
+        Parameters:
+            - bind: The engine or connection to inspect.
+        Returns:
+            True if they are; false otherwise.
+        """
+        token_type = next(
+            column['type'] for column in inspect(bind).get_columns('user_sessions')
+            if column['name'] == 'token'
+        )
+        return isinstance(token_type, LargeBinary)
+
+    def __check_layout_unchanged(self, session: Session) -> None:
+        """ Verifies that the database tables are still in the configured storage layout.
+
+        Only one thread checks it at a time; the rest go on meanwhile.
+        ---
+        Parameters:
+            - session: The session whose connection is used.
+        """
+        if not self.__layout_lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return
+        try:
+            self.__next_layout_check = time.monotonic() + self.__layout_check_interval
+            if Schema.__has_compact_tables(session.connection()) != self.__compact:
+                logging.getLogger(__name__).error(
+                    'The database tables were moved out of the %s storage layout; requests '
+                    'are refused until the service is restarted with the layout they are in',
+                    'compact' if self.__compact else 'default'
+                )
+                self.__layout_changed = True
+        finally:
+            self.__layout_lock.release()
+
+    @staticmethod
+    def __engine_arguments(config: AuthConfiguration, url: URL) -> Dict:
+        """ Builds the engine creation arguments for the configured pool.
+        ---
+        Parameters:
+            - config: The `AuthConfiguration` instance with the pool parameters.
+            - url: The parsed connection string of the database.
+        Returns:
+            A dictionary with the keyword arguments to pass to `create_engine`.
+        """
+        arguments: Dict = {}
+        if url.get_backend_name() == 'sqlite':
+            if url.database in (None, '', ':memory:'):
+                # In-memory databases live in a single connection; pooling does not apply
+                return arguments
+            # Pooled connections are checked out by whichever thread serves the request
+            arguments['connect_args'] = {'check_same_thread': False}
+        arguments['poolclass'] = TimedQueuePool
+        arguments['pool_size'] = config.get_db_pool_size()
+        arguments['max_overflow'] = config.get_db_pool_max_overflow()
+        arguments['pool_recycle'] = config.get_db_pool_recycle()
+        arguments['pool_timeout'] = config.get_db_pool_timeout()
+        return arguments
+
+    @staticmethod
+    def __sqlite_pragma_statements(
+        config: AuthConfiguration, read_only: bool = False
+    ) -> List[str]:
+        """ Builds the pragma statements run on every new SQLite connection.
+        ---
+        Parameters:
+            - config: The `AuthConfiguration` instance with the SQLite profile.
+            - read_only: Whether the connections only read (i.e., those to the read
+                         replica) or not (default). The journal mode is left to the
+                         primary connections, and writing is forbidden.
+        Returns:
+            A list of PRAGMA statement strings.
+        """
+        # Required for SQLite to enforce FK integrity when supported
+        statements: List[str] = ['PRAGMA foreign_keys = ON;']
+        if read_only:
+            statements = ['PRAGMA query_only = ON;']
+        # The busy timeout goes first, as switching the journal mode may need a lock
+        pragmas = [
+            ('busy_timeout', config.get_sqlite_busy_timeout()),
+            ('journal_mode', None if read_only else config.get_sqlite_journal_mode()),
+            ('synchronous', None if read_only else config.get_sqlite_synchronous()),
+            ('cache_size', config.get_sqlite_cache_size()),
+            ('mmap_size', config.get_sqlite_mmap_size()),
+            ('temp_store', config.get_sqlite_temp_store())
+        ]
+        for name, value in pragmas:
+            if value is not None:
+                statements.append('PRAGMA ' + name + ' = ' + str(value) + ';')
+        return statements
+
+    def __set_sqlite_pragmas(
+        self, dbapi_connection, connection_record
+    ):  # pylint: disable=unused-argument
+        """ Applies the configured SQLite pragmas on connection.
+        ---
+        Parameters:
+            - dbapi_connection: The connection to the database API.
+        """
+        cursor = dbapi_connection.cursor()
+        for statement in self.__sqlite_pragmas:
+            cursor.execute(statement)
+        cursor.close()
 
-        User.map(self.__declarative_base.metadata)
-        UserSession.map(self.__declarative_base.metadata)
-        UserRight.map(self.__declarative_base.metadata)
-        self.__declarative_base.metadata.create_all(self.__create_engine)
+    def __set_sqlite_read_pragmas(
+        self, dbapi_connection, connection_record
+    ):  # pylint: disable=unused-argument
+        """ Applies the configured SQLite pragmas on connection to the read replica.
+        ---
+        Parameters:
+            - dbapi_connection: The connection to the database API.
+        """
+        cursor = dbapi_connection.cursor()
+        for statement in self.__sqlite_read_pragmas:
+            cursor.execute(statement)
+        cursor.close()
 
     def new_session(self) -> Session:
         """ Constructs a new session.
         ---
+        Note:
+            The caller owns the returned session and is responsible of closing it.
+            Request handlers should use `get_session` instead.
         Returns:
             A new `Session` object.
         """
         return self.__session_maker()
+
+    def get_session(self) -> Session:
+        """ Gets the session bound to the current scope (i.e., the current request thread).
+
+        The same session is returned on every call until `remove_session` is invoked.
+        ---
+        Returns:
+            The scoped `Session` object.
+        Throws:
+            - RuntimeError: If the database tables were moved to another storage layout
+                            while the service runs.
+        """
+        session: Session = self.__scoped_session()
+        if self.__layout_check_interval > 0 and not self.__layout_changed \
+                and time.monotonic() >= self.__next_layout_check:
+            self.__check_layout_unchanged(session)
+        if self.__layout_changed:
+            raise RuntimeError(
+                'The database tables are no longer in the configured storage layout.'
+            )
+        return session
+
+    def remove_session(self) -> None:
+        """ Closes and discards the session bound to the current scope, if any.
+
+        Its connection is returned to the pool. Must be called once the request ends.
+        """
+        self.__scoped_session.remove()
+
+    def get_session_cache(self) -> Optional[TtlLruCache]:
+        """ Gets the cache of active session tokens.
+        ---
+        Returns:
+            The TtlLruCache mapping active tokens to their owners, or None if disabled.
+        """
+        return self.__session_cache
+
+    def get_rights_cache(self) -> Optional[TtlLruCache]:
+        """ Gets the cache of per-user rights masks.
+        ---
+        Returns:
+            The TtlLruCache mapping user names to their rights masks, or None if disabled.
+        """
+        return self.__rights_cache
+
+    def get_query_profiler(self) -> QueryProfiler:
+        """ Gets the profiler of the database statements.
+        ---
+        Returns:
+            The QueryProfiler instance.
+        """
+        return self.__query_profiler
+
+    def get_read_replica(self) -> Optional[ReadReplica]:
+        """ Gets the read replica serving the hot lookups.
+        ---
+        Returns:
+            The ReadReplica instance, or None if every statement uses the primary database.
+        """
+        return self.__read_replica
+
+    def get_touch_buffer(self) -> Optional[SessionTouchBuffer]:
+        """ Gets the write-behind buffer of session update times.
+        ---
+        Returns:
+            The SessionTouchBuffer instance, or None if updates are written right away.
+        """
+        return self.__touch_buffer
+
+    def close(self) -> None:
+        """ Writes any buffered data and releases the database connections.
+
+        Must be called before the process exits.
+        """
+        if self.__touch_buffer is not None:
+            self.__touch_buffer.close()
+        self.release_connections()
+
+    def release_connections(self) -> None:
+        """ Closes the session bound to the current scope and every pooled connection.
+
+        New connections are opened on demand. Connections cannot be shared among
+        processes, so this must be called before forking any process that will use
+        the database (e.g., the prefork server workers).
+        """
+        self.__scoped_session.remove()
+        self.__create_engine.dispose()
+        if self.__read_replica is not None:
+            self.__read_replica.close()
+
+    def listen(self, identifier: str, function: Callable) -> None:
+        """ Registers a listener of the database engine events (of both the primary
+        database and the read replica, if any).
+        ---
+        Parameters:
+            - identifier: The event name (e.g., `after_cursor_execute`; see
+                          `sqlalchemy.events.ConnectionEvents`).
+            - function: The listener function.
+        """
+        event.listen(self.__create_engine, identifier, function)
+        if self.__read_engine is not None:
+            event.listen(self.__read_engine, identifier, function)
+
+    def get_pool_statistics(self) -> Dict[str, Union[int, float]]:
+        """ Gets the connection pool usage statistics.
+        ---
+        Returns:
+            A dictionary with the checkout/wait counters and the current pool occupancy.
+            It is empty if the engine does not use a pool that can be measured.
+        """
+        pool = self.__create_engine.pool
+        if not isinstance(pool, TimedQueuePool):
+            return {}
+        statistics: Dict[str, Union[int, float]] = pool.get_statistics().as_dict()
+        statistics['size'] = pool.size()
+        statistics['checked_in'] = pool.checkedin()
+        statistics['checked_out'] = pool.checkedout()
+        statistics['overflow'] = pool.overflow()
+        return statistics
@@ -0,0 +1,147 @@
+""" SessionTouchBuffer class module.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import Table, and_, bindparam  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+
+
+class SessionTouchBuffer():  # pylint: disable=too-many-instance-attributes
+    """ Write-behind buffer of user session update times.
+
+    Touches are kept in memory, coalesced per token, and written as a single
+    batched UPDATE by a background thread.
+    """
+
+    def __init__(
+        self, engine: Engine, table: Table, flush_interval: float,
+        max_entries: int, max_staleness: float
+    ):  # pylint: disable=too-many-arguments
+        """ Constructor method.
+
+        Initializes an empty buffer. The background thread is started on first use.
+        ---
+        Parameters:
+            - engine: The engine used to write the touches.
+            - table: The user sessions table.
+            - flush_interval: The seconds between periodic flushes.
+            - max_entries: The number of buffered tokens that triggers an early flush.
+            - max_staleness: The maximum seconds a touch may remain unwritten.
+        """
+        self.__engine: Engine = engine
+        # Never move a session update time backwards (e.g., if it was deactivated meanwhile)
+        self.__statement = table.update().where(and_(
+            table.c.token == bindparam('touched_token'),
+            table.c.updated < bindparam('touched_at')
+        )).values(updated=bindparam('touched_at'))
+        self.__flush_interval: float = flush_interval
+        self.__max_entries: int = max_entries
+        self.__max_staleness: float = max_staleness
+        self.__pending: Dict[str, datetime] = {}
+        self.__oldest: Optional[float] = None
+        self.__lock: threading.Lock = threading.Lock()
+        self.__flush_lock: threading.Lock = threading.Lock()
+        self.__wake_up: threading.Event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__closed: bool = False
+
+    def record(self, token: str, timestamp: datetime) -> None:
+        """ Records that a session was updated.
+
+        Once the buffer is closed, touches are written right away.
+        ---
+        Parameters:
+            - token: The session token.
+            - timestamp: A datetime with the update time.
+        """
+        write_now: bool = False
+        with self.__lock:
+            previous: Optional[datetime] = self.__pending.get(token)
+            if previous is None or previous < timestamp:
+                self.__pending[token] = timestamp
+            now: float = time.monotonic()
+            if self.__oldest is None:
+                self.__oldest = now
+            flush_now: bool = (
+                len(self.__pending) >= self.__max_entries
+                or now - self.__oldest >= self.__max_staleness
+            )
+            if self.__closed:
+                write_now = True
+            elif self.__thread is None:
+                self.__thread = threading.Thread(
+                    target=self.__run, name='session-touch-buffer', daemon=True
+                )
+                self.__thread.start()
+        if write_now:
+            self.flush()
+        elif flush_now:
+            self.__wake_up.set()
+
+    def flush(self) -> int:
+        """ Writes every buffered touch right away.
+        ---
+        Returns:
+            The number of sessions written.
+        """
+        with self.__flush_lock:
+            with self.__lock:
+                pending: Dict[str, datetime] = self.__pending
+                self.__pending = {}
+                self.__oldest = None
+            if not pending:
+                return 0
+            parameters: List[Dict] = [
+                {'touched_token': token, 'touched_at': timestamp}
+                for token, timestamp in pending.items()
+            ]
+            try:
+                with self.__engine.begin() as connection:
+                    connection.execute(self.__statement, parameters)
+            except:
+                self.__restore(pending)
+                raise
+            return len(parameters)
+
+    def close(self) -> None:
+        """ Stops the background thread and writes the remaining touches.
+        """
+        with self.__lock:
+            self.__closed = True
+            thread: Optional[threading.Thread] = self.__thread
+        self.__wake_up.set()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def __restore(self, pending: Dict[str, datetime]) -> None:
+        """ Puts back touches that could not be written, unless newer ones were recorded.
+        ---
+        Parameters:
+            - pending: The touches to restore.
+        """
+        with self.__lock:
+            for token, timestamp in pending.items():
+                if token not in self.__pending or self.__pending[token] < timestamp:
+                    self.__pending[token] = timestamp
+            if self.__pending and self.__oldest is None:
+                self.__oldest = time.monotonic()
+
+    def __run(self) -> None:
+        """ Background thread loop, flushing periodically or when woken up.
+        """
+        period: float = min(self.__flush_interval, self.__max_staleness)
+        while True:
+            self.__wake_up.wait(period)
+            self.__wake_up.clear()
+            with self.__lock:
+                if self.__closed:
+                    return
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                # Touches were restored; they will be retried on the next flush
+                pass
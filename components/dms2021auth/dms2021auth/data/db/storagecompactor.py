@@ -0,0 +1,299 @@
+""" StorageCompactor class module.
+"""
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Type
+from sqlalchemy import Column, MetaData, Table, LargeBinary, SmallInteger, String  # type: ignore
+from sqlalchemy import and_, func, inspect, select, type_coerce  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from sqlalchemy.sql.expression import ClauseElement  # type: ignore
+from dms2021core.data import UserRightName
+from dms2021auth.data.db.schema import Schema
+from dms2021auth.data.db.results import User, UserSession, UserRight, RevokedToken
+from dms2021auth.data.db.results.resultbase import ResultBase
+from dms2021auth.data.db.types import StorageLayout
+
+
+class StorageCompactor():
+    """ Class responsible of moving the tables of a running service to the compact
+    storage layout.
+
+    The sessions are copied to staging tables in short batches, each one in its
+    own transaction, while the service keeps using the current tables. Then the
+    sessions updated meanwhile are copied again, until few are left. Finally,
+    in a single transaction, the last changes, the rights and the revoked tokens
+    are copied and the staging tables replace the current ones.
+
+    Sessions deleted during the copy (i.e., purged by the session reaper) may
+    survive in the staging tables; they are inactive and will be purged again.
+
+    Once the tables are replaced, the service must be restarted with the
+    compact layout configured. Meanwhile, it refuses requests as soon as it
+    notices the change (see `storage_layout_check_interval`). The rows it
+    wrote in the default layout until then are converted afterwards.
+    """
+
+    STAGING_SUFFIX = '_compact'
+
+    def __init__(self, schema: Schema, batch_size: int, margin: float):
+        """ Constructor method.
+        ---
+        Parameters:
+            - schema: The schema of the database to move, in the default layout.
+            - batch_size: The number of rows copied per statement.
+            - margin: The seconds subtracted from the start of every copy to find
+                      the sessions updated meanwhile. Must exceed the time session
+                      updates can be buffered before being written.
+        """
+        self.__schema: Schema = schema
+        self.__batch_size: int = max(batch_size, 1)
+        self.__margin: timedelta = timedelta(seconds=margin)
+        self.__since: Optional[datetime] = None
+        self.__swapped_since: Optional[datetime] = None
+        dialect: Optional[str] = StorageLayout.get_dialect(UserSession.get_table().metadata)
+        compact: MetaData = MetaData()
+        StorageLayout.set_compact(compact, True)
+        StorageLayout.set_dialect(compact, dialect or '')
+        staging: MetaData = MetaData()
+        StorageLayout.set_compact(staging, True)
+        StorageLayout.set_dialect(staging, dialect or '')
+        # Referenced by the foreign keys of the staging tables
+        User.define_table(compact).tometadata(staging)
+        self.__compact: Dict[str, Table] = {
+            result_class.get_table().name: result_class.define_table(compact)
+            for result_class in (UserSession, UserRight, RevokedToken)
+        }
+        self.__staging: Dict[str, Table] = {
+            name: table.tometadata(staging, name=name + StorageCompactor.STAGING_SUFFIX)
+            for name, table in self.__compact.items()
+        }
+
+    def is_compact(self) -> bool:
+        """ Determines whether the database tables are already in the compact layout.
+        ---
+        Returns:
+            True if they are; false otherwise.
+        """
+        session: Session = self.__schema.new_session()
+        try:
+            return any(
+                column['name'] == 'token' and isinstance(column['type'], LargeBinary)
+                for column in inspect(session.connection()).get_columns('user_sessions')
+            )
+        finally:
+            session.close()
+
+    def copy(self, progress: Optional[Callable[[str, int], None]] = None) -> int:
+        """ Copies the sessions to the staging tables, which are created anew.
+
+        Sessions updated during the copy are copied again until a pass copies
+        less than a batch of them.
+        ---
+        Parameters:
+            - progress: If set, a function called after every pass with its name
+                        and the number of sessions copied.
+        Returns:
+            The number of sessions copied, counting those copied more than once.
+        """
+        session: Session = self.__schema.new_session()
+        try:
+            connection = session.connection()
+            for table in self.__staging.values():
+                table.drop(connection, checkfirst=True)
+                table.create(connection)
+            session.commit()
+            self.__since = datetime.now() - self.__margin
+            copied: int = self.__copy_sessions(session, None)
+            if progress is not None:
+                progress('copy', copied)
+            while True:
+                since: datetime = self.__since
+                self.__since = datetime.now() - self.__margin
+                changed: int = self.__copy_sessions(session, since)
+                copied += changed
+                if progress is not None:
+                    progress('catch-up', changed)
+                if changed < self.__batch_size:
+                    return copied
+        except:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def swap(self) -> None:
+        """ Copies the last changes, the rights and the revoked tokens, and replaces
+        the current tables with the staging ones, in a single transaction.
+
+        Must be called after `copy`.
+        """
+        if self.__since is None:
+            raise RuntimeError('The sessions must be copied first.')
+        swapped_since: datetime = datetime.now() - self.__margin
+        session: Session = self.__schema.new_session()
+        try:
+            self.__copy_sessions(session, self.__since, commit=False)
+            for name in ('user_rights', 'revoked_tokens'):
+                self.__copy_table(session, name)
+            preparer = session.get_bind().dialect.identifier_preparer
+            for name, table in self.__staging.items():
+                session.execute('DROP TABLE ' + preparer.quote(name))
+                session.execute(
+                    'ALTER TABLE ' + preparer.quote(table.name) + ' RENAME TO '
+                    + preparer.quote(name)
+                )
+            session.commit()
+            self.__swapped_since = swapped_since
+        except:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def convert(self) -> int:
+        """ Converts the rows written in the default layout after the tables were replaced
+        (i.e., by services yet to notice it) to the compact layout, in a single transaction.
+
+        Must be called after `swap`, once every service refuses requests or runs with
+        the compact layout.
+        ---
+        Returns:
+            The number of rows converted.
+        """
+        if self.__swapped_since is None:
+            raise RuntimeError('The tables must be replaced first.')
+        sessions: Table = self.__compact['user_sessions']
+        revoked: Table = self.__compact['revoked_tokens']
+        rights: Table = self.__compact['user_rights']
+        session: Session = self.__schema.new_session()
+        try:
+            # Tokens stored as strings take more than 16 bytes; the rest of the sessions
+            # were not written since the tables were replaced
+            converted: int = self.__convert_tokens(session, sessions.c.token, and_(
+                sessions.c.updated >= self.__swapped_since,
+                func.length(sessions.c.token) != 16
+            ))
+            converted += self.__convert_tokens(
+                session, revoked.c.session_id, func.length(revoked.c.session_id) != 16
+            )
+            stored_right = type_coerce(rights.c.right, String)
+            for username, name in session.execute(select([
+                    rights.c.username, stored_right
+            ]).where(type_coerce(rights.c.right, SmallInteger).notin_(
+                [right.value for right in UserRightName]
+            ))).fetchall():
+                stored: ClauseElement = and_(rights.c.username == username, stored_right == name)
+                if session.execute(select([rights.c.username]).where(and_(
+                        rights.c.username == username, rights.c.right == UserRightName[name]
+                ))).first() is None:
+                    session.execute(
+                        rights.update().where(stored).values(right=UserRightName[name])
+                    )
+                else:
+                    session.execute(rights.delete().where(stored))
+                converted += 1
+            session.commit()
+            return converted
+        except:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @staticmethod
+    def __convert_tokens(session: Session, column: Column, condition: ClauseElement) -> int:
+        """ Converts the tokens stored as strings in a column to their bytes, within the
+        ongoing transaction.
+
+        A row is deleted instead if its token is also stored as bytes in another one.
+        ---
+        Parameters:
+            - session: The session object.
+            - column: The token column, in the compact layout.
+            - condition: The condition of the rows to convert.
+        Returns:
+            The number of rows converted.
+        """
+        table: Table = column.table
+        stored_token = type_coerce(column, String)
+        tokens: List[str] = [
+            row[0] for row in session.execute(select([stored_token]).where(condition))
+        ]
+        for token in tokens:
+            if session.execute(select([column]).where(column == token)).first() is None:
+                session.execute(
+                    table.update().where(stored_token == token).values({column.name: token})
+                )
+            else:
+                session.execute(table.delete().where(stored_token == token))
+        return len(tokens)
+
+    def __copy_sessions(
+        self, session: Session, since: Optional[datetime], commit: bool = True
+    ) -> int:
+        """ Copies the sessions, all or only those updated since a given time.
+        ---
+        Parameters:
+            - session: The session object.
+            - since: If set, only the sessions updated since this time are copied
+                     (replacing their previous copies).
+            - commit: Whether every batch is committed or not.
+        Returns:
+            The number of sessions copied.
+        """
+        source: Table = UserSession.get_table()
+        target: Table = self.__staging['user_sessions']
+        copied: int = 0
+        # Closed sessions go first, so fewer active sessions are found stale
+        for active in ((None,) if since is None else (False, True)):
+            after: Optional[str] = None
+            while True:
+                query = select([source]).order_by(source.c.token).limit(self.__batch_size)
+                if active is not None:
+                    query = query.where(and_(
+                        source.c.active == active, source.c.updated >= since
+                    ))
+                if after is not None:
+                    query = query.where(source.c.token > after)
+                rows: List[Dict] = [dict(row) for row in session.execute(query)]
+                if not rows:
+                    break
+                if since is not None:
+                    session.execute(target.delete().where(
+                        target.c.token.in_([row['token'] for row in rows])
+                    ))
+                usernames: List[str] = [row['username'] for row in rows if row['active']]
+                if usernames:
+                    # Any other active session of these users was closed meanwhile, and
+                    # its closing is yet to be copied
+                    session.execute(target.update().where(and_(
+                        target.c.username.in_(usernames),
+                        target.c.active == True  # pylint: disable=singleton-comparison
+                    )).values(active=False, active_username=None))
+                session.execute(target.insert(), rows)
+                if commit:
+                    session.commit()
+                copied += len(rows)
+                after = rows[-1]['token']
+        return copied
+
+    def __copy_table(self, session: Session, name: str) -> None:
+        """ Copies all the rows of a table to its staging table, within the ongoing
+        transaction.
+        ---
+        Parameters:
+            - session: The session object.
+            - name: The table name.
+        """
+        result_classes: Dict[str, Type[ResultBase]] = {
+            'user_rights': UserRight, 'revoked_tokens': RevokedToken
+        }
+        source: Table = result_classes[name].get_table()
+        target: Table = self.__staging[name]
+        session.execute(target.delete())
+        result = session.execute(select([source]))
+        while True:
+            rows: List[Dict] = [dict(row) for row in result.fetchmany(self.__batch_size)]
+            if not rows:
+                break
+            session.execute(target.insert(), rows)
@@ -0,0 +1,82 @@
+""" TimedQueuePool class module.
+"""
+
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError  # type: ignore
+from sqlalchemy.pool import QueuePool  # type: ignore
+from dms2021auth.data.db.poolstatistics import PoolStatistics
+
+
+class TimedQueuePool(QueuePool):
+    """ Queue pool that measures how long every checkout waits for a connection.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ Constructor method.
+
+        Accepts the same parameters as `QueuePool`.
+        """
+        super().__init__(*args, **kwargs)
+        self.__statistics: PoolStatistics = PoolStatistics()
+
+    def get_statistics(self) -> PoolStatistics:
+        """ Gets the statistics accumulated by this pool.
+        ---
+        Returns:
+            The PoolStatistics instance.
+        """
+        return self.__statistics
+
+    def set_statistics(self, statistics: PoolStatistics):
+        """ Sets the statistics object where the pool usage is accumulated.
+        ---
+        Parameters:
+            - statistics: The PoolStatistics instance to use.
+        """
+        self.__statistics = statistics
+
+    def connect(self):
+        """ Checks out a connection, timing the wait.
+        ---
+        Returns:
+            A pooled DBAPI connection proxy.
+        Throws:
+            - TimeoutError: If no connection became available in time.
+        """
+        start: float = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.__statistics.record_timeout(time.perf_counter() - start)
+            raise
+        self.__statistics.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def _do_return_conn(self, conn):
+        """ Returns a connection to the pool.
+        ---
+        Parameters:
+            - conn: The connection record being returned.
+        """
+        super()._do_return_conn(conn)
+        self.__statistics.record_checkin()
+
+    def _create_connection(self):
+        """ Creates a new DBAPI connection record.
+        ---
+        Returns:
+            The new connection record.
+        """
+        record = super()._create_connection()
+        self.__statistics.record_connect()
+        return record
+
+    def recreate(self):
+        """ Creates a new pool with the same configuration, keeping the statistics.
+        ---
+        Returns:
+            The new TimedQueuePool instance.
+        """
+        pool = super().recreate()
+        pool.set_statistics(self.__statistics)
+        return pool
@@ -0,0 +1,6 @@
+""" Authentication database column types.
+"""
+
+from .binarytoken import BinaryToken
+from .rightcode import RightCode
+from .storagelayout import StorageLayout
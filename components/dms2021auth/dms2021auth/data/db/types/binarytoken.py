@@ -0,0 +1,61 @@
+""" BinaryToken class module.
+"""
+
+from typing import Optional, Union
+from sqlalchemy import LargeBinary  # type: ignore
+from sqlalchemy.types import TypeDecorator  # type: ignore
+
+
+class BinaryToken(TypeDecorator):  # pylint: disable=abstract-method
+    """ Session token column type storing the 16 bytes of the token UUID instead
+    of its 36 characters.
+
+    Tokens keep being handled as strings. Strings that are not a token in its
+    canonical form are stored as their UTF-8 bytes, so they never match a token
+    (and are read back as they were). Tokens stored as strings (i.e., written
+    in the default layout by a service yet to be restarted after the tables
+    were moved; see `StorageCompactor`) are read as they are.
+    """
+
+    impl = LargeBinary(16)
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        """ Converts a token to its bytes.
+        ---
+        Parameters:
+            - value: The token string.
+            - dialect: The dialect in use.
+        Returns:
+            The bytes stored.
+        """
+        if value is None:
+            return None
+        # Only the canonical spelling is the token (e.g., not its upper case)
+        if len(value) == 36 and value[8] == value[13] == value[18] == value[23] == '-':
+            digits: str = value.replace('-', '')
+            if digits == digits.lower():
+                try:
+                    token: bytes = bytes.fromhex(digits)
+                except ValueError:
+                    token = b''
+                if len(token) == 16:
+                    return token
+        return value.encode('utf-8')
+
+    def process_result_value(
+        self, value: Optional[Union[bytes, str]], dialect
+    ) -> Optional[str]:
+        """ Converts the stored bytes back to the token.
+        ---
+        Parameters:
+            - value: The bytes stored (or the string, if written in the default layout).
+            - dialect: The dialect in use.
+        Returns:
+            The token string.
+        """
+        if value is None or isinstance(value, str):
+            return value
+        if len(value) != 16:
+            return bytes(value).decode('utf-8')
+        digits: str = bytes(value).hex()
+        return '-'.join((digits[:8], digits[8:12], digits[12:16], digits[16:20], digits[20:]))
@@ -0,0 +1,48 @@
+""" RightCode class module.
+"""
+
+from typing import Optional, Union
+from sqlalchemy import SmallInteger  # type: ignore
+from sqlalchemy.types import TypeDecorator  # type: ignore
+from dms2021core.data import UserRightName
+
+
+class RightCode(TypeDecorator):  # pylint: disable=abstract-method
+    """ User right column type storing the value of the right instead of its name.
+
+    Rights stored as their names (i.e., written in the default layout by a
+    service yet to be restarted after the tables were moved; see
+    `StorageCompactor`) are read as well.
+    """
+
+    impl = SmallInteger
+
+    def process_bind_param(self, value: Optional[UserRightName], dialect) -> Optional[int]:
+        """ Converts a right to its value.
+        ---
+        Parameters:
+            - value: The right.
+            - dialect: The dialect in use.
+        Returns:
+            The integer stored.
+        """
+        if value is None:
+            return None
+        return value.value
+
+    def process_result_value(
+        self, value: Optional[Union[int, str]], dialect
+    ) -> Optional[UserRightName]:
+        """ Converts the stored value back to the right.
+        ---
+        Parameters:
+            - value: The integer stored (or the name, if written in the default layout).
+            - dialect: The dialect in use.
+        Returns:
+            The right.
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return UserRightName[value]
+        return UserRightName(value)
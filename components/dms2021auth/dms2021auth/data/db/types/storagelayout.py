@@ -0,0 +1,121 @@
+""" StorageLayout class module.
+"""
+
+from typing import Optional
+from sqlalchemy import MetaData, String, Enum  # type: ignore
+from sqlalchemy.types import TypeEngine  # type: ignore
+from dms2021core.data import UserRightName
+from dms2021auth.data.db.types.binarytoken import BinaryToken
+from dms2021auth.data.db.types.rightcode import RightCode
+
+
+class StorageLayout():
+    """ Class responsible of the column types and index names of each storage layout.
+
+    The default layout stores session tokens as strings and rights as their
+    names. The compact one stores tokens as 16 bytes and rights as small
+    integers. The layout is recorded in the schema metadata, so the table
+    definitions can follow it.
+
+    The database dialect is recorded too, as only some dialects support
+    partial indexes.
+    """
+
+    # The dialects whose partial indexes are declared in the table definitions
+    PARTIAL_INDEX_DIALECTS = ('sqlite', 'postgresql')
+
+    @staticmethod
+    def set_compact(metadata: MetaData, compact: bool) -> None:
+        """ Sets the layout of the tables defined in a schema metadata.
+
+        Must be called before the tables are defined.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+            - compact: Whether the compact layout is used or not.
+        """
+        metadata.info['compact_storage'] = compact
+
+    @staticmethod
+    def is_compact(metadata: MetaData) -> bool:
+        """ Determines whether a schema metadata uses the compact layout.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+        Returns:
+            True if the compact layout is used; false otherwise.
+        """
+        return bool(metadata.info.get('compact_storage', False))
+
+    @staticmethod
+    def set_dialect(metadata: MetaData, dialect: str) -> None:
+        """ Sets the dialect of the database holding the tables defined in a schema
+        metadata.
+
+        Must be called before the tables are defined.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+            - dialect: The dialect name (e.g., `sqlite`).
+        """
+        metadata.info['dialect'] = dialect
+
+    @staticmethod
+    def get_dialect(metadata: MetaData) -> Optional[str]:
+        """ Gets the dialect of the database holding the tables of a schema metadata.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+        Returns:
+            The dialect name, or None if it was not set.
+        """
+        return metadata.info.get('dialect')
+
+    @staticmethod
+    def has_partial_indexes(metadata: MetaData) -> bool:
+        """ Determines whether the database holding the tables of a schema metadata
+        supports partial indexes.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+        Returns:
+            True if it does; false otherwise (also if the dialect was not set).
+        """
+        return StorageLayout.get_dialect(metadata) in StorageLayout.PARTIAL_INDEX_DIALECTS
+
+    @staticmethod
+    def token_type(metadata: MetaData) -> TypeEngine:
+        """ Gets the type of the session token columns.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+        Returns:
+            The column type.
+        """
+        return BinaryToken() if StorageLayout.is_compact(metadata) else String(36)
+
+    @staticmethod
+    def right_type(metadata: MetaData) -> TypeEngine:
+        """ Gets the type of the user right columns.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+        Returns:
+            The column type.
+        """
+        return RightCode() if StorageLayout.is_compact(metadata) else Enum(UserRightName)
+
+    @staticmethod
+    def index_name(metadata: MetaData, name: str) -> str:
+        """ Gets the name of an index in the layout of a schema metadata.
+
+        Indexes of the compact layout are named apart, so they can be built
+        while the default layout ones are still in use.
+        ---
+        Parameters:
+            - metadata: The database schema metadata.
+            - name: The index name in the default layout.
+        Returns:
+            The index name string.
+        """
+        return name + '_compact' if StorageLayout.is_compact(metadata) else name
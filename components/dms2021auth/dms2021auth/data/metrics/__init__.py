@@ -0,0 +1,5 @@
+""" Authentication service metrics.
+"""
+
+from .metricsregistry import MetricsRegistry
+from .servicemetrics import ServiceMetrics
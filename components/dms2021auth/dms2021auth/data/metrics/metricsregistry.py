@@ -0,0 +1,273 @@
+""" MetricsRegistry class module.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# A collected metric family: (name, type, help, label names, [(label values, value)])
+CollectedFamily = Tuple[str, str, str, Tuple[str, ...], List[Tuple[Tuple[str, ...], float]]]
+
+
+class MetricsRegistry():
+    """ Class responsible of recording counters and histograms, and exposing them
+    in the Prometheus text format.
+
+    Every thread records in its own shard, so recording takes no lock and never
+    contends with other threads; the shards are only merged when the metrics are
+    read. The shards of finished threads are folded into a single one, so threads
+    started per request do not pile up.
+    """
+
+    def __init__(self):
+        """ Constructor method.
+
+        Initializes an empty registry.
+        """
+        self.__lock: threading.Lock = threading.Lock()
+        self.__local: threading.local = threading.local()
+        self.__shards: List[Tuple[threading.Thread, Dict[Tuple, List]]] = []
+        self.__retired: Dict[Tuple, List] = {}
+        self.__families: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        self.__buckets: Dict[str, Tuple[float, ...]] = {}
+        self.__collectors: List[Callable[[], List[CollectedFamily]]] = []
+
+    def add_counter(self, name: str, description: str, label_names: Sequence[str] = ()) -> None:
+        """ Registers a counter.
+        ---
+        Parameters:
+            - name: The metric name. Should end in `_total`.
+            - description: The metric help string.
+            - label_names: The names of the labels the counter is broken down by.
+        """
+        self.__families[name] = ('counter', description, tuple(label_names))
+
+    def add_histogram(
+        self, name: str, description: str, buckets: Sequence[float],
+        label_names: Sequence[str] = ()
+    ) -> None:
+        """ Registers a histogram.
+        ---
+        Parameters:
+            - name: The metric name.
+            - description: The metric help string.
+            - buckets: The upper bounds of the buckets, in ascending order. The `+Inf`
+                       bucket is implicit.
+            - label_names: The names of the labels the histogram is broken down by.
+        """
+        self.__families[name] = ('histogram', description, tuple(label_names))
+        self.__buckets[name] = tuple(sorted(float(bound) for bound in buckets))
+
+    def add_collector(self, collector: Callable[[], List[CollectedFamily]]) -> None:
+        """ Registers a function sampling metrics kept elsewhere (e.g., cache counters)
+        whenever the metrics are exposed.
+        ---
+        Parameters:
+            - collector: A function returning a list of (name, type, help, label names,
+                         samples) tuples, where the samples are (label values, value) tuples.
+        """
+        self.__collectors.append(collector)
+
+    def increment(self, name: str, labels: Tuple[str, ...] = (), amount: float = 1) -> None:
+        """ Increments a counter.
+        ---
+        Parameters:
+            - name: The name of a registered counter.
+            - labels: The label values, in the order of the registered names.
+            - amount: The increment.
+        """
+        shard: Dict[Tuple, List] = self.__shard()
+        values: Optional[List] = shard.get((name, labels))
+        if values is None:
+            values = shard[(name, labels)] = [0]
+        values[0] += amount
+
+    def observe(self, name: str, value: float, labels: Tuple[str, ...] = ()) -> None:
+        """ Records an observation in a histogram.
+        ---
+        Parameters:
+            - name: The name of a registered histogram.
+            - value: The observed value.
+            - labels: The label values, in the order of the registered names.
+        """
+        buckets: Tuple[float, ...] = self.__buckets[name]
+        shard: Dict[Tuple, List] = self.__shard()
+        values: Optional[List] = shard.get((name, labels))
+        if values is None:
+            # A count per bucket (the last one is +Inf), then the sum
+            values = shard[(name, labels)] = [0] * (len(buckets) + 1) + [0.0]
+        values[bisect_left(buckets, value)] += 1
+        values[-1] += value
+
+    def snapshot(self) -> Dict[Tuple, List]:
+        """ Merges the values recorded by every thread.
+
+        Values recorded while merging may be left for the next snapshot.
+        ---
+        Returns:
+            A dictionary mapping (name, label values) tuples to the list of values
+            (the counter value, or the histogram bucket counts and sum).
+        """
+        with self.__lock:
+            self.__retire_finished()
+            shards: List[Dict[Tuple, List]] = [self.__retired] + [
+                shard for _, shard in self.__shards
+            ]
+            totals: Dict[Tuple, List] = {}
+            for shard in shards:
+                # Copying a dictionary or a list is atomic, unlike iterating it
+                for key, values in dict(shard).items():
+                    MetricsRegistry.__accumulate(totals, key, list(values))
+        return totals
+
+    def expose(self) -> str:
+        """ Renders every metric in the Prometheus text exposition format (version 0.0.4).
+        ---
+        Returns:
+            The exposition string.
+        """
+        totals: Dict[Tuple, List] = self.snapshot()
+        series: Dict[str, List[Tuple[Tuple[str, ...], List]]] = {}
+        for (name, labels), values in sorted(totals.items()):
+            series.setdefault(name, []).append((labels, values))
+        lines: List[str] = []
+        for name, (kind, description, label_names) in self.__families.items():
+            lines.append('# HELP ' + name + ' ' + MetricsRegistry.__escape_help(description))
+            lines.append('# TYPE ' + name + ' ' + kind)
+            for labels, values in series.get(name, []):
+                if kind == 'histogram':
+                    lines.extend(self.__histogram_lines(name, label_names, labels, values))
+                else:
+                    lines.append(
+                        name + MetricsRegistry.__labels(label_names, labels) + ' '
+                        + MetricsRegistry.__number(values[0])
+                    )
+        for collector in self.__collectors:
+            for name, kind, description, label_names, samples in collector():
+                lines.append('# HELP ' + name + ' ' + MetricsRegistry.__escape_help(description))
+                lines.append('# TYPE ' + name + ' ' + kind)
+                for labels, value in samples:
+                    lines.append(
+                        name + MetricsRegistry.__labels(label_names, labels) + ' '
+                        + MetricsRegistry.__number(value)
+                    )
+        return '\n'.join(lines) + '\n'
+
+    def __shard(self) -> Dict[Tuple, List]:
+        """ Gets the shard where the current thread records its values.
+        ---
+        Returns:
+            The shard dictionary, created on the first use by each thread.
+        """
+        try:
+            return self.__local.shard
+        except AttributeError:
+            shard: Dict[Tuple, List] = {}
+            with self.__lock:
+                self.__retire_finished()
+                self.__shards.append((threading.current_thread(), shard))
+            self.__local.shard = shard
+            return shard
+
+    def __retire_finished(self) -> None:
+        """ Folds the shards of the threads that finished into the retired shard.
+
+        Must be called with the lock held.
+        """
+        alive: List[Tuple[threading.Thread, Dict[Tuple, List]]] = []
+        for thread, shard in self.__shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                for key, values in shard.items():
+                    MetricsRegistry.__accumulate(self.__retired, key, values)
+        self.__shards = alive
+
+    @staticmethod
+    def __accumulate(totals: Dict[Tuple, List], key: Tuple, values: List) -> None:
+        """ Adds a list of values to the one with the same key.
+        ---
+        Parameters:
+            - totals: The dictionary of accumulated values.
+            - key: The (name, label values) tuple.
+            - values: The values to add. The list may be kept, so it must not be shared.
+        """
+        accumulated: Optional[List] = totals.get(key)
+        if accumulated is None:
+            totals[key] = values
+            return
+        for index, value in enumerate(values):
+            accumulated[index] += value
+
+    def __histogram_lines(
+        self, name: str, label_names: Tuple[str, ...], labels: Tuple[str, ...], values: List
+    ) -> List[str]:
+        """ Renders the samples of a histogram series.
+        ---
+        Parameters:
+            - name: The histogram name.
+            - label_names: The names of the labels.
+            - labels: The label values of the series.
+            - values: The bucket counts and the sum of the series.
+        Returns:
+            The list of sample lines.
+        """
+        lines: List[str] = []
+        bounds: Tuple[float, ...] = self.__buckets[name] + (math.inf,)
+        cumulative: int = 0
+        for bound, count in zip(bounds, values):
+            cumulative += count
+            lines.append(
+                name + '_bucket' + MetricsRegistry.__labels(
+                    label_names + ('le',), labels + (MetricsRegistry.__number(bound),)
+                ) + ' ' + str(cumulative)
+            )
+        label_string: str = MetricsRegistry.__labels(label_names, labels)
+        lines.append(name + '_sum' + label_string + ' ' + MetricsRegistry.__number(values[-1]))
+        lines.append(name + '_count' + label_string + ' ' + str(cumulative))
+        return lines
+
+    @staticmethod
+    def __labels(label_names: Tuple[str, ...], labels: Tuple[str, ...]) -> str:
+        """ Renders a set of labels.
+        ---
+        Parameters:
+            - label_names: The names of the labels.
+            - labels: The label values.
+        Returns:
+            The labels string (empty if there are none).
+        """
+        if not label_names:
+            return ''
+        return '{' + ','.join(
+            label_name + '="' + str(label).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n') + '"'
+            for label_name, label in zip(label_names, labels)
+        ) + '}'
+
+    @staticmethod
+    def __escape_help(description: str) -> str:
+        """ Escapes a help string.
+        ---
+        Parameters:
+            - description: The help string.
+        Returns:
+            The escaped string.
+        """
+        return description.replace('\\', '\\\\').replace('\n', '\\n')
+
+    @staticmethod
+    def __number(value: float) -> str:
+        """ Renders a sample value.
+        ---
+        Parameters:
+            - value: The value.
+        Returns:
+            The value string.
+        """
+        if isinstance(value, int):
+            return str(value)
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(float(value))
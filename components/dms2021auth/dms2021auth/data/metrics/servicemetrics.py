@@ -0,0 +1,221 @@
+""" ServiceMetrics class module.
+"""
+
+import contextvars
+import time
+from typing import Dict, List, Optional, Tuple, Union
+from dms2021auth.data.cache import TtlLruCache
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.data.db import Schema
+from dms2021auth.data.metrics.metricsregistry import CollectedFamily, MetricsRegistry
+
+
+class ServiceMetrics():
+    """ Class responsible of the metrics of the authentication service.
+
+    Records the requests served by route, their latency and the database work
+    each one caused, and samples the cache and connection pool counters when
+    the metrics are exposed.
+
+    The database work is attributed to the request being served in the current
+    context, so it is also accounted when run in other threads with a copy of
+    the context (see `AsyncSchema`). Each statement only adds to the counters of
+    its request, which are recorded once the request ends.
+    """
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+    QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+    def __init__(self, config: AuthConfiguration, schema: Schema):
+        """ Constructor method.
+
+        Registers the service metrics and starts measuring the database queries.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the latency buckets.
+            - schema: The database schema whose queries, caches and pool are measured.
+        """
+        self.__schema: Schema = schema
+        # The [query count, query seconds] of the request being served
+        self.__request: contextvars.ContextVar[Optional[List]] = contextvars.ContextVar(
+            'dms2021auth_request_metrics', default=None
+        )
+        buckets: Tuple[float, ...] = config.get_metrics_buckets()
+        registry: MetricsRegistry = MetricsRegistry()
+        registry.add_counter(
+            'dms2021auth_requests_total', 'Requests served.', ('method', 'route', 'status')
+        )
+        registry.add_histogram(
+            'dms2021auth_request_duration_seconds',
+            'Time spent serving a request, until its response starts.',
+            buckets, ('method', 'route')
+        )
+        registry.add_histogram(
+            'dms2021auth_request_db_queries', 'Database queries run per request.',
+            ServiceMetrics.QUERY_COUNT_BUCKETS, ('method', 'route')
+        )
+        registry.add_histogram(
+            'dms2021auth_request_db_duration_seconds',
+            'Time spent running database queries per request.', buckets, ('method', 'route')
+        )
+        registry.add_counter('dms2021auth_db_queries_total', 'Database queries run.')
+        registry.add_counter(
+            'dms2021auth_db_query_seconds_total', 'Time spent running database queries.'
+        )
+        registry.add_collector(self.__collect_caches)
+        registry.add_collector(self.__collect_pool)
+        self.__registry: MetricsRegistry = registry
+        schema.listen('before_cursor_execute', ServiceMetrics.__before_query)
+        schema.listen('after_cursor_execute', self.__after_query)
+
+    def get_registry(self) -> MetricsRegistry:
+        """ Gets the registry where the metrics are recorded.
+        ---
+        Returns:
+            The MetricsRegistry instance.
+        """
+        return self.__registry
+
+    def begin_request(self) -> Tuple[float, List]:
+        """ Starts measuring a request served in the current context.
+        ---
+        Returns:
+            The start time of the request and the counters of its database work, to
+            be passed to `end_request`.
+        """
+        queries: List = [0, 0.0]
+        self.__request.set(queries)
+        return (time.perf_counter(), queries)
+
+    def end_request(
+        self, method: str, route: Optional[str], status: int, request: Tuple[float, List]
+    ) -> None:
+        """ Records a request started with `begin_request`.
+        ---
+        Parameters:
+            - method: The request method.
+            - route: The rule of the route that served the request (e.g.,
+                     `/users/<string:username>/rights`), or None if none matched.
+            - status: The response status code.
+            - request: The value returned by `begin_request`.
+        """
+        elapsed: float = time.perf_counter() - request[0]
+        # Later queries (e.g., streaming the response) are only added to the totals
+        self.__request.set(None)
+        count, seconds = request[1]
+        labels: Tuple[str, str] = (method, route or 'unmatched')
+        registry: MetricsRegistry = self.__registry
+        registry.increment('dms2021auth_requests_total', labels + (str(status),))
+        registry.observe('dms2021auth_request_duration_seconds', elapsed, labels)
+        registry.observe('dms2021auth_request_db_queries', count, labels)
+        registry.observe('dms2021auth_request_db_duration_seconds', seconds, labels)
+        if count > 0:
+            registry.increment('dms2021auth_db_queries_total', amount=count)
+            registry.increment('dms2021auth_db_query_seconds_total', amount=seconds)
+
+    def expose(self) -> str:
+        """ Renders every metric in the Prometheus text exposition format.
+        ---
+        Returns:
+            The exposition string, whose MIME type is `CONTENT_TYPE`.
+        """
+        return self.__registry.expose()
+
+    @staticmethod
+    def __before_query(
+        conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+        """ Engine listener noting the time a query starts.
+        ---
+        Parameters:
+            - context: The execution context of the query.
+        """
+        if context is not None:
+            # Cheaper than the connection info, reached through several properties
+            context.metrics_start = time.perf_counter()
+
+    def __after_query(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+        """ Engine listener recording a query that finished.
+        ---
+        Parameters:
+            - context: The execution context of the query.
+        """
+        start: Optional[float] = getattr(context, 'metrics_start', None)
+        if start is None:
+            return
+        elapsed: float = time.perf_counter() - start
+        queries: Optional[List] = self.__request.get()
+        if queries is not None:
+            # Added to the totals once the request ends
+            queries[0] += 1
+            queries[1] += elapsed
+        else:
+            self.__registry.increment('dms2021auth_db_queries_total')
+            self.__registry.increment('dms2021auth_db_query_seconds_total', amount=elapsed)
+
+    def __collect_caches(self) -> List[CollectedFamily]:
+        """ Samples the counters of the session and rights caches.
+        ---
+        Returns:
+            The list of collected metric families.
+        """
+        caches: List[Tuple[str, Optional[TtlLruCache]]] = [
+            ('sessions', self.__schema.get_session_cache()),
+            ('rights', self.__schema.get_rights_cache())
+        ]
+        statistics: List[Tuple[Tuple[str, ...], Dict[str, int]]] = [
+            ((name,), cache.get_statistics()) for name, cache in caches if cache is not None
+        ]
+        families: List[CollectedFamily] = []
+        for key, kind, description in [
+            ('hits', 'counter', 'Cache lookups that found a valid entry.'),
+            ('misses', 'counter', 'Cache lookups that found no valid entry.'),
+            ('evictions', 'counter', 'Entries evicted to make room for others.'),
+            ('expirations', 'counter', 'Entries dropped once their time to live passed.'),
+            ('invalidations', 'counter', 'Entries invalidated by changes in their source.'),
+            ('size', 'gauge', 'Entries currently held.'),
+            ('capacity', 'gauge', 'Maximum number of entries held.')
+        ]:
+            name: str = 'dms2021auth_cache_' + key + ('_total' if kind == 'counter' else '')
+            families.append((name, kind, description, ('cache',), [
+                (labels, values[key]) for labels, values in statistics
+            ]))
+        families.append((
+            'dms2021auth_cache_hit_ratio', 'gauge',
+            'Fraction of the cache lookups that found a valid entry.', ('cache',), [
+                (labels, values['hits'] / (values['hits'] + values['misses']))
+                for labels, values in statistics if values['hits'] + values['misses'] > 0
+            ]
+        ))
+        return families
+
+    def __collect_pool(self) -> List[CollectedFamily]:
+        """ Samples the usage counters of the database connection pool.
+        ---
+        Returns:
+            The list of collected metric families (none if the pool is not measured).
+        """
+        statistics: Dict[str, Union[int, float]] = self.__schema.get_pool_statistics()
+        if not statistics:
+            return []
+        return [
+            (
+                'dms2021auth_db_pool_' + key, kind, description, (), [((), statistics[source])]
+            ) for key, source, kind, description in [
+                ('connects_total', 'connects', 'counter', 'Database connections opened.'),
+                ('checkouts_total', 'checkouts', 'counter', 'Connections taken from the pool.'),
+                ('timeouts_total', 'timeouts', 'counter',
+                 'Checkouts that gave up waiting for a connection.'),
+                ('wait_seconds_total', 'total_wait', 'counter',
+                 'Time spent waiting for a connection.'),
+                ('wait_seconds_max', 'max_wait', 'gauge',
+                 'Longest time spent waiting for a connection.'),
+                ('size', 'size', 'gauge', 'Connections kept open by the pool.'),
+                ('checked_out', 'checked_out', 'gauge', 'Connections currently in use.'),
+                ('checked_in', 'checked_in', 'gauge', 'Idle connections in the pool.'),
+                ('overflow', 'overflow', 'gauge',
+                 'Connections opened beyond the pool size (negative while below it).')
+            ]
+        ]
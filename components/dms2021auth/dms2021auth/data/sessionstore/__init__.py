@@ -0,0 +1,10 @@
+""" User session storage backends.
+"""
+
+from .rightsprovider import RightsProvider
+from .sessionstore import SessionStore
+from .keyvaluesessionstore import KeyValueSessionStore
+from .sqlsessionstore import SqlSessionStore
+from .memorysessionstore import MemorySessionStore
+from .dbmsessionstore import DbmSessionStore
+from .sessionstorefactory import SessionStoreFactory
@@ -0,0 +1,135 @@
+""" DbmSessionStore class module.
+"""
+
+import dbm
+import json
+from datetime import datetime
+from typing import List, Optional
+from dms2021auth.data.sessionstore.keyvaluesessionstore import KeyValueSessionStore, SessionRecord
+from dms2021auth.data.sessionstore.rightsprovider import RightsProvider
+
+
+class DbmSessionStore(KeyValueSessionStore):
+    """ Storage of the user sessions in an embedded on-disk key-value database
+    (see the standard `dbm` module), which needs no database server.
+
+    Sessions are kept under `s:<token>`, as a JSON list, and the token of the
+    active session of each user under `u:<user name>` (empty if none). The file
+    is opened by a single process; `dbm.gnu`, when available, refuses to open
+    it from another one. Changes are written right away, but may not be made
+    durable (e.g., the index of `dbm.dumb`) until the reaper runs or the storage
+    is closed.
+    """
+
+    SESSION_PREFIX = b's:'
+    USER_PREFIX = b'u:'
+
+    def __init__(self, path: str, rights_provider: RightsProvider):
+        """ Constructor method.
+
+        Opens the database, creating it if it does not exist.
+        ---
+        Parameters:
+            - path: The path of the database file (some `dbm` implementations add
+                    their own suffixes to it).
+            - rights_provider: The provider of the users' rights.
+        """
+        super().__init__(rights_provider)
+        self.__db = dbm.open(path, 'c')
+        self.__closed: bool = False
+
+    def _get_session(self, session_token: str) -> Optional[SessionRecord]:
+        """ Reads a session.
+        ---
+        Parameters:
+            - session_token: The session token.
+        Returns:
+            The session record, or None if there is no such session.
+        """
+        value: Optional[bytes] = self.__db.get(
+            DbmSessionStore.SESSION_PREFIX + session_token.encode('utf-8')
+        )
+        if value is None:
+            return None
+        username, active, created, updated = json.loads(value)
+        return (username, active, datetime.fromisoformat(created),
+                datetime.fromisoformat(updated))
+
+    def _put_session(self, session_token: str, record: SessionRecord) -> None:
+        """ Writes a session, replacing it if it exists.
+        ---
+        Parameters:
+            - session_token: The session token.
+            - record: The session record.
+        """
+        self.__db[DbmSessionStore.SESSION_PREFIX + session_token.encode('utf-8')] = json.dumps(
+            [record[0], record[1], record[2].isoformat(), record[3].isoformat()]
+        ).encode('utf-8')
+
+    def _delete_session(self, session_token: str) -> None:
+        """ Deletes an existing session.
+        ---
+        Parameters:
+            - session_token: The session token.
+        """
+        del self.__db[DbmSessionStore.SESSION_PREFIX + session_token.encode('utf-8')]
+
+    def _list_tokens(self) -> List[str]:
+        """ Lists the tokens of every session, in no particular order.
+        ---
+        Returns:
+            The list of session tokens.
+        """
+        prefix_length: int = len(DbmSessionStore.SESSION_PREFIX)
+        # Keys are bytes, although some implementations are typed as returning strings
+        keys: List[bytes] = [
+            key if isinstance(key, bytes) else key.encode('utf-8') for key in self.__db.keys()
+        ]
+        return [
+            key[prefix_length:].decode('utf-8') for key in keys
+            if key.startswith(DbmSessionStore.SESSION_PREFIX)
+        ]
+
+    def _get_active_token(self, username: str) -> Optional[str]:
+        """ Reads the token of the active session of a user.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            The session token, or None if the user has no active session.
+        """
+        value: Optional[bytes] = self.__db.get(
+            DbmSessionStore.USER_PREFIX + username.encode('utf-8')
+        )
+        return value.decode('utf-8') if value else None
+
+    def _put_active_token(self, username: str, session_token: Optional[str]) -> None:
+        """ Writes the token of the active session of a user.
+
+        The key is emptied rather than deleted when the user has no active session,
+        since some implementations (e.g., `dbm.dumb`) rewrite their whole index on
+        every deletion.
+        ---
+        Parameters:
+            - username: The user name string.
+            - session_token: The session token, or None if the user has no active session.
+        """
+        self.__db[DbmSessionStore.USER_PREFIX + username.encode('utf-8')] = (
+            b'' if session_token is None else session_token.encode('utf-8')
+        )
+
+    def _sync(self) -> None:
+        """ Writes the pending changes to disk, if the implementation buffers them.
+        """
+        sync = getattr(self.__db, 'sync', None)
+        if sync is not None:
+            sync()
+
+    def close(self) -> None:
+        """ Writes the pending changes to disk and closes the database, unless closed already.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        self._sync()
+        self.__db.close()
@@ -0,0 +1,291 @@
+""" KeyValueSessionStore class module.
+"""
+
+import threading
+import uuid
+from abc import abstractmethod
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from dms2021auth.data.db.exc import SessionNotFoundError
+from dms2021auth.data.db.results import UserSession
+from dms2021auth.data.sessionstore.rightsprovider import RightsProvider
+from dms2021auth.data.sessionstore.sessionstore import SessionStore
+
+# (user name, active, created, updated)
+SessionRecord = Tuple[str, bool, datetime, datetime]
+
+
+class KeyValueSessionStore(SessionStore):
+    """ Base class for the storages of the user sessions in a key-value map.
+
+    Sessions are kept by token, along with the token of the active session of
+    each user. Every operation holds a single lock, so the storage can only be
+    shared by the threads of a process. Sessions are not indexed by their update
+    time nor sorted by their key, so expiring, purging and listing them read
+    every session. The rights of the users are read from the database instead
+    (see `RightsProvider`).
+    """
+
+    def __init__(self, rights_provider: RightsProvider):
+        """ Constructor method.
+        ---
+        Parameters:
+            - rights_provider: The provider of the users' rights.
+        """
+        self.__lock: threading.Lock = threading.Lock()
+        self.__rights_provider: RightsProvider = rights_provider
+
+    @abstractmethod
+    def _get_session(self, session_token: str) -> Optional[SessionRecord]:
+        """ Reads a session.
+        ---
+        Parameters:
+            - session_token: The session token.
+        Returns:
+            The session record, or None if there is no such session.
+        """
+
+    @abstractmethod
+    def _put_session(self, session_token: str, record: SessionRecord) -> None:
+        """ Writes a session, replacing it if it exists.
+        ---
+        Parameters:
+            - session_token: The session token.
+            - record: The session record.
+        """
+
+    @abstractmethod
+    def _delete_session(self, session_token: str) -> None:
+        """ Deletes an existing session.
+        ---
+        Parameters:
+            - session_token: The session token.
+        """
+
+    @abstractmethod
+    def _list_tokens(self) -> List[str]:
+        """ Lists the tokens of every session, in no particular order.
+        ---
+        Returns:
+            The list of session tokens.
+        """
+
+    @abstractmethod
+    def _get_active_token(self, username: str) -> Optional[str]:
+        """ Reads the token of the active session of a user.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            The session token, or None if the user has no active session.
+        """
+
+    @abstractmethod
+    def _put_active_token(self, username: str, session_token: Optional[str]) -> None:
+        """ Writes the token of the active session of a user.
+        ---
+        Parameters:
+            - username: The user name string.
+            - session_token: The session token, or None if the user has no active session.
+        """
+
+    def _sync(self) -> None:
+        """ Makes the changes made so far durable, if the storage needs it.
+        """
+
+    def open_session(self, username: str) -> Tuple[str, bool]:
+        """ Gets the active session of a user, creating it if there is none.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            A tuple with the token of the active session and whether it was created
+            by this call.
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        with self.__lock:
+            session_token: Optional[str] = self._get_active_token(username)
+            if session_token is not None:
+                return (session_token, False)
+            session_token = str(uuid.uuid4())
+            now: datetime = datetime.now()
+            self._put_session(session_token, (username, True, now, now))
+            self._put_active_token(username, session_token)
+            return (session_token, True)
+
+    def touch_session(self, session_token: str, timestamp: datetime) -> None:
+        """ Updates the update time of a session.
+        ---
+        Parameters:
+            - session_token: The session token.
+            - timestamp: A datetime with the timestamp to use.
+        """
+        with self.__lock:
+            record: Optional[SessionRecord] = self._get_session(session_token)
+            if record is not None:
+                self._put_session(session_token, (record[0], record[1], record[2], timestamp))
+
+    def find_sessions_owners(self, session_tokens: List[str]) -> Dict[str, str]:
+        """ Finds the owners of many active sessions.
+        ---
+        Parameters:
+            - session_tokens: The list of session tokens.
+        Returns:
+            A dictionary mapping the tokens of the active sessions found to their
+            owners' user names. Tokens not matching an active session are left out.
+        """
+        owners: Dict[str, str] = {}
+        with self.__lock:
+            for session_token in session_tokens:
+                record: Optional[SessionRecord] = self._get_session(session_token)
+                if record is not None and record[1]:
+                    owners[session_token] = record[0]
+        return owners
+
+    def find_sessions_rights_masks(self, session_tokens: List[str]) -> Dict[str, Tuple[str, int]]:
+        """ Finds the owners of many active sessions along with all of their rights.
+        ---
+        Parameters:
+            - session_tokens: The list of session tokens.
+        Returns:
+            A dictionary mapping the tokens of the active sessions found to a tuple with
+            the user name string and the integer rights bitmask. Tokens not matching an
+            active session are left out.
+        """
+        owners: Dict[str, str] = self.find_sessions_owners(session_tokens)
+        masks: Dict[str, int] = self.__rights_provider.get_rights_masks(list(owners.values()))
+        return {
+            session_token: (username, masks[username])
+            for session_token, username in owners.items()
+        }
+
+    def close_session(self, session_token: str) -> None:
+        """ Deactivates an active session, setting the current time as its update time.
+        ---
+        Parameters:
+            - session_token: The session token.
+        Throws:
+            - SessionNotFoundError: When the session was not found or is inactive.
+        """
+        with self.__lock:
+            record: Optional[SessionRecord] = self._get_session(session_token)
+            if record is None or not record[1]:
+                raise SessionNotFoundError()
+            self.__deactivate(session_token, record)
+
+    def iter_sessions(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        username: Optional[str] = None,
+        active_only: bool = False
+    ) -> Iterator[Tuple[str, str, bool, datetime, datetime]]:
+        """ Iterates over the user sessions, in ascending order of their keys.
+
+        The keys of every session are derived and sorted first; each session is read
+        as the iterator is advanced, and skipped if deleted meanwhile.
+        ---
+        Parameters:
+            - after: If set, only the sessions whose key follows it are retrieved.
+            - limit: If set, the maximum number of sessions retrieved.
+            - username: If set, only the sessions of this user are retrieved.
+            - active_only: Whether only active sessions should be retrieved or not (default).
+        Returns:
+            An iterator of (key, user name, active, created, updated) tuples.
+        """
+        with self.__lock:
+            session_tokens: List[str] = self._list_tokens()
+        keys: List[Tuple[str, str]] = sorted(
+            (UserSession.key_of(session_token), session_token) for session_token in session_tokens
+        )
+        count: int = 0
+        for session_key, session_token in keys:
+            if after is not None and session_key <= after:
+                continue
+            if limit is not None and count >= limit:
+                return
+            with self.__lock:
+                record: Optional[SessionRecord] = self._get_session(session_token)
+            if record is None or (username is not None and record[0] != username) \
+                    or (active_only and not record[1]):
+                continue
+            count += 1
+            yield (session_key, record[0], record[1], record[2], record[3])
+
+    def expire_idle_sessions(self, idle_since: datetime, batch_size: int) -> Tuple[int, int]:
+        """ Deactivates the active sessions not updated since a given time.
+
+        Every session is read, holding the lock for a batch of them at a time.
+        ---
+        Parameters:
+            - idle_since: A datetime; active sessions last updated before it are deactivated.
+            - batch_size: The maximum number of sessions read while holding the lock.
+        Returns:
+            A tuple with the number of sessions scanned and deactivated.
+        """
+        return self.__process_sessions(
+            lambda record: record[1] and record[3] < idle_since, self.__deactivate, batch_size
+        )
+
+    def purge_inactive_sessions(
+        self, inactive_since: datetime, batch_size: int
+    ) -> Tuple[int, int]:
+        """ Deletes the inactive sessions not updated since a given time.
+
+        Every session is read, holding the lock for a batch of them at a time.
+        ---
+        Parameters:
+            - inactive_since: A datetime; inactive sessions last updated before it are deleted.
+            - batch_size: The maximum number of sessions read while holding the lock.
+        Returns:
+            A tuple with the number of sessions scanned and deleted.
+        """
+        return self.__process_sessions(
+            lambda record: not record[1] and record[3] < inactive_since,
+            lambda session_token, record: self._delete_session(session_token),
+            batch_size
+        )
+
+    def __process_sessions(
+        self,
+        matches: Callable[[SessionRecord], bool],
+        process: Callable[[str, SessionRecord], None],
+        batch_size: int
+    ) -> Tuple[int, int]:
+        """ Processes the sessions matching a condition, a batch at a time.
+        ---
+        Parameters:
+            - matches: The condition, given a session record.
+            - process: The function called, holding the lock, with the token and
+                       record of every matching session.
+            - batch_size: The maximum number of sessions read while holding the lock.
+        Returns:
+            A tuple with the number of sessions scanned and processed.
+        """
+        batch_size = max(batch_size, 1)
+        with self.__lock:
+            session_tokens: List[str] = self._list_tokens()
+        processed: int = 0
+        for start in range(0, len(session_tokens), batch_size):
+            with self.__lock:
+                for session_token in session_tokens[start:start + batch_size]:
+                    record: Optional[SessionRecord] = self._get_session(session_token)
+                    if record is not None and matches(record):
+                        process(session_token, record)
+                        processed += 1
+                self._sync()
+        return (len(session_tokens), processed)
+
+    def __deactivate(self, session_token: str, record: SessionRecord) -> None:
+        """ Deactivates a session, setting the current time as its update time.
+
+        Must be called holding the lock.
+        ---
+        Parameters:
+            - session_token: The session token.
+            - record: The session record.
+        """
+        self._put_session(session_token, (record[0], False, record[2], datetime.now()))
+        if self._get_active_token(record[0]) == session_token:
+            self._put_active_token(record[0], None)
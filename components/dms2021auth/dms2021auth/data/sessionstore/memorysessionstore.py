@@ -0,0 +1,81 @@
+""" MemorySessionStore class module.
+"""
+
+from typing import Dict, List, Optional
+from dms2021auth.data.sessionstore.keyvaluesessionstore import KeyValueSessionStore, SessionRecord
+from dms2021auth.data.sessionstore.rightsprovider import RightsProvider
+
+
+class MemorySessionStore(KeyValueSessionStore):
+    """ Storage of the user sessions in the memory of the process.
+
+    Sessions are lost when the process exits, and are not shared with any other
+    process, so it is only fit for tests and single-process deployments.
+    """
+
+    def __init__(self, rights_provider: RightsProvider):
+        """ Constructor method.
+        ---
+        Parameters:
+            - rights_provider: The provider of the users' rights.
+        """
+        super().__init__(rights_provider)
+        self.__sessions: Dict[str, SessionRecord] = {}
+        self.__active_tokens: Dict[str, str] = {}
+
+    def _get_session(self, session_token: str) -> Optional[SessionRecord]:
+        """ Reads a session.
+        ---
+        Parameters:
+            - session_token: The session token.
+        Returns:
+            The session record, or None if there is no such session.
+        """
+        return self.__sessions.get(session_token)
+
+    def _put_session(self, session_token: str, record: SessionRecord) -> None:
+        """ Writes a session, replacing it if it exists.
+        ---
+        Parameters:
+            - session_token: The session token.
+            - record: The session record.
+        """
+        self.__sessions[session_token] = record
+
+    def _delete_session(self, session_token: str) -> None:
+        """ Deletes an existing session.
+        ---
+        Parameters:
+            - session_token: The session token.
+        """
+        del self.__sessions[session_token]
+
+    def _list_tokens(self) -> List[str]:
+        """ Lists the tokens of every session, in no particular order.
+        ---
+        Returns:
+            The list of session tokens.
+        """
+        return list(self.__sessions)
+
+    def _get_active_token(self, username: str) -> Optional[str]:
+        """ Reads the token of the active session of a user.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            The session token, or None if the user has no active session.
+        """
+        return self.__active_tokens.get(username)
+
+    def _put_active_token(self, username: str, session_token: Optional[str]) -> None:
+        """ Writes the token of the active session of a user.
+        ---
+        Parameters:
+            - username: The user name string.
+            - session_token: The session token, or None if the user has no active session.
+        """
+        if session_token is None:
+            self.__active_tokens.pop(username, None)
+        else:
+            self.__active_tokens[username] = session_token
@@ -0,0 +1,36 @@
+""" RightsProvider class module.
+"""
+
+from typing import Dict, List
+from sqlalchemy.orm import Session  # type: ignore
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.resultsets import UserRights
+
+
+class RightsProvider():
+    """ Class responsible of reading the users' rights from the database for the
+    session stores keeping the sessions elsewhere.
+    """
+
+    def __init__(self, schema: Schema):
+        """ Constructor method.
+        ---
+        Parameters:
+            - schema: The database schema instance to use.
+        """
+        self.__schema: Schema = schema
+
+    def get_rights_masks(self, usernames: List[str]) -> Dict[str, int]:
+        """ Gets all the rights of many users, trying the rights cache first.
+        ---
+        Parameters:
+            - usernames: The list of user name strings.
+        Returns:
+            A dictionary mapping each user name to an integer bitmask (see `UserRightMask`)
+            with their rights. It is 0 if the user has no rights or does not exist.
+        """
+        session: Session = self.__schema.get_session()
+        return {
+            username: UserRights.get_rights_mask(session, username)
+            for username in set(usernames)
+        }
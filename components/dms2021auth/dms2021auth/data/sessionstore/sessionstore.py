@@ -0,0 +1,119 @@
+""" SessionStore class module.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class SessionStore(ABC):
+    """ Base class for the storages of the user sessions.
+
+    A user has at most one active session at a time, identified by an opaque
+    token. Closed sessions are kept until purged. The users and their rights
+    are always kept in the database, whatever the storage of the sessions.
+    """
+
+    @abstractmethod
+    def open_session(self, username: str) -> Tuple[str, bool]:
+        """ Gets the active session of a user, creating it if there is none.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            A tuple with the token of the active session and whether it was created
+            by this call.
+        """
+
+    @abstractmethod
+    def touch_session(self, session_token: str, timestamp: datetime) -> None:
+        """ Updates the update time of a session.
+        ---
+        Parameters:
+            - session_token: The session token.
+            - timestamp: A datetime with the timestamp to use.
+        """
+
+    @abstractmethod
+    def find_sessions_owners(self, session_tokens: List[str]) -> Dict[str, str]:
+        """ Finds the owners of many active sessions.
+        ---
+        Parameters:
+            - session_tokens: The list of session tokens.
+        Returns:
+            A dictionary mapping the tokens of the active sessions found to their
+            owners' user names. Tokens not matching an active session are left out.
+        """
+
+    @abstractmethod
+    def find_sessions_rights_masks(self, session_tokens: List[str]) -> Dict[str, Tuple[str, int]]:
+        """ Finds the owners of many active sessions along with all of their rights.
+        ---
+        Parameters:
+            - session_tokens: The list of session tokens.
+        Returns:
+            A dictionary mapping the tokens of the active sessions found to a tuple with
+            the user name string and the integer rights bitmask. Tokens not matching an
+            active session are left out.
+        """
+
+    @abstractmethod
+    def close_session(self, session_token: str) -> None:
+        """ Deactivates an active session, setting the current time as its update time.
+        ---
+        Parameters:
+            - session_token: The session token.
+        Throws:
+            - SessionNotFoundError: When the session was not found or is inactive.
+        """
+
+    @abstractmethod
+    def iter_sessions(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        username: Optional[str] = None,
+        active_only: bool = False
+    ) -> Iterator[Tuple[str, str, bool, datetime, datetime]]:
+        """ Iterates over the user sessions, in ascending order of their keys.
+
+        Sessions are read as the iterator is advanced. Their tokens are never
+        listed; they are identified by a key derived from the token instead
+        (see `UserSession.key_of`).
+        ---
+        Parameters:
+            - after: If set, only the sessions whose key follows it are retrieved.
+            - limit: If set, the maximum number of sessions retrieved.
+            - username: If set, only the sessions of this user are retrieved.
+            - active_only: Whether only active sessions should be retrieved or not (default).
+        Returns:
+            An iterator of (key, user name, active, created, updated) tuples.
+        """
+
+    @abstractmethod
+    def expire_idle_sessions(self, idle_since: datetime, batch_size: int) -> Tuple[int, int]:
+        """ Deactivates the active sessions not updated since a given time, in batches.
+        ---
+        Parameters:
+            - idle_since: A datetime; active sessions last updated before it are deactivated.
+            - batch_size: The maximum number of sessions processed at once.
+        Returns:
+            A tuple with the number of sessions scanned and deactivated.
+        """
+
+    @abstractmethod
+    def purge_inactive_sessions(
+        self, inactive_since: datetime, batch_size: int
+    ) -> Tuple[int, int]:
+        """ Deletes the inactive sessions not updated since a given time, in batches.
+        ---
+        Parameters:
+            - inactive_since: A datetime; inactive sessions last updated before it are deleted.
+            - batch_size: The maximum number of sessions processed at once.
+        Returns:
+            A tuple with the number of sessions scanned and deleted.
+        """
+
+    def close(self) -> None:
+        """ Releases the resources held by the storage.
+        """
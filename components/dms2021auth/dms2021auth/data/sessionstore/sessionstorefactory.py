@@ -0,0 +1,33 @@
+""" SessionStoreFactory class module.
+"""
+
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.data.db import Schema
+from dms2021auth.data.sessionstore.rightsprovider import RightsProvider
+from dms2021auth.data.sessionstore.sessionstore import SessionStore
+from dms2021auth.data.sessionstore.sqlsessionstore import SqlSessionStore
+from dms2021auth.data.sessionstore.memorysessionstore import MemorySessionStore
+from dms2021auth.data.sessionstore.dbmsessionstore import DbmSessionStore
+
+
+class SessionStoreFactory():
+    """ Class responsible of creating the configured session store.
+    """
+
+    @staticmethod
+    def create(config: AuthConfiguration, schema: Schema) -> SessionStore:
+        """ Creates the session store of the configured backend.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the session store parameters.
+            - schema: The database schema instance, holding the sessions of the `sql`
+                      backend and the users' rights.
+        Returns:
+            The SessionStore instance.
+        """
+        backend: str = config.get_session_store_backend()
+        if backend == 'memory':
+            return MemorySessionStore(RightsProvider(schema))
+        if backend == 'dbm':
+            return DbmSessionStore(str(config.get_session_store_path()), RightsProvider(schema))
+        return SqlSessionStore(schema)
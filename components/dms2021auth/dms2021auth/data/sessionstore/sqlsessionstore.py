@@ -0,0 +1,167 @@
+""" SqlSessionStore class module.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy.orm import Session  # type: ignore
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.results import UserSession
+from dms2021auth.data.db.resultsets import UserSessions, UserRights
+from dms2021auth.data.sessionstore.sessionstore import SessionStore
+
+
+class SqlSessionStore(SessionStore):
+    """ Storage of the user sessions in the `user_sessions` table of the database.
+
+    Sessions are shared by every process using the database, and benefit from
+    the session cache, the touch buffer and the read replica, if configured.
+    """
+
+    def __init__(self, schema: Schema):
+        """ Constructor method.
+        ---
+        Parameters:
+            - schema: The database schema instance to use.
+        """
+        self.__schema: Schema = schema
+
+    def get_schema(self) -> Schema:
+        """ Gets the schema being used by this instance.
+        ---
+        Returns:
+            The DB schema object.
+        """
+        return self.__schema
+
+    def open_session(self, username: str) -> Tuple[str, bool]:
+        """ Gets the active session of a user, creating it if there is none.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            A tuple with the token of the active session and whether it was created
+            by this call.
+        """
+        return UserSessions.open_session_for_user(self.__schema.get_session(), username)
+
+    def touch_session(self, session_token: str, timestamp: datetime) -> None:
+        """ Updates the update time of a session.
+        ---
+        Parameters:
+            - session_token: The session token.
+            - timestamp: A datetime with the timestamp to use.
+        """
+        UserSessions.touch_session(self.__schema.get_session(), session_token, timestamp)
+
+    def find_sessions_owners(self, session_tokens: List[str]) -> Dict[str, str]:
+        """ Finds the owners of many active sessions, trying the session cache first.
+        ---
+        Parameters:
+            - session_tokens: The list of session tokens.
+        Returns:
+            A dictionary mapping the tokens of the active sessions found to their
+            owners' user names. Tokens not matching an active session are left out.
+        """
+        session: Session = self.__schema.get_session()
+        owners: Dict[str, str] = {}
+        for session_token in session_tokens:
+            username: Optional[str] = UserSessions.find_active_session_owner(
+                session, session_token
+            )
+            if username is not None:
+                owners[session_token] = username
+        return owners
+
+    def find_sessions_rights_masks(self, session_tokens: List[str]) -> Dict[str, Tuple[str, int]]:
+        """ Finds the owners of many active sessions along with all of their rights.
+
+        Cached values are used when present. The rest are loaded with a single query.
+        ---
+        Parameters:
+            - session_tokens: The list of session tokens.
+        Returns:
+            A dictionary mapping the tokens of the active sessions found to a tuple with
+            the user name string and the integer rights bitmask. Tokens not matching an
+            active session are left out.
+        """
+        return UserRights.find_sessions_rights_masks(self.__schema.get_session(), session_tokens)
+
+    def close_session(self, session_token: str) -> None:
+        """ Deactivates an active session, setting the current time as its update time.
+        ---
+        Parameters:
+            - session_token: The session token.
+        Throws:
+            - SessionNotFoundError: When the session was not found or is inactive.
+        """
+        session: Session = self.__schema.get_session()
+        # Stop trusting the cached token before the session is even looked up
+        UserSessions.evict_cached_session(session, session_token)
+        user_session: UserSession = UserSessions.get_active_user_session(
+            session, session_token
+        )
+        user_session.deactivate(session)
+
+    def iter_sessions(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        username: Optional[str] = None,
+        active_only: bool = False
+    ) -> Iterator[Tuple[str, str, bool, datetime, datetime]]:
+        """ Iterates over the user sessions, in ascending order of their keys.
+
+        Rows are read from the database as the iterator is advanced, using a
+        database session of its own.
+        ---
+        Parameters:
+            - after: If set, only the sessions whose key follows it are retrieved.
+            - limit: If set, the maximum number of sessions retrieved.
+            - username: If set, only the sessions of this user are retrieved.
+            - active_only: Whether only active sessions should be retrieved or not (default).
+        Returns:
+            An iterator of (key, user name, active, created, updated) tuples.
+        """
+        session: Session = self.__schema.new_session()
+        try:
+            yield from UserSessions.iter_sessions(session, after, limit, username, active_only)
+        finally:
+            session.close()
+
+    def expire_idle_sessions(self, idle_since: datetime, batch_size: int) -> Tuple[int, int]:
+        """ Deactivates the active sessions not updated since a given time, each batch
+        in its own transaction.
+        ---
+        Parameters:
+            - idle_since: A datetime; active sessions last updated before it are deactivated.
+            - batch_size: The maximum number of sessions deactivated per transaction.
+        Returns:
+            A tuple with the number of sessions scanned and deactivated.
+        """
+        # Buffered update times must be visible, or recently used sessions would look idle
+        touch_buffer = self.__schema.get_touch_buffer()
+        if touch_buffer is not None:
+            touch_buffer.flush()
+        session: Session = self.__schema.new_session()
+        try:
+            return UserSessions.expire_idle_sessions(session, idle_since, batch_size)
+        finally:
+            session.close()
+
+    def purge_inactive_sessions(
+        self, inactive_since: datetime, batch_size: int
+    ) -> Tuple[int, int]:
+        """ Deletes the inactive sessions not updated since a given time, each batch
+        in its own transaction.
+        ---
+        Parameters:
+            - inactive_since: A datetime; inactive sessions last updated before it are deleted.
+            - batch_size: The maximum number of sessions deleted per transaction.
+        Returns:
+            A tuple with the number of sessions scanned and deleted.
+        """
+        session: Session = self.__schema.new_session()
+        try:
+            return UserSessions.purge_inactive_sessions(session, inactive_since, batch_size)
+        finally:
+            session.close()
@@ -0,0 +1,43 @@
+""" LazyImports class module.
+"""
+
+import importlib
+from typing import Any, Dict
+
+
+class LazyImports():
+    """ Class responsible of importing the classes exported by a package on their
+    first use, so that importing the package does not import their dependencies.
+
+    An instance is meant to be the `__getattr__` of the package module (see PEP
+    562); the classes should still be imported in an `if TYPE_CHECKING:` block,
+    so type checkers know about them.
+    """
+
+    def __init__(self, package: str, modules: Dict[str, str]):
+        """ Constructor method.
+        ---
+        Parameters:
+            - package: The name of the package module.
+            - modules: A dictionary mapping each lazily imported class name to the
+                       module defining it, relative to the package (e.g., `.asyncschema`).
+        """
+        self.__package: str = package
+        self.__modules: Dict[str, str] = modules
+
+    def __call__(self, name: str) -> Any:
+        """ Imports a class of the package.
+        ---
+        Parameters:
+            - name: The class name.
+        Returns:
+            The class.
+        Throws:
+            - An `AttributeError` if the package does not export a class with that name.
+        """
+        module: str = self.__modules.get(name, '')
+        if not module:
+            raise AttributeError(
+                'module ' + repr(self.__package) + ' has no attribute ' + repr(name)
+            )
+        return getattr(importlib.import_module(module, self.__package), name)
@@ -1,7 +1,22 @@
 """ Authentication logic classes
 """
 
+from typing import TYPE_CHECKING
+from dms2021auth.lazyimports import LazyImports
+from .passwordhasher import PasswordHasher
+from .sessionreaper import SessionReaper
+from .sessiontokenmanager import SessionTokenManager
 from .usermanager import UserManager
 from .usersessionmanager import UserSessionManager
 from .userrightmanager import UserRightManager
 from .userrightvalidator import UserRightValidator
+
+if TYPE_CHECKING:
+    from .asyncuserrightvalidator import AsyncUserRightValidator
+    from .asyncusersessionmanager import AsyncUserSessionManager
+
+# The asyncio classes are imported on first use; the threaded service does without them
+__getattr__ = LazyImports(__name__, {
+    'AsyncUserRightValidator': '.asyncuserrightvalidator',
+    'AsyncUserSessionManager': '.asyncusersessionmanager'
+})
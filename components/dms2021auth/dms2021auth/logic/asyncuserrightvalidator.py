@@ -0,0 +1,63 @@
+""" AsyncUserRightValidator class module.
+"""
+
+from typing import List
+from dms2021core.data import UserRightName
+from dms2021auth.data.db import AsyncSchema
+from dms2021auth.logic.userrightvalidator import UserRightValidator
+
+
+class AsyncUserRightValidator():
+    """ Toolkit class to validate user rights from coroutines.
+
+    The validations are delegated to a `UserRightValidator`, run in the
+    database threads pool.
+    """
+
+    def __init__(self, user_right_validator: UserRightValidator, async_schema: AsyncSchema):
+        """ Constructor method.
+
+        Initializes the validator.
+        ---
+        Parameters:
+            - user_right_validator: The validator performing the validations.
+            - async_schema: The AsyncSchema instance running the database work.
+        """
+        self.__user_right_validator: UserRightValidator = user_right_validator
+        self.__async_schema: AsyncSchema = async_schema
+
+    def get_user_right_validator(self) -> UserRightValidator:
+        """ Gets the validator performing the validations.
+        ---
+        Returns:
+            The UserRightValidator instance.
+        """
+        return self.__user_right_validator
+
+    async def has_right(self, username: str, right: UserRightName) -> bool:
+        """ Determines whether a given user has a certain right or not.
+        ---
+        Parameters:
+            - username: The user name string.
+            - right: The right name.
+        Returns:
+            True if the user has the given right; false otherwise.
+        """
+        return await self.__async_schema.run(
+            self.__user_right_validator.has_right, username, right
+        )
+
+    async def enforce_rights(self, session_token: str, rights: List[UserRightName]) -> None:
+        """ Raises an error if the owner of session identified by the token
+        does not have all of the provided rights.
+        ---
+        Parameters:
+            - session_token: The session token string.
+            - rights: A list of user right names.
+        Throws:
+            - SessionNotFoundError: If the session does not exist or is not active.
+            - InsufficientRightsError: If the user lacks any of the rights.
+        """
+        await self.__async_schema.run(
+            self.__user_right_validator.enforce_rights, session_token, rights
+        )
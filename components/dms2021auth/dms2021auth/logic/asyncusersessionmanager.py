@@ -0,0 +1,129 @@
+""" AsyncUserSessionManager class module.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from dms2021auth.data.db import AsyncSchema
+from dms2021auth.logic.asyncuserrightvalidator import AsyncUserRightValidator
+from dms2021auth.logic.usersessionmanager import UserSessionManager
+
+
+class AsyncUserSessionManager():
+    """ Class responsible of the user session management logic for coroutines.
+
+    The operations are delegated to a `UserSessionManager`, run in the
+    database threads pool. Logging in waits for a password hash verification,
+    so the number of concurrent logins is bounded to keep threads available
+    for the rest of the requests.
+    """
+
+    def __init__(
+        self, user_session_manager: UserSessionManager, async_schema: AsyncSchema,
+        max_logins: int
+    ):
+        """ Constructor method.
+
+        Initializes the manager.
+        ---
+        Parameters:
+            - user_session_manager: The manager performing the operations.
+            - async_schema: The AsyncSchema instance running the database work.
+            - max_logins: The maximum number of logins run concurrently.
+        """
+        self.__user_session_manager: UserSessionManager = user_session_manager
+        self.__async_schema: AsyncSchema = async_schema
+        self.__max_logins: int = max(max_logins, 1)
+        # Created within the running loop, which it binds to (before Python 3.10)
+        self.__login_slots: Optional[asyncio.Semaphore] = None
+
+    def get_user_session_manager(self) -> UserSessionManager:
+        """ Gets the manager performing the operations.
+        ---
+        Returns:
+            The UserSessionManager instance.
+        """
+        return self.__user_session_manager
+
+    def get_async_schema(self) -> AsyncSchema:
+        """ Gets the instance running the database work.
+        ---
+        Returns:
+            The AsyncSchema instance.
+        """
+        return self.__async_schema
+
+    async def login(self, username: str, password: str) -> str:
+        """ Logs a user in. I.e., creates or reuses a session if the credentials are correct.
+        ---
+        Parameters:
+            - username: The user name string.
+            - password: The user password string.
+        Returns:
+            The user session token.
+        Throws:
+            - InvalidCredentialsError: When the credentials used to log in are wrong.
+        """
+        if self.__login_slots is None:
+            self.__login_slots = asyncio.Semaphore(self.__max_logins)
+        async with self.__login_slots:
+            return await self.__async_schema.run(
+                self.__user_session_manager.login, username, password
+            )
+
+    async def logout(self, session_token: str) -> None:
+        """ Logs a user out. I.e., deactivates the given session.
+        ---
+        Parameters:
+            - session_token: The token of the session to deactivate.
+        Throws:
+            - SessionNotFound: When the provided session was not found or is inactive.
+        """
+        await self.__async_schema.run(self.__user_session_manager.logout, session_token)
+
+    async def validate_sessions(self, session_tokens: List[str]) -> Dict[str, Tuple[str, int]]:
+        """ Finds which of the given sessions are active, along with their owners' rights.
+        ---
+        Parameters:
+            - session_tokens: The list of session token strings.
+        Returns:
+            A dictionary mapping the tokens of the active sessions to a tuple with the
+            user name string and the integer rights bitmask. Any other token is left out.
+        """
+        return await self.__async_schema.run(
+            self.__user_session_manager.validate_sessions, session_tokens
+        )
+
+    async def list_sessions(
+        self,
+        session_token: str,
+        right_validator: AsyncUserRightValidator,
+        *,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        username: Optional[str] = None,
+        active_only: bool = False
+    ) -> Iterator[Tuple[str, str, bool, datetime, datetime]]:
+        """ Lists the user sessions, in ascending order of their keys.
+
+        The returned iterator reads the rows from the database as it is advanced,
+        so it must be advanced in the database threads pool too.
+        ---
+        Parameters:
+            - session_token: The token of the session, used to verify that
+                             the requestor has sufficient rights.
+            - right_validator: The user right validator to use.
+            - after: If set, only the sessions whose key follows it are listed.
+            - limit: If set, the maximum number of sessions listed.
+            - username: If set, only the sessions of this user are listed.
+            - active_only: Whether only active sessions should be listed or not (default).
+        Returns:
+            An iterator of (key, user name, active, created, updated) tuples.
+        Throws:
+            - InsufficientRightsError: If the requestor does not have the required rights.
+        """
+        return await self.__async_schema.run(
+            self.__user_session_manager.list_sessions, session_token,
+            right_validator.get_user_right_validator(), after=after, limit=limit,
+            username=username, active_only=active_only
+        )
@@ -0,0 +1,7 @@
+""" Password key derivation functions.
+"""
+
+from .kdfbase import KdfBase
+from .pbkdf2kdf import Pbkdf2Kdf
+from .scryptkdf import ScryptKdf
+from .legacysha256kdf import LegacySha256Kdf
@@ -0,0 +1,86 @@
+""" KdfBase class module.
+"""
+
+import base64
+from abc import ABC, abstractmethod
+
+
+class KdfBase(ABC):
+    """ Base class for the password key derivation functions.
+
+    Derived hashes are self-describing strings with the format
+    `<name>$<parameter>$...$<salt>$<hash>`, so any supported function can verify
+    them regardless of the one currently configured.
+    """
+
+    @abstractmethod
+    def get_name(self) -> str:
+        """ Gets the identifier of the function, used as the prefix of its hashes.
+        ---
+        Returns:
+            The function name string.
+        """
+
+    @abstractmethod
+    def derive(self, secret: str) -> str:
+        """ Derives a new hash from a secret, using a random salt.
+        ---
+        Parameters:
+            - secret: The secret string (the password and its suffixes).
+        Returns:
+            The self-describing hash string.
+        """
+
+    @abstractmethod
+    def verify(self, secret: str, encoded: str) -> bool:
+        """ Verifies a secret against a hash produced by this function.
+        ---
+        Parameters:
+            - secret: The secret string.
+            - encoded: The self-describing hash string.
+        Returns:
+            True if the secret matches the hash; false otherwise.
+        """
+
+    def handles(self, encoded: str) -> bool:
+        """ Determines whether a hash was produced by this function.
+        ---
+        Parameters:
+            - encoded: The hash string.
+        Returns:
+            True if the hash can be verified by this function; false otherwise.
+        """
+        return encoded.startswith(self.get_name() + '$')
+
+    def needs_rehash(self, encoded: str) -> bool:  # pylint: disable=unused-argument
+        """ Determines whether a hash produced by this function should be replaced
+        because it was derived with outdated parameters.
+        ---
+        Parameters:
+            - encoded: The hash string.
+        Returns:
+            True if the hash should be derived again; false otherwise.
+        """
+        return False
+
+    @staticmethod
+    def _encode_bytes(data: bytes) -> str:
+        """ Encodes binary data to be embedded in a hash string.
+        ---
+        Parameters:
+            - data: The bytes to encode.
+        Returns:
+            An unpadded base64 string.
+        """
+        return base64.b64encode(data).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def _decode_bytes(data: str) -> bytes:
+        """ Decodes binary data embedded in a hash string.
+        ---
+        Parameters:
+            - data: The unpadded base64 string.
+        Returns:
+            The decoded bytes.
+        """
+        return base64.b64decode(data + '=' * (-len(data) % 4))
@@ -0,0 +1,66 @@
+""" LegacySha256Kdf class module.
+"""
+
+import hashlib
+import hmac
+import re
+from dms2021auth.logic.kdf.kdfbase import KdfBase
+
+
+class LegacySha256Kdf(KdfBase):
+    """ Single unsalted SHA-256 round, as used by the first versions of the service.
+
+    Its hashes are bare hexadecimal digests. It is only kept to verify them so
+    they can be upgraded; it always requests a rehash.
+    """
+
+    __DIGEST_PATTERN = re.compile('^[0-9a-f]{64}$')
+
+    def get_name(self) -> str:
+        """ Gets the identifier of the function.
+        ---
+        Returns:
+            The function name string.
+        """
+        return 'sha256'
+
+    def handles(self, encoded: str) -> bool:
+        """ Determines whether a hash is a bare SHA-256 hexadecimal digest.
+        ---
+        Parameters:
+            - encoded: The hash string.
+        Returns:
+            True if the hash can be verified by this function; false otherwise.
+        """
+        return LegacySha256Kdf.__DIGEST_PATTERN.match(encoded) is not None
+
+    def derive(self, secret: str) -> str:
+        """ Derives a hash from a secret.
+        ---
+        Parameters:
+            - secret: The secret string (the password and its suffixes).
+        Returns:
+            The hexadecimal digest string.
+        """
+        return hashlib.sha256(bytes(secret, 'utf-8')).hexdigest()
+
+    def verify(self, secret: str, encoded: str) -> bool:
+        """ Verifies a secret against a legacy hash.
+        ---
+        Parameters:
+            - secret: The secret string.
+            - encoded: The hexadecimal digest string.
+        Returns:
+            True if the secret matches the hash; false otherwise.
+        """
+        return hmac.compare_digest(self.derive(secret), encoded)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """ Legacy hashes must always be replaced.
+        ---
+        Parameters:
+            - encoded: The hash string.
+        Returns:
+            True.
+        """
+        return True
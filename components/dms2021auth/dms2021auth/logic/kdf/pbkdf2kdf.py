@@ -0,0 +1,76 @@
+""" Pbkdf2Kdf class module.
+"""
+
+import hashlib
+import hmac
+import os
+from dms2021auth.logic.kdf.kdfbase import KdfBase
+
+
+class Pbkdf2Kdf(KdfBase):
+    """ PBKDF2-HMAC-SHA256 key derivation function.
+
+    Hashes have the format `pbkdf2_sha256$<iterations>$<salt>$<hash>`.
+    """
+
+    def __init__(self, iterations: int = 260000):
+        """ Constructor method.
+        ---
+        Parameters:
+            - iterations: The number of iterations (the cost) of new hashes.
+        """
+        self.__iterations: int = iterations
+
+    def get_name(self) -> str:
+        """ Gets the identifier of the function, used as the prefix of its hashes.
+        ---
+        Returns:
+            The function name string.
+        """
+        return 'pbkdf2_sha256'
+
+    def derive(self, secret: str) -> str:
+        """ Derives a new hash from a secret, using a random salt.
+        ---
+        Parameters:
+            - secret: The secret string (the password and its suffixes).
+        Returns:
+            The self-describing hash string.
+        """
+        salt: bytes = os.urandom(16)
+        digest: bytes = hashlib.pbkdf2_hmac(
+            'sha256', secret.encode('utf-8'), salt, self.__iterations
+        )
+        return '$'.join([
+            self.get_name(), str(self.__iterations),
+            self._encode_bytes(salt), self._encode_bytes(digest)
+        ])
+
+    def verify(self, secret: str, encoded: str) -> bool:
+        """ Verifies a secret against a hash produced by this function.
+        ---
+        Parameters:
+            - secret: The secret string.
+            - encoded: The self-describing hash string.
+        Returns:
+            True if the secret matches the hash; false otherwise.
+        """
+        try:
+            _, iterations, salt, digest = encoded.split('$')
+            expected: bytes = self._decode_bytes(digest)
+            actual: bytes = hashlib.pbkdf2_hmac(
+                'sha256', secret.encode('utf-8'), self._decode_bytes(salt), int(iterations)
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """ Determines whether a hash was derived with a different number of iterations.
+        ---
+        Parameters:
+            - encoded: The hash string.
+        Returns:
+            True if the hash should be derived again; false otherwise.
+        """
+        return encoded.split('$')[1] != str(self.__iterations)
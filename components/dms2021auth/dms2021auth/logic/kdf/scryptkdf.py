@@ -0,0 +1,93 @@
+""" ScryptKdf class module.
+"""
+
+import hashlib
+import hmac
+import os
+from dms2021auth.logic.kdf.kdfbase import KdfBase
+
+
+class ScryptKdf(KdfBase):
+    """ scrypt key derivation function.
+
+    Hashes have the format `scrypt$<n>$<r>$<p>$<salt>$<hash>`.
+    """
+
+    def __init__(self, cost: int = 16384, block_size: int = 8, parallelization: int = 1):
+        """ Constructor method.
+        ---
+        Parameters:
+            - cost: The CPU/memory cost (n) of new hashes. Must be a power of 2.
+            - block_size: The block size (r) of new hashes.
+            - parallelization: The parallelization factor (p) of new hashes.
+        """
+        self.__parameters: str = '$'.join([str(cost), str(block_size), str(parallelization)])
+
+    def get_name(self) -> str:
+        """ Gets the identifier of the function, used as the prefix of its hashes.
+        ---
+        Returns:
+            The function name string.
+        """
+        return 'scrypt'
+
+    def derive(self, secret: str) -> str:
+        """ Derives a new hash from a secret, using a random salt.
+        ---
+        Parameters:
+            - secret: The secret string (the password and its suffixes).
+        Returns:
+            The self-describing hash string.
+        """
+        salt: bytes = os.urandom(16)
+        digest: bytes = ScryptKdf.__scrypt(secret, salt, self.__parameters)
+        return '$'.join([
+            self.get_name(), self.__parameters,
+            self._encode_bytes(salt), self._encode_bytes(digest)
+        ])
+
+    def verify(self, secret: str, encoded: str) -> bool:
+        """ Verifies a secret against a hash produced by this function.
+        ---
+        Parameters:
+            - secret: The secret string.
+            - encoded: The self-describing hash string.
+        Returns:
+            True if the secret matches the hash; false otherwise.
+        """
+        try:
+            _, cost, block_size, parallelization, salt, digest = encoded.split('$')
+            expected: bytes = self._decode_bytes(digest)
+            actual: bytes = ScryptKdf.__scrypt(
+                secret, self._decode_bytes(salt), '$'.join([cost, block_size, parallelization])
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """ Determines whether a hash was derived with different cost parameters.
+        ---
+        Parameters:
+            - encoded: The hash string.
+        Returns:
+            True if the hash should be derived again; false otherwise.
+        """
+        return '$'.join(encoded.split('$')[1:4]) != self.__parameters
+
+    @staticmethod
+    def __scrypt(secret: str, salt: bytes, parameters: str) -> bytes:
+        """ Runs the scrypt function.
+        ---
+        Parameters:
+            - secret: The secret string.
+            - salt: The salt bytes.
+            - parameters: The `<n>$<r>$<p>` parameters string.
+        Returns:
+            The 32 bytes long derived key.
+        """
+        cost, block_size, parallelization = (int(value) for value in parameters.split('$'))
+        return hashlib.scrypt(
+            secret.encode('utf-8'), salt=salt, n=cost, r=block_size, p=parallelization,
+            maxmem=256 * cost * block_size * parallelization, dklen=32
+        )
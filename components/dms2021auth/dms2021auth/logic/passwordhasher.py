@@ -0,0 +1,193 @@
+""" PasswordHasher class module.
+"""
+
+import secrets
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.logic.kdf import KdfBase, Pbkdf2Kdf, ScryptKdf, LegacySha256Kdf
+
+
+class PasswordHasher():  # pylint: disable=too-many-instance-attributes
+    """ Class responsible of hashing and verifying passwords.
+
+    Key derivation runs in a bounded pool of workers, so bursts of logins cannot
+    take more than its share of CPU from the rest of the requests.
+    """
+
+    def __init__(self, config: AuthConfiguration):
+        """ Constructor method.
+
+        Initializes the hasher. The workers are started on first use.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the hashing parameters.
+        """
+        self.__salt: str = config.get_password_salt()
+        self.__kdf: KdfBase
+        if config.get_password_hashing_algorithm() == 'scrypt':
+            self.__kdf = ScryptKdf(
+                config.get_password_hashing_scrypt_cost(),
+                config.get_password_hashing_scrypt_block_size(),
+                config.get_password_hashing_scrypt_parallelization()
+            )
+        else:
+            self.__kdf = Pbkdf2Kdf(config.get_password_hashing_iterations())
+        # Any previously used function can still verify its own hashes
+        self.__known_kdfs: List[KdfBase] = [
+            self.__kdf, Pbkdf2Kdf(), ScryptKdf(), LegacySha256Kdf()
+        ]
+        self.__config: AuthConfiguration = config
+        self.__pending: threading.BoundedSemaphore = threading.BoundedSemaphore(
+            max(config.get_password_hashing_max_pending(), 1)
+        )
+        self.__executor: Optional[Executor] = None
+        self.__executor_lock: threading.Lock = threading.Lock()
+        self.__dummy_hash: Optional[str] = None
+        self.__dummy_hash_lock: threading.Lock = threading.Lock()
+
+    def hash(self, username: str, password: str) -> str:
+        """ Hashes a password with the configured key derivation function.
+        ---
+        Parameters:
+            - username: The user name (it is used as a suffix to the password).
+            - password: The password itself.
+        Returns:
+            The self-describing password hash string.
+        """
+        return self.__run(self.__kdf.derive, self.__secret(username, password))
+
+    def hash_many(self, credentials: Iterable[Tuple[str, str]]) -> List[str]:
+        """ Hashes several passwords in parallel.
+        ---
+        Parameters:
+            - credentials: An iterable of (user name, password) tuples.
+        Returns:
+            The list of password hash strings, in the same order.
+        """
+        futures: List[Future] = [
+            self.__submit(self.__kdf.derive, self.__secret(username, password))
+            for username, password in credentials
+        ]
+        return [future.result() for future in futures]
+
+    def verify(self, username: str, password: str, encoded: str) -> bool:
+        """ Verifies a password against a hash produced by any supported function.
+        ---
+        Parameters:
+            - username: The user name.
+            - password: The password to verify.
+            - encoded: The stored password hash string.
+        Returns:
+            True if the password matches the hash; false otherwise.
+        """
+        for kdf in self.__known_kdfs:
+            if kdf.handles(encoded):
+                return self.__run(kdf.verify, self.__secret(username, password), encoded)
+        return False
+
+    def verify_dummy(self, username: str, password: str) -> bool:
+        """ Verifies a password against a hash no password matches.
+
+        Used when the user is unknown, so it takes as long to reject its
+        credentials as those of an existing user.
+        ---
+        Parameters:
+            - username: The user name.
+            - password: The password to verify.
+        Returns:
+            False, always.
+        """
+        self.verify(username, password, self.__get_dummy_hash())
+        return False
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """ Determines whether a hash should be replaced by one derived with the
+        configured function and parameters.
+        ---
+        Parameters:
+            - encoded: The stored password hash string.
+        Returns:
+            True if the password should be hashed again; false otherwise.
+        """
+        if not self.__kdf.handles(encoded):
+            return True
+        return self.__kdf.needs_rehash(encoded)
+
+    def shutdown(self) -> None:
+        """ Stops the workers, waiting for the pending jobs to finish.
+        """
+        with self.__executor_lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
+
+    def __secret(self, username: str, password: str) -> str:
+        """ Builds the secret whose hash is stored.
+        ---
+        Parameters:
+            - username: The user name (it is used as a suffix to the password).
+            - password: The password itself.
+        Returns:
+            The secret string.
+        """
+        return password + username + self.__salt
+
+    def __run(self, function: Callable, *args):
+        """ Runs a function in the workers pool and waits for its result.
+        ---
+        Parameters:
+            - function: The function to run.
+            - args: The function arguments.
+        Returns:
+            The function result.
+        """
+        return self.__submit(function, *args).result()
+
+    def __submit(self, function: Callable, *args) -> Future:
+        """ Queues a function in the workers pool, waiting for room in the queue if it is full.
+        ---
+        Parameters:
+            - function: The function to run.
+            - args: The function arguments.
+        Returns:
+            The Future of the function result.
+        """
+        self.__pending.acquire()  # pylint: disable=consider-using-with
+        try:
+            future: Future = self.__get_executor().submit(function, *args)
+        except:
+            self.__pending.release()
+            raise
+        future.add_done_callback(lambda _: self.__pending.release())
+        return future
+
+    def __get_dummy_hash(self) -> str:
+        """ Gets a hash derived with the configured function from a random secret,
+        deriving it on first use.
+        ---
+        Returns:
+            The self-describing password hash string.
+        """
+        with self.__dummy_hash_lock:
+            if self.__dummy_hash is None:
+                self.__dummy_hash = self.__run(self.__kdf.derive, secrets.token_hex(32))
+            return self.__dummy_hash
+
+    def __get_executor(self) -> Executor:
+        """ Gets the workers pool, creating it if needed.
+        ---
+        Returns:
+            The Executor instance.
+        """
+        with self.__executor_lock:
+            if self.__executor is None:
+                workers: int = self.__config.get_password_hashing_workers()
+                if self.__config.get_password_hashing_executor() == 'process':
+                    self.__executor = ProcessPoolExecutor(max_workers=workers)
+                else:
+                    self.__executor = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix='password-hasher'
+                    )
+            return self.__executor
@@ -0,0 +1,126 @@
+""" SessionReaper class module.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Union
+from sqlalchemy.orm import Session  # type: ignore
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.resultsets import RevokedTokens
+from dms2021auth.data.sessionstore import SessionStore
+from dms2021auth.logic.managerbase import ManagerBase
+
+
+class SessionReaper(ManagerBase):
+    """ Class responsible of closing idle user sessions and deleting old inactive ones.
+
+    It can be run on demand or periodically in a background thread.
+    """
+
+    def __init__(
+        self, config: AuthConfiguration, schema: Schema, session_store: SessionStore
+    ):
+        """ Constructor method.
+
+        Initializes the reaper. The background thread is not started until `start` is called.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the reaper parameters.
+            - schema: The database schema instance to use.
+            - session_store: The storage of the user sessions.
+        """
+        super().__init__(config, schema)
+        self.__session_store: SessionStore = session_store
+        self.__last_report: Optional[Dict[str, Union[int, float]]] = None
+        self.__lock: threading.Lock = threading.Lock()
+        self.__stop: threading.Event = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def run(self) -> Dict[str, Union[int, float]]:
+        """ Closes the idle sessions and deletes the old inactive ones right away,
+        along with the expired token revocations.
+        ---
+        Returns:
+            A dictionary with the number of sessions scanned, expired and deleted,
+            the number of revocations deleted and the run duration (in seconds).
+        """
+        config: AuthConfiguration = self.get_configuration()
+        batch_size: int = config.get_session_reaper_batch_size()
+        started: float = time.monotonic()
+        now: datetime = datetime.now()
+        report: Dict[str, Union[int, float]] = {
+            'scanned': 0, 'expired': 0, 'deleted': 0, 'revocations_deleted': 0
+        }
+        if config.get_session_reaper_idle_timeout() > 0:
+            scanned, report['expired'] = self.__session_store.expire_idle_sessions(
+                now - timedelta(seconds=config.get_session_reaper_idle_timeout()),
+                batch_size
+            )
+            report['scanned'] += scanned
+        if config.get_session_reaper_retention() > 0:
+            scanned, report['deleted'] = self.__session_store.purge_inactive_sessions(
+                now - timedelta(seconds=config.get_session_reaper_retention()),
+                batch_size
+            )
+            report['scanned'] += scanned
+        session: Session = self.get_schema().new_session()
+        try:
+            report['revocations_deleted'] = RevokedTokens.purge_expired(session, now)
+        finally:
+            session.close()
+        report['duration'] = time.monotonic() - started
+        with self.__lock:
+            self.__last_report = report
+        logging.getLogger(__name__).info(
+            'Session reaper run: %d scanned, %d expired, %d deleted, %d revocations deleted'
+            ' in %.3f s', report['scanned'], report['expired'], report['deleted'],
+            report['revocations_deleted'], report['duration']
+        )
+        return report
+
+    def get_last_report(self) -> Optional[Dict[str, Union[int, float]]]:
+        """ Gets the report of the latest run.
+        ---
+        Returns:
+            The dictionary returned by the latest `run`, or None if it never ran.
+        """
+        with self.__lock:
+            return self.__last_report
+
+    def start(self) -> None:
+        """ Starts running periodically in a background thread, unless disabled or already running.
+        """
+        if self.get_configuration().get_session_reaper_interval() <= 0:
+            return
+        with self.__lock:
+            if self.__thread is not None:
+                return
+            self.__stop.clear()
+            self.__thread = threading.Thread(
+                target=self.__loop, name='session-reaper', daemon=True
+            )
+            self.__thread.start()
+
+    def stop(self) -> None:
+        """ Stops the background thread, waiting for any ongoing run to finish.
+        """
+        with self.__lock:
+            thread: Optional[threading.Thread] = self.__thread
+            self.__thread = None
+        self.__stop.set()
+        if thread is not None:
+            thread.join()
+
+    def __loop(self) -> None:
+        """ Background thread loop, running the reaper once per configured interval.
+        """
+        interval: float = self.get_configuration().get_session_reaper_interval()
+        while not self.__stop.wait(interval):
+            try:
+                self.run()
+            except Exception:  # pylint: disable=broad-except
+                # Anything left behind is picked up by the next run
+                logging.getLogger(__name__).exception('Session reaper run failed')
@@ -0,0 +1,127 @@
+""" SessionTokenManager class module.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session  # type: ignore
+from dms2021core.data import SignedSessionToken
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.data.cache import RevocationList
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.resultsets import RevokedTokens, UserRights
+from dms2021auth.logic.managerbase import ManagerBase
+
+
+class SessionTokenManager(ManagerBase):
+    """ Class responsible of issuing and verifying signed session tokens.
+
+    Signed tokens carry the session owner and rights, so they are verified
+    without looking the session up. Revoked sessions are kept in memory and
+    reloaded from the database periodically, to learn those revoked by other
+    processes.
+    """
+
+    def __init__(self, config: AuthConfiguration, schema: Schema):
+        """ Constructor method.
+
+        Initializes the manager.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the signing key and token lifetime.
+            - schema: The database schema instance to use.
+        """
+        super().__init__(config, schema)
+        self.__key: Optional[bytes] = config.get_signed_tokens_key()
+        self.__revocations: RevocationList = RevocationList()
+        self.__next_refresh: float = 0.0
+        self.__refresh_lock: threading.Lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        """ Determines whether session tokens are signed.
+        ---
+        Returns:
+            True if a signing key is configured; false otherwise.
+        """
+        return self.__key is not None
+
+    def issue(self, session_id: str, username: str) -> str:
+        """ Issues a signed token for a session, carrying the current rights of its owner.
+        ---
+        Parameters:
+            - session_id: The session id string.
+            - username: The session owner user name.
+        Returns:
+            The encoded token string.
+        """
+        session: Session = self.get_schema().get_session()
+        rights_mask: int = UserRights.get_rights_mask(session, username)
+        issued: int = int(time.time())
+        expires: int = issued + self.get_configuration().get_signed_tokens_lifetime()
+        return SignedSessionToken(
+            session_id, username, rights_mask, issued, expires
+        ).encode(self.__key or b'')
+
+    def decode(self, token: str) -> Optional[SignedSessionToken]:
+        """ Decodes a signed token, verifying its signature but not whether it is current.
+        ---
+        Parameters:
+            - token: The encoded token string.
+        Returns:
+            The SignedSessionToken, or None if signing is disabled or the token is not valid.
+        """
+        if self.__key is None:
+            return None
+        return SignedSessionToken.decode(self.__key, token)
+
+    def verify(self, token: str) -> Optional[SignedSessionToken]:
+        """ Verifies a signed token.
+        ---
+        Parameters:
+            - token: The encoded token string.
+        Returns:
+            The SignedSessionToken, or None if it is not valid, has expired or its
+            session was revoked.
+        """
+        signed_token: Optional[SignedSessionToken] = self.decode(token)
+        if signed_token is None or signed_token.is_expired(time.time()):
+            return None
+        self.__refresh_revocations()
+        if self.__revocations.contains(signed_token.get_session_id()):
+            return None
+        return signed_token
+
+    def revoke(self, session_id: str) -> None:
+        """ Revokes every token issued for a session.
+        ---
+        Parameters:
+            - session_id: The session id string.
+        """
+        # Any token issued so far expires within a lifetime from now
+        expires: float = time.time() + self.get_configuration().get_signed_tokens_lifetime()
+        session: Session = self.get_schema().get_session()
+        RevokedTokens.revoke(session, session_id, datetime.fromtimestamp(expires))
+        self.__revocations.add(session_id, expires)
+
+    def __refresh_revocations(self) -> None:
+        """ Reloads the revoked sessions from the database, if due.
+
+        Only one thread reloads them at a time; the rest keep using the list as is.
+        """
+        if time.monotonic() < self.__next_refresh:
+            return
+        if not self.__refresh_lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return
+        try:
+            session: Session = self.get_schema().get_session()
+            revoked = RevokedTokens.find_unexpired(session, datetime.now())
+            self.__revocations.merge(
+                [(session_id, expires.timestamp()) for session_id, expires in revoked],
+                time.time()
+            )
+            self.__next_refresh = (
+                time.monotonic() + self.get_configuration().get_signed_tokens_revocation_refresh()
+            )
+        finally:
+            self.__refresh_lock.release()
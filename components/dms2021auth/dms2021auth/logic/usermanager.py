@@ -1,9 +1,13 @@
 """ UserManager class module.
 """
 
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 from dms2021core.data import UserRightName
-from dms2021auth.data.db.resultsets import Users
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.data.db import Schema
+from dms2021auth.data.db.resultsets import Users, Lookups
 from dms2021auth.logic.managerbase import ManagerBase
+from dms2021auth.logic.passwordhasher import PasswordHasher
 from dms2021auth.logic.userrightvalidator import UserRightValidator
 
 
@@ -11,6 +15,19 @@ class UserManager(ManagerBase):
     """ Class responsible of the user management logic.
     """
 
+    def __init__(self, config: AuthConfiguration, schema: Schema, password_hasher: PasswordHasher):
+        """ Constructor method.
+
+        Initializes the manager.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the manager configurable parameters.
+            - schema: The database schema instance to use.
+            - password_hasher: The hasher used to derive and verify the password hashes.
+        """
+        super().__init__(config, schema)
+        self.__set_password_hasher(password_hasher)
+
     def create_user(
         self,
         username: str,
@@ -37,14 +54,148 @@ class UserManager(ManagerBase):
             raise ValueError('A non-empty username is required.')
         if not password:
             raise ValueError('A non-empty password is required.')
-        session = self.get_schema().new_session()
+        session = self.get_schema().get_session()
         if not superuser:
             right_validator.enforce_rights(session_token, [UserRightName.AdminUsers])
-        password_hash = self.__calculate_password_hash(username, password)
+        password_hash = self.get_password_hasher().hash(username, password)
         Users.create(session, username, password_hash)
 
+    def create_users(
+        self,
+        users: Iterable[Tuple[str, str]],
+        session_token: str,
+        right_validator: UserRightValidator,
+        superuser: bool = False
+    ) -> Iterator[Tuple[str, str]]:
+        """ Creates many users, with a single rights check.
+
+        Users are consumed and created in chunks as the returned iterator is
+        advanced, so arbitrarily long streams can be imported. The passwords of
+        each chunk are hashed in parallel and its users inserted in one transaction.
+        ---
+        Parameters:
+            - users: An iterable of (user name, password) tuples.
+            - session_token: The token of the session, used to verify that
+                             the requestor has sufficient rights.
+            - right_validator: The user right validator to use.
+            - superuser: If set, will not validate the requestor rights.
+                         Use ONLY for administrative purposes.
+        Returns:
+            An iterator of (user name, outcome) tuples, in the same order as the users.
+            The outcome is `created`, `exists` (also for repeated user names) or
+            `invalid` (if either the user name or the password is empty).
+        Throws:
+            - InsufficientRightsError: If the requestor does not have the required rights.
+        """
+        if not superuser:
+            right_validator.enforce_rights(session_token, [UserRightName.AdminUsers])
+        return self.__create_users_in_chunks(users)
+
+    def __create_users_in_chunks(
+        self, users: Iterable[Tuple[str, str]]
+    ) -> Iterator[Tuple[str, str]]:
+        """ Creates many users, a chunk at a time.
+        ---
+        Parameters:
+            - users: An iterable of (user name, password) tuples.
+        Returns:
+            An iterator of (user name, outcome) tuples.
+        """
+        chunk_size: int = self.get_configuration().get_bulk_chunk_size()
+        chunk: List[Tuple[str, str]] = []
+        for user in users:
+            chunk.append(user)
+            if len(chunk) >= chunk_size:
+                yield from self.__create_users_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self.__create_users_chunk(chunk)
+
+    def __create_users_chunk(self, chunk: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """ Creates a chunk of users in a single transaction.
+        ---
+        Parameters:
+            - chunk: A list of (user name, password) tuples.
+        Returns:
+            A list of (user name, outcome) tuples.
+        """
+        session = self.get_schema().get_session()
+        valid: List[Tuple[str, str]] = [
+            (username, password) for username, password in chunk if username and password
+        ]
+        # Passwords of existing users are not hashed in vain
+        existing: Set[str] = Users.find_existing_usernames(
+            session, [username for username, _ in valid]
+        )
+        pending: List[Tuple[str, str]] = []
+        for username, password in valid:
+            if username not in existing:
+                existing.add(username)
+                pending.append((username, password))
+        password_hashes: List[str] = self.get_password_hasher().hash_many(pending)
+        created: Set[str] = Users.create_many(session, [
+            (username, password_hash)
+            for (username, _), password_hash in zip(pending, password_hashes)
+        ])
+        outcomes: List[Tuple[str, str]] = []
+        for username, password in chunk:
+            if not username or not password:
+                outcomes.append((username, 'invalid'))
+            elif username in created:
+                outcomes.append((username, 'created'))
+                # Repetitions further in the chunk already exist
+                created.remove(username)
+            else:
+                outcomes.append((username, 'exists'))
+        return outcomes
+
+    def list_users(
+        self,
+        session_token: str,
+        right_validator: UserRightValidator,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[str]:
+        """ Lists the user names, in ascending order.
+
+        Rows are read from the database as the returned iterator is advanced,
+        using a database session of its own.
+        ---
+        Parameters:
+            - session_token: The token of the session, used to verify that
+                             the requestor has sufficient rights.
+            - right_validator: The user right validator to use.
+            - after: If set, only the user names following it are listed.
+            - limit: If set, the maximum number of user names listed.
+        Returns:
+            An iterator of user name strings.
+        Throws:
+            - InsufficientRightsError: If the requestor does not have the required rights.
+        """
+        right_validator.enforce_rights(session_token, [UserRightName.AdminUsers])
+        return self.__iter_usernames(after, limit)
+
+    def __iter_usernames(self, after: Optional[str], limit: Optional[int]) -> Iterator[str]:
+        """ Iterates over the user names with a dedicated database session.
+        ---
+        Parameters:
+            - after: If set, only the user names following it are listed.
+            - limit: If set, the maximum number of user names listed.
+        Returns:
+            An iterator of user name strings.
+        """
+        session = self.get_schema().new_session()
+        try:
+            yield from Users.iter_usernames(session, after, limit)
+        finally:
+            session.close()
+
     def user_exists(self, username: str, password: str) -> bool:
         """ Verifies whether a user with the given credentials exists or not.
+
+        Password hashes derived with outdated functions or parameters are
+        replaced after a successful verification. Credentials of unknown users
+        are verified against a dummy hash, not to reveal which users exist.
         ---
         Parameters:
             - username: The user name string.
@@ -52,18 +203,34 @@ class UserManager(ManagerBase):
         Returns:
             True if the user exists and the credentials are correct; false otherwise.
         """
-        session = self.get_schema().new_session()
-        password_hash = self.__calculate_password_hash(username, password)
-        return Users.user_exists(session, username, password_hash)
+        session = self.get_schema().get_session()
+        password_hash: Optional[str] = Lookups.find_password_hash(
+            session, username, replica=True
+        )
+        password_hasher: PasswordHasher = self.get_password_hasher()
+        if password_hash is None:
+            # Unknown users take as long to reject as wrong passwords
+            return password_hasher.verify_dummy(username, password)
+        if not password_hasher.verify(username, password, password_hash):
+            return False
+        if password_hasher.needs_rehash(password_hash):
+            Users.update_password_hash(
+                session, username, password_hasher.hash(username, password)
+            )
+        return True
 
-    def __calculate_password_hash(self, username: str, password: str) -> str:
-        """ Calculates the password hash of a user.
+    def get_password_hasher(self) -> PasswordHasher:
+        """ Gets the password hasher being used by this instance.
         ---
-        Parameters:
-            - username: The username (it is used as a suffix to the password)
-            - password: The password itself.
         Returns:
-            A string with the password hash.
+            The PasswordHasher object used by the manager.
+        """
+        return self.__password_hasher
+
+    def __set_password_hasher(self, password_hasher: PasswordHasher):
+        """ Sets the password hasher to be used by this instance.
+        ---
+        Parameters:
+            - password_hasher: The password hasher instance to use.
         """
-        salt = self.get_configuration().get_password_salt()
-        return Users.hash_password(password, suffix=username, salt=salt)
+        self.__password_hasher = password_hasher
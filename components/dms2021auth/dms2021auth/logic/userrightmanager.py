@@ -1,11 +1,13 @@
 """ UserRightManager class module.
 """
 
+from typing import Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session  # type: ignore
 from dms2021core.data import UserRightName
 from dms2021auth.data.config import AuthConfiguration
 from dms2021auth.data.db import Schema
 from dms2021auth.data.db.resultsets import UserRights
+from dms2021auth.data.db.exc import UserNotFoundError
 from dms2021auth.logic.managerbase import ManagerBase
 from dms2021auth.logic.usersessionmanager import UserSessionManager
 from dms2021auth.logic.userrightvalidator import UserRightValidator
@@ -52,7 +54,7 @@ class UserRightManager(ManagerBase):
         Throws:
             - InsufficientRightsError: If the requestor does not have the required rights.
         """
-        session: Session = self.get_schema().new_session()
+        session: Session = self.get_schema().get_session()
         if not superuser:
             right_validator.enforce_rights(session_token, [UserRightName.AdminRights])
         UserRights.grant(session, username, right)
@@ -78,11 +80,71 @@ class UserRightManager(ManagerBase):
         Throws:
             - InsufficientRightsError: If the requestor does not have the required rights.
         """
-        session: Session = self.get_schema().new_session()
+        session: Session = self.get_schema().get_session()
         if not superuser:
             right_validator.enforce_rights(session_token, [UserRightName.AdminRights])
         UserRights.revoke(session, username, right)
 
+    def apply_changes(
+        self,
+        changes: Iterable[Tuple[str, UserRightName, bool]],
+        session_token: str,
+        right_validator: UserRightValidator,
+        superuser: bool = False
+    ) -> List[str]:
+        """ Grants and revokes many rights at once, with a single rights check.
+
+        Changes take effect as if they were made one after another. They are
+        written in chunks, each in a single transaction.
+        ---
+        Parameters:
+            - changes: An iterable of (user name, right, grant) tuples; grant is True
+                       to grant the right, or False to revoke it.
+            - session_token: The token of the session, used to verify that
+                             the requestor has sufficient rights.
+            - right_validator: The user right validator to use.
+            - superuser: If set, will not validate the requestor rights.
+                         Use ONLY for administrative purposes.
+        Returns:
+            The list of outcomes, one per change and in the same order: `granted`,
+            `revoked`, `unchanged` or `user_not_found`.
+        Throws:
+            - InsufficientRightsError: If the requestor does not have the required rights.
+        """
+        session: Session = self.get_schema().get_session()
+        if not superuser:
+            right_validator.enforce_rights(session_token, [UserRightName.AdminRights])
+        chunk_size: int = self.get_configuration().get_bulk_chunk_size()
+        outcomes: List[str] = []
+        chunk: List[Tuple[str, UserRightName, bool]] = []
+        for change in changes:
+            chunk.append(change)
+            if len(chunk) >= chunk_size:
+                outcomes.extend(UserRights.apply_changes(session, chunk))
+                chunk = []
+        if chunk:
+            outcomes.extend(UserRights.apply_changes(session, chunk))
+        return outcomes
+
+    def get_rights(self, username: str) -> Tuple[int, int]:
+        """ Gets all the rights of a user.
+        ---
+        Parameters:
+            - username: The user name string.
+        Returns:
+            A tuple with the version of the user rights (increased whenever any of them
+            changes) and an integer bitmask with the rights.
+        Throws:
+            - UserNotFoundError: If the user does not exist.
+        """
+        session: Session = self.get_schema().get_session()
+        versioned_rights: Optional[Tuple[int, int]] = UserRights.find_versioned_rights_mask(
+            session, username
+        )
+        if versioned_rights is None:
+            raise UserNotFoundError()
+        return versioned_rights
+
     def get_user_session_manager(self) -> UserSessionManager:
         """ Gets the user session manager being used by this instance.
         ---
@@ -1,28 +1,37 @@
 """ UserRightValidator class module.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session  # type: ignore
-from dms2021core.data import UserRightName
+from dms2021core.data import UserRightName, UserRightMask, SignedSessionToken
 from dms2021auth.data.db import Schema
-from dms2021auth.data.db.results import UserRight, UserSession
-from dms2021auth.data.db.resultsets import UserRights, UserSessions
+from dms2021auth.data.db.exc import SessionNotFoundError
+from dms2021auth.data.db.resultsets import UserRights
+from dms2021auth.data.sessionstore import SessionStore
 from dms2021auth.logic.exc import InsufficientRightsError
+from dms2021auth.logic.sessiontokenmanager import SessionTokenManager
 
 
 class UserRightValidator():
     """ Toolkit class to validate user rights.
     """
 
-    def __init__(self, schema: Schema):
+    def __init__(
+        self, schema: Schema, session_store: SessionStore,
+        session_token_manager: Optional[SessionTokenManager] = None
+    ):
         """ Constructor method.
 
         Initializes the manager.
         ---
         Parameters:
             - schema: The database schema instance to use.
+            - session_store: The storage of the user sessions.
+            - session_token_manager: If set, the manager used to verify signed session tokens.
         """
         self.__set_schema(schema)
+        self.__session_store: SessionStore = session_store
+        self.__session_token_manager: Optional[SessionTokenManager] = session_token_manager
 
     def has_right(self, username: str, right: UserRightName) -> bool:
         """ Determines whether a given user has a certain right or not.
@@ -33,30 +42,41 @@ class UserRightValidator():
         Returns:
             True if the user has the given right; false otherwise.
         """
-        session: Session = self.get_schema().new_session()
-        user_right: Optional[UserRight] = UserRights.find_right(
-            session, username, right)
-        if user_right is not None:
-            return True
-        return False
+        session: Session = self.get_schema().get_session()
+        mask: int = UserRights.get_rights_mask(session, username)
+        return UserRightMask.contains(mask, UserRightMask.of(right))
 
     def enforce_rights(self, session_token: str, rights: List[UserRightName]):
         """ Raises an error if the owner of session identified by the token
         does not have all of the provided rights.
+
+        If session tokens are signed, only signed tokens are accepted.
         ---
         Parameters:
             - session_token: The session token string.
             - rights: A list of user right names.
         Throws:
+            - SessionNotFoundError: If the session does not exist or is not active.
             - InsufficientRightsError: If the user lacks any of the rights.
         """
-        session: Session = self.get_schema().new_session()
-        user_session: UserSession = UserSessions.get_active_user_session(
-            session, session_token
-        )
-        for right in rights:
-            if not self.has_right(user_session.username, right):
-                raise InsufficientRightsError()
+        rights_mask: int
+        token_manager: Optional[SessionTokenManager] = self.__session_token_manager
+        if token_manager is not None and token_manager.is_enabled():
+            # Session ids can be read from the signed tokens, so they are not accepted alone
+            if not SignedSessionToken.is_signed(session_token):
+                raise SessionNotFoundError()
+            signed_token: Optional[SignedSessionToken] = token_manager.verify(session_token)
+            if signed_token is None:
+                raise SessionNotFoundError()
+            rights_mask = signed_token.get_rights_mask()
+        else:
+            session_rights: Optional[Tuple[str, int]] = \
+                self.__session_store.find_sessions_rights_masks([session_token]).get(session_token)
+            if session_rights is None:
+                raise SessionNotFoundError()
+            rights_mask = session_rights[1]
+        if not UserRightMask.contains(rights_mask, UserRightMask.from_rights(rights)):
+            raise InsufficientRightsError()
 
     def get_schema(self) -> Schema:
         """ Gets the schema being used by this instance.
@@ -1,15 +1,17 @@
 """ UserSessionManager class module.
 """
 
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session  # type: ignore
+from dms2021core.data import UserRightName, SignedSessionToken
 from dms2021auth.data.config import AuthConfiguration
 from dms2021auth.data.db import Schema
-from dms2021auth.data.db.resultsets import UserSessions
-from dms2021auth.data.db.results import UserSession
+from dms2021auth.data.db.exc import SessionNotFoundError
+from dms2021auth.data.sessionstore import SessionStore
 from dms2021auth.logic.managerbase import ManagerBase
 from dms2021auth.logic.usermanager import UserManager
+from dms2021auth.logic.userrightvalidator import UserRightValidator
+from dms2021auth.logic.sessiontokenmanager import SessionTokenManager
 from dms2021auth.logic.exc import InvalidCredentialsError
 
 
@@ -17,7 +19,10 @@ class UserSessionManager(ManagerBase):
     """ Class responsible of the user session management logic.
     """
 
-    def __init__(self, config: AuthConfiguration, schema: Schema, user_manager: UserManager):
+    def __init__(
+        self, config: AuthConfiguration, schema: Schema, user_manager: UserManager,
+        session_store: SessionStore, session_token_manager: Optional[SessionTokenManager] = None
+    ):
         """ Constructor method.
 
         Initializes the manager.
@@ -26,9 +31,14 @@ class UserSessionManager(ManagerBase):
             - config: An AuthConfiguration instance with the manager configurable parameters.
             - schema: The database schema instance to use.
             - user_manager: The user manager to be used internally by the user sessions manager.
+            - session_store: The storage of the user sessions.
+            - session_token_manager: If set, the manager used to issue and verify signed
+                                     session tokens.
         """
         super().__init__(config, schema)
         self.__set_user_manager(user_manager)
+        self.__session_store: SessionStore = session_store
+        self.__session_token_manager: Optional[SessionTokenManager] = session_token_manager
 
     def login(self, username: str, password: str) -> str:
         """ Logs a user in. I.e., creates or reuses a session if the credentials are correct.
@@ -43,31 +53,116 @@ class UserSessionManager(ManagerBase):
         """
         if not self.get_user_manager().user_exists(username, password):
             raise InvalidCredentialsError()
-        session: Session = self.get_schema().new_session()
-        user_session: Optional[UserSession] = UserSessions.find_session_for_user(
-            session, username
-        )
         token: str
-        if user_session is None:
-            token = UserSessions.create(session, username).token
-        else:
-            user_session.touch(session, datetime.now())
-            token = user_session.token
+        created: bool
+        token, created = self.__session_store.open_session(username)
+        if not created:
+            self.__session_store.touch_session(token, datetime.now())
+        token_manager: Optional[SessionTokenManager] = self.__get_enabled_token_manager()
+        if token_manager is not None:
+            return token_manager.issue(token, username)
         return token
 
     def logout(self, session_token: str):
         """ Logs a user out. I.e., deactivates the given session.
+
+        If session tokens are signed, only signed tokens are accepted.
         ---
         Parameters:
             - session_token: The token of the session to deactivate.
         Throws:
             - SessionNotFound: When the provided session was not found or is inactive.
         """
-        session: Session = self.get_schema().new_session()
-        user_session: UserSession = UserSessions.get_active_user_session(
-            session, session_token
-        )
-        user_session.deactivate(session)
+        session_id: str = session_token
+        token_manager: Optional[SessionTokenManager] = self.__get_enabled_token_manager()
+        if token_manager is not None:
+            if not SignedSessionToken.is_signed(session_token):
+                raise SessionNotFoundError()
+            signed_token: Optional[SignedSessionToken] = token_manager.decode(session_token)
+            if signed_token is None:
+                raise SessionNotFoundError()
+            session_id = signed_token.get_session_id()
+            token_manager.revoke(session_id)
+        self.__session_store.close_session(session_id)
+
+    def validate_sessions(self, session_tokens: List[str]) -> Dict[str, Tuple[str, int]]:
+        """ Finds which of the given sessions are active, along with their owners' rights.
+
+        Signed tokens are verified by themselves. The rest are looked up in the
+        session store in chunks, unless session tokens are signed: then, they are
+        not valid.
+        ---
+        Parameters:
+            - session_tokens: The list of session token strings.
+        Returns:
+            A dictionary mapping the tokens of the active sessions to a tuple with the
+            user name string and the integer rights bitmask. Any other token is left out.
+        """
+        chunk_size: int = self.get_configuration().get_bulk_chunk_size()
+        unique_tokens: List[str] = list(dict.fromkeys(session_tokens))
+        found: Dict[str, Tuple[str, int]] = {}
+        token_manager: Optional[SessionTokenManager] = self.__get_enabled_token_manager()
+        if token_manager is not None:
+            # Signed tokens are verified right away, without a lookup
+            for token in [token for token in unique_tokens if SignedSessionToken.is_signed(token)]:
+                signed_token: Optional[SignedSessionToken] = token_manager.verify(token)
+                if signed_token is not None:
+                    found[token] = (signed_token.get_username(), signed_token.get_rights_mask())
+            return found
+        for start in range(0, len(unique_tokens), chunk_size):
+            found.update(self.__session_store.find_sessions_rights_masks(
+                unique_tokens[start:start + chunk_size]
+            ))
+        return found
+
+    def list_sessions(
+        self,
+        session_token: str,
+        right_validator: UserRightValidator,
+        *,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        username: Optional[str] = None,
+        active_only: bool = False
+    ) -> Iterator[Tuple[str, str, bool, datetime, datetime]]:
+        """ Lists the user sessions, in ascending order of their keys.
+
+        Sessions are read from the session store as the returned iterator is advanced.
+        ---
+        Parameters:
+            - session_token: The token of the session, used to verify that
+                             the requestor has sufficient rights.
+            - right_validator: The user right validator to use.
+            - after: If set, only the sessions whose key follows it are listed.
+            - limit: If set, the maximum number of sessions listed.
+            - username: If set, only the sessions of this user are listed.
+            - active_only: Whether only active sessions should be listed or not (default).
+        Returns:
+            An iterator of (key, user name, active, created, updated) tuples.
+        Throws:
+            - InsufficientRightsError: If the requestor does not have the required rights.
+        """
+        right_validator.enforce_rights(session_token, [UserRightName.AdminUsers])
+        return self.__session_store.iter_sessions(after, limit, username, active_only)
+
+    def __get_enabled_token_manager(self) -> Optional[SessionTokenManager]:
+        """ Gets the signed session tokens manager, if tokens are signed.
+        ---
+        Returns:
+            The SessionTokenManager instance, or None if tokens are not signed.
+        """
+        token_manager: Optional[SessionTokenManager] = self.__session_token_manager
+        if token_manager is None or not token_manager.is_enabled():
+            return None
+        return token_manager
+
+    def get_session_store(self) -> SessionStore:
+        """ Gets the storage of the user sessions being used by this instance.
+        ---
+        Returns:
+            The SessionStore object used by the manager.
+        """
+        return self.__session_store
 
     def get_user_manager(self) -> UserManager:
         """ Gets the user manager being used by this instance.
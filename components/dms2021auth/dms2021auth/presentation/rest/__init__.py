@@ -1,6 +1,16 @@
 """ Authentication REST API modules.
 """
 
+from typing import TYPE_CHECKING
+from dms2021auth.lazyimports import LazyImports
 from .user import User
 from .usersession import UserSession
 from .userright import UserRight
+
+if TYPE_CHECKING:
+    from .asyncusersession import AsyncUserSession
+
+# The asyncio classes are imported on first use; the threaded service does without them
+__getattr__ = LazyImports(__name__, {
+    'AsyncUserSession': '.asyncusersession'
+})
@@ -0,0 +1,137 @@
+""" AsyncUserSession class module.
+"""
+
+import json
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+from dms2021core.data.rest import RestResponse
+from dms2021auth.data.db.exc import SessionNotFoundError
+from dms2021auth.logic import AsyncUserSessionManager, AsyncUserRightValidator
+from dms2021auth.logic.exc import InvalidCredentialsError, InsufficientRightsError
+from dms2021auth.presentation.rest.listing import Listing
+from dms2021auth.presentation.rest.usersession import UserSession
+
+
+class AsyncUserSession():
+    """ Class responsible of handling the user session REST requests from coroutines.
+
+    Requests and responses are the same as those of `UserSession`.
+    """
+
+    def __init__(
+        self,
+        user_session_manager: AsyncUserSessionManager,
+        user_right_validator: AsyncUserRightValidator
+    ):
+        """ Constructor method.
+
+        Initializes the user session REST interface.
+        ---
+        Parameters:
+            - user_session_manager: Instance responsible of the user session logic operations.
+            - user_right_validator: The validator used to check the user rights.
+        """
+        self.__user_session_manager: AsyncUserSessionManager = user_session_manager
+        self.__user_right_validator: AsyncUserRightValidator = user_right_validator
+
+    def get_user_session_manager(self) -> AsyncUserSessionManager:
+        """ Gets the user session manager object being used by this instance.
+        ---
+        Returns:
+            The user session manager instance in use.
+        """
+        return self.__user_session_manager
+
+    def get_user_right_validator(self) -> AsyncUserRightValidator:
+        """ Gets the user rights validator object being used by this instance.
+        ---
+        Returns:
+            The user validator instance in use.
+        """
+        return self.__user_right_validator
+
+    async def login(self, username: str, password: str) -> RestResponse:
+        """ Logs in a user.
+        ---
+        Parameters:
+            - username: The user name string.
+            - password: The user password string.
+        Returns:
+            A RestResponse object with the request response.
+        """
+        try:
+            session_id: str = await self.get_user_session_manager().login(username, password)
+        except InvalidCredentialsError:
+            return RestResponse(code=401, mime_type='text/plain')
+        res_content_json = json.dumps({'session_id': session_id}, separators=(',', ':'))
+        return RestResponse(res_content_json, mime_type='application/json')
+
+    async def logout(self, token: str) -> RestResponse:
+        """ Logs out a user/session.
+        ---
+        Parameters:
+            - token: The session token string.
+        Returns:
+            A RestResponse object with the request response.
+        """
+        try:
+            await self.get_user_session_manager().logout(token)
+        except SessionNotFoundError:
+            return RestResponse(code=401, mime_type='text/plain')
+        return RestResponse(mime_type='text/plain')
+
+    async def validate(self, tokens) -> RestResponse:
+        """ Validates many sessions at once.
+        ---
+        Parameters:
+            - tokens: The decoded JSON request content; a list of session token strings.
+        Returns:
+            A RestResponse object with the request response (see `UserSession.validate`).
+        """
+        if not isinstance(tokens, list) or not all(isinstance(token, str) for token in tokens):
+            return RestResponse(code=400, mime_type='text/plain')
+        manager: AsyncUserSessionManager = self.get_user_session_manager()
+        config = manager.get_user_session_manager().get_configuration()
+        if len(tokens) > config.get_bulk_max_items():
+            return RestResponse(code=413, mime_type='text/plain')
+        return UserSession.validation_response(tokens, await manager.validate_sessions(tokens))
+
+    async def list_sessions(
+        self, token: str, *, after: Optional[str] = None, limit: Optional[str] = None,
+        username: Optional[str] = None, active_only: bool = False, stream: bool = False
+    ) -> RestResponse:  # pylint: disable=too-many-arguments
+        """ Lists the user sessions, in ascending order of their keys.
+        ---
+        Parameters:
+            - token: The session token string.
+            - after: If set, the cursor after which the listing starts.
+            - limit: If set, the maximum number of sessions to list.
+            - username: If set, only the sessions of this user are listed.
+            - active_only: Whether only active sessions should be listed or not (default).
+            - stream: Whether to stream the sessions (one JSON dictionary per line) or
+                      return a page of them (default).
+        Returns:
+            A RestResponse object with the request response. A streamed content reads
+            from the database as it is iterated.
+        """
+        manager: AsyncUserSessionManager = self.get_user_session_manager()
+        try:
+            fetch_limit: Optional[int] = Listing.fetch_limit(
+                limit, stream, manager.get_user_session_manager().get_configuration()
+            )
+        except ValueError:
+            return RestResponse(code=400, mime_type='text/plain')
+        try:
+            sessions: Iterator[Tuple[str, str, bool, datetime, datetime]] = \
+                await manager.list_sessions(
+                    token, self.get_user_right_validator(),
+                    after=after, limit=fetch_limit, username=username, active_only=active_only
+                )
+        except (SessionNotFoundError, InsufficientRightsError):
+            return RestResponse(code=401, mime_type='text/plain')
+        if stream:
+            return Listing.stream(UserSession.session_items(sessions))
+        return await manager.get_async_schema().run(
+            Listing.page, UserSession.session_items(sessions), fetch_limit, 'sessions',
+            'session_key'
+        )
@@ -0,0 +1,84 @@
+""" Listing class module.
+"""
+
+import json
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+from dms2021core.data.rest import RestResponse
+from dms2021auth.data.config import AuthConfiguration
+
+
+class Listing():
+    """ Toolkit class to build the responses of the REST listing requests.
+
+    Listings are either paginated with a cursor (the key of the last item of
+    the previous page), or streamed as newline-delimited JSON.
+    """
+
+    NDJSON_MIME_TYPE = 'application/x-ndjson'
+
+    @staticmethod
+    def fetch_limit(limit: Optional[str], stream: bool, config: AuthConfiguration) -> Optional[int]:
+        """ Computes the number of items to retrieve for a listing request.
+        ---
+        Parameters:
+            - limit: The requested maximum number of items, if any.
+            - stream: Whether the listing is streamed or paginated.
+            - config: The configuration with the page size limits.
+        Returns:
+            The number of items to retrieve (one more than the page size, to know whether
+            there is a next page), or None to retrieve every item.
+        Throws:
+            - ValueError: If the requested limit is not a positive integer.
+        """
+        requested: Optional[int] = None
+        if limit is not None:
+            requested = int(limit)
+            if requested < 1:
+                raise ValueError('The limit must be a positive integer.')
+        if stream:
+            return requested
+        if requested is None:
+            requested = config.get_listing_page_size()
+        return min(requested, config.get_listing_max_page_size()) + 1
+
+    @staticmethod
+    def page(
+        items: Iterator[Dict], fetch_limit: Optional[int], name: str, key: str
+    ) -> RestResponse:
+        """ Builds the response with a listing page.
+        ---
+        Parameters:
+            - items: An iterator of the item dictionaries, as retrieved with `fetch_limit`.
+            - fetch_limit: The number of items retrieved, as computed by `fetch_limit`.
+            - name: The name of the attribute holding the list of items.
+            - key: The name of the item attribute used as the cursor.
+        Returns:
+            A RestResponse whose content is a JSON dictionary with the list of items and
+            the cursor of the next page in the attribute `next` (null if it is the last one).
+        """
+        page_size: int = (fetch_limit or 1) - 1
+        page_items: List[Dict] = list(islice(items, fetch_limit))
+        # Release the database resources right away, even if not exhausted
+        close = getattr(items, 'close', None)
+        if close is not None:
+            close()
+        next_cursor: Optional[str] = None
+        if len(page_items) > page_size:
+            page_items = page_items[:page_size]
+            next_cursor = page_items[-1][key]
+        res_content = {name: page_items, 'next': next_cursor}
+        res_content_json = json.dumps(res_content, separators=(',', ':'))
+        return RestResponse(res_content_json, mime_type='application/json')
+
+    @staticmethod
+    def stream(items: Iterator[Dict]) -> RestResponse:
+        """ Builds the response streaming a listing.
+        ---
+        Parameters:
+            - items: An iterator of the item dictionaries.
+        Returns:
+            A RestResponse whose content yields a JSON dictionary per line and item.
+        """
+        lines = (json.dumps(item, separators=(',', ':')) + '\n' for item in items)
+        return RestResponse(lines, mime_type=Listing.NDJSON_MIME_TYPE)
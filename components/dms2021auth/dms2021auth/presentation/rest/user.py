@@ -1,10 +1,13 @@
 """ User class module.
 """
 
+import json
+from typing import Dict, Iterator, List, Optional, Tuple
 from dms2021core.data.rest import RestResponse
 from dms2021auth.logic import UserManager, UserRightValidator
-from dms2021auth.data.db.exc import UserExistsError
+from dms2021auth.data.db.exc import UserExistsError, SessionNotFoundError
 from dms2021auth.logic.exc import InsufficientRightsError
+from dms2021auth.presentation.rest.listing import Listing
 
 
 class User():
@@ -71,8 +74,77 @@ class User():
             )
         except ValueError:
             return RestResponse(code=400, mime_type='text/plain')
-        except InsufficientRightsError:
+        except (SessionNotFoundError, InsufficientRightsError):
             return RestResponse(code=401, mime_type='text/plain')
         except UserExistsError:
             return RestResponse(code=409, mime_type='text/plain')
         return RestResponse(mime_type='text/plain')
+
+    def create_batch(self, users, token: str) -> RestResponse:
+        """ Creates many users at once.
+        ---
+        Parameters:
+            - users: The decoded JSON request content; a list of dictionaries with
+                     the `username` and `password` strings of each user.
+            - token: The session token string.
+        Returns:
+            A RestResponse object holding the result of the operation. On success, its
+            content is a JSON list with the `username` and `result` (`created`, `exists`
+            or `invalid`) of each user, in the same order.
+        """
+        if not isinstance(users, list):
+            return RestResponse(code=400, mime_type='text/plain')
+        if len(users) > self.get_user_manager().get_configuration().get_bulk_max_items():
+            return RestResponse(code=413, mime_type='text/plain')
+        credentials: List[Tuple[str, str]] = []
+        for user in users:
+            username: str = ''
+            password: str = ''
+            if isinstance(user, dict):
+                if isinstance(user.get('username'), str):
+                    username = user['username']
+                if isinstance(user.get('password'), str):
+                    password = user['password']
+            credentials.append((username, password))
+        try:
+            outcomes: List[Dict[str, str]] = [
+                {'username': username, 'result': outcome}
+                for username, outcome in self.get_user_manager().create_users(
+                    credentials, token, self.get_user_right_validator()
+                )
+            ]
+        except (SessionNotFoundError, InsufficientRightsError):
+            return RestResponse(code=401, mime_type='text/plain')
+        res_content_json = json.dumps(outcomes, separators=(',', ':'))
+        return RestResponse(res_content_json, mime_type='application/json')
+
+    def list_users(
+        self, token: str, after: Optional[str] = None, limit: Optional[str] = None,
+        stream: bool = False
+    ) -> RestResponse:
+        """ Lists the users, in ascending order of their names.
+        ---
+        Parameters:
+            - token: The session token string.
+            - after: If set, the cursor after which the listing starts.
+            - limit: If set, the maximum number of users to list.
+            - stream: Whether to stream the users (one JSON dictionary per line) or
+                      return a page of them (default).
+        Returns:
+            A RestResponse object holding the result of the operation.
+        """
+        try:
+            fetch_limit: Optional[int] = Listing.fetch_limit(
+                limit, stream, self.get_user_manager().get_configuration()
+            )
+            usernames: Iterator[str] = self.get_user_manager().list_users(
+                token, self.get_user_right_validator(), after, fetch_limit
+            )
+        except ValueError:
+            return RestResponse(code=400, mime_type='text/plain')
+        except (SessionNotFoundError, InsufficientRightsError):
+            return RestResponse(code=401, mime_type='text/plain')
+        items = ({'username': username} for username in usernames)
+        if stream:
+            return Listing.stream(items)
+        return Listing.page(items, fetch_limit, 'users', 'username')
@@ -1,7 +1,9 @@
 """ UserRight class module.
 """
 
-from dms2021core.data import UserRightName
+import json
+from typing import Dict, List, Optional, Tuple
+from dms2021core.data import UserRightName, UserRightMask
 from dms2021core.data.rest import RestResponse
 from dms2021auth.data.db.exc import UserNotFoundError, SessionNotFoundError
 from dms2021auth.logic import UserRightManager, UserRightValidator
@@ -108,6 +110,82 @@ class UserRight():
         except InsufficientRightsError:
             return RestResponse(code=401, mime_type='text/plain')
 
+    def get_rights(self, username: str, if_none_match: Optional[str] = None) -> RestResponse:
+        """ Gets all the rights of a user.
+        ---
+        Parameters:
+            - username: The name of the user.
+            - if_none_match: The value of the If-None-Match request header, if any.
+        Returns:
+            A RestResponse object with the request response. Its ETag header identifies
+            the version of the user rights; if it matches the If-None-Match header, the
+            response is a 304 without content.
+        """
+        try:
+            version, mask = self.get_user_right_manager().get_rights(username)
+        except UserNotFoundError:
+            return RestResponse(code=404, mime_type='text/plain')
+        etag: str = '"' + str(version) + '"'
+        headers: Dict[str, str] = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if if_none_match is not None and (
+            if_none_match.strip() == '*'
+            or etag in [tag.strip() for tag in if_none_match.split(',')]
+        ):
+            return RestResponse(code=304, mime_type='application/json', headers=headers)
+        res_content = {
+            'rights': [right.name for right in UserRightMask.to_rights(mask)],
+            'mask': mask
+        }
+        res_content_json = json.dumps(res_content, separators=(',', ':'))
+        return RestResponse(res_content_json, mime_type='application/json', headers=headers)
+
+    def apply_batch(self, changes, token: str) -> RestResponse:
+        """ Grants and revokes many rights at once.
+        ---
+        Parameters:
+            - changes: The decoded JSON request content; a list of dictionaries with the
+                       `username`, `right` (a right name) and `op` (`grant` or `revoke`)
+                       of each change.
+            - token: The session token string.
+        Returns:
+            A RestResponse object with the request response. On success, its content is
+            a JSON list with the `username`, `right`, `op` and `result` of each change,
+            in the same order.
+        """
+        if not isinstance(changes, list):
+            return RestResponse(code=400, mime_type='text/plain')
+        if len(changes) > self.get_user_right_manager().get_configuration().get_bulk_max_items():
+            return RestResponse(code=413, mime_type='text/plain')
+        items: List[Dict[str, Optional[str]]] = []
+        valid: List[Tuple[str, UserRightName, bool]] = []
+        for change in changes:
+            if not isinstance(change, dict):
+                change = {}
+            item: Dict[str, Optional[str]] = {
+                key: change.get(key) if isinstance(change.get(key), str) else None
+                for key in ('username', 'right', 'op')
+            }
+            username: Optional[str] = item['username']
+            right: Optional[UserRightName] = UserRightName.__members__.get(item['right'] or '')
+            if username and right is not None and item['op'] in ('grant', 'revoke'):
+                valid.append((username, right, item['op'] == 'grant'))
+                item['result'] = None
+            else:
+                item['result'] = 'invalid'
+            items.append(item)
+        try:
+            outcomes: List[str] = self.get_user_right_manager().apply_changes(
+                valid, token, self.get_user_right_validator()
+            )
+        except (SessionNotFoundError, InsufficientRightsError):
+            return RestResponse(code=401, mime_type='text/plain')
+        pending = iter(outcomes)
+        for item in items:
+            if item['result'] is None:
+                item['result'] = next(pending)
+        res_content_json = json.dumps(items, separators=(',', ':'))
+        return RestResponse(res_content_json, mime_type='application/json')
+
     def has_right(self, username: str, right_name: str) -> RestResponse:
         """ Gets whether a user has a given right or not.
         ---
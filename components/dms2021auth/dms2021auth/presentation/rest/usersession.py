@@ -2,23 +2,33 @@
 """
 
 import json
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from dms2021core.data import UserRightMask
 from dms2021core.data.rest import RestResponse
 from dms2021auth.data.db.exc import SessionNotFoundError
-from dms2021auth.logic import UserSessionManager
-from dms2021auth.logic.exc import InvalidCredentialsError
+from dms2021auth.logic import UserSessionManager, UserRightValidator
+from dms2021auth.logic.exc import InvalidCredentialsError, InsufficientRightsError
+from dms2021auth.presentation.rest.listing import Listing
 
 class UserSession():
     """ Class responsible of handling the user-related REST requests.
     """
-    def __init__(self, user_session_manager: UserSessionManager):
+    def __init__(
+        self,
+        user_session_manager: UserSessionManager,
+        user_right_validator: UserRightValidator
+    ):
         """ Constructor method.
 
         Initializes the user REST interface.
         ---
         Parameters:
             - user_session_manager: Instance responsible of the user session logic operations.
+            - user_right_validator: The validator used to check the user rights.
         """
         self.__set_user_session_manager(user_session_manager)
+        self.__set_user_right_validator(user_right_validator)
 
     def get_user_session_manager(self) -> UserSessionManager:
         """ Gets the user session manager object being used by this instance.
@@ -36,6 +46,22 @@ class UserSession():
         """
         self.__user_session_manager = user_session_manager
 
+    def get_user_right_validator(self) -> UserRightValidator:
+        """ Gets the user rights validator object being used by this instance.
+        ---
+        Returns:
+            The user validator instance in use.
+        """
+        return self.__user_right_validator
+
+    def __set_user_right_validator(self, user_right_validator: UserRightValidator):
+        """ Sets the new user rights validator object to be used by this instance.
+        ---
+        Parameters:
+            - user_right_validator: The new user rights validator instance.
+        """
+        self.__user_right_validator = user_right_validator
+
     def login(self, username: str, password: str) -> RestResponse:
         """ Logs in a user.
         ---
@@ -68,3 +94,103 @@ class UserSession():
             return RestResponse(mime_type='text/plain')
         except SessionNotFoundError:
             return RestResponse(code=401, mime_type='text/plain')
+
+    def validate(self, tokens) -> RestResponse:
+        """ Validates many sessions at once.
+        ---
+        Parameters:
+            - tokens: The decoded JSON request content; a list of session token strings.
+        Returns:
+            A RestResponse object with the request response. On success, its content is
+            a JSON list with a dictionary per token, in the same order, with the
+            `session_id`, whether it is `valid` (i.e., active) and, if so, its owner
+            `username` and their `rights` (both the list of names and the `mask`).
+        """
+        if not isinstance(tokens, list) or not all(isinstance(token, str) for token in tokens):
+            return RestResponse(code=400, mime_type='text/plain')
+        manager: UserSessionManager = self.get_user_session_manager()
+        if len(tokens) > manager.get_configuration().get_bulk_max_items():
+            return RestResponse(code=413, mime_type='text/plain')
+        return UserSession.validation_response(tokens, manager.validate_sessions(tokens))
+
+    @staticmethod
+    def validation_response(tokens: List[str], found: Dict[str, Tuple[str, int]]) -> RestResponse:
+        """ Builds the response of a sessions validation.
+        ---
+        Parameters:
+            - tokens: The list of session token strings requested.
+            - found: The dictionary mapping the active tokens to their owner and rights mask.
+        Returns:
+            A RestResponse object with the JSON list of validation results.
+        """
+        res_content: List[Dict] = []
+        for token in tokens:
+            if token in found:
+                username, mask = found[token]
+                res_content.append({
+                    'session_id': token,
+                    'valid': True,
+                    'username': username,
+                    'rights': [right.name for right in UserRightMask.to_rights(mask)],
+                    'mask': mask
+                })
+            else:
+                res_content.append({'session_id': token, 'valid': False})
+        res_content_json = json.dumps(res_content, separators=(',', ':'))
+        return RestResponse(res_content_json, mime_type='application/json')
+
+    def list_sessions(
+        self, token: str, *, after: Optional[str] = None, limit: Optional[str] = None,
+        username: Optional[str] = None, active_only: bool = False, stream: bool = False
+    ) -> RestResponse:  # pylint: disable=too-many-arguments
+        """ Lists the user sessions, in ascending order of their keys.
+        ---
+        Parameters:
+            - token: The session token string.
+            - after: If set, the cursor after which the listing starts.
+            - limit: If set, the maximum number of sessions to list.
+            - username: If set, only the sessions of this user are listed.
+            - active_only: Whether only active sessions should be listed or not (default).
+            - stream: Whether to stream the sessions (one JSON dictionary per line) or
+                      return a page of them (default).
+        Returns:
+            A RestResponse object with the request response.
+        """
+        try:
+            fetch_limit: Optional[int] = Listing.fetch_limit(
+                limit, stream, self.get_user_session_manager().get_configuration()
+            )
+            sessions: Iterator[Tuple[str, str, bool, datetime, datetime]] = \
+                self.get_user_session_manager().list_sessions(
+                    token, self.get_user_right_validator(), after=after, limit=fetch_limit,
+                    username=username, active_only=active_only
+                )
+        except ValueError:
+            return RestResponse(code=400, mime_type='text/plain')
+        except (SessionNotFoundError, InsufficientRightsError):
+            return RestResponse(code=401, mime_type='text/plain')
+        items: Iterator[Dict] = UserSession.session_items(sessions)
+        if stream:
+            return Listing.stream(items)
+        return Listing.page(items, fetch_limit, 'sessions', 'session_key')
+
+    @staticmethod
+    def session_items(
+        sessions: Iterator[Tuple[str, str, bool, datetime, datetime]]
+    ) -> Iterator[Dict]:
+        """ Converts the listed sessions to the dictionaries returned to the client.
+
+        Sessions are identified by their keys; their tokens are never returned.
+        ---
+        Parameters:
+            - sessions: An iterator of (key, user name, active, created, updated) tuples.
+        Returns:
+            An iterator of session dictionaries, advancing the given one lazily.
+        """
+        return ({
+            'session_key': session_key,
+            'username': session_username,
+            'active': active,
+            'created': created.isoformat(),
+            'updated': updated.isoformat()
+        } for session_key, session_username, active, created, updated in sessions)
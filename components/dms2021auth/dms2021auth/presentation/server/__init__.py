@@ -0,0 +1,18 @@
+""" Authentication service HTTP server modules.
+"""
+
+from typing import TYPE_CHECKING
+from dms2021auth.lazyimports import LazyImports
+from .keepaliveserverhandler import KeepAliveServerHandler
+from .metricsmiddleware import MetricsMiddleware
+from .pooledrequesthandler import PooledRequestHandler
+from .pooledwsgiserver import PooledWSGIServer
+from .preforkserver import PreforkServer
+
+if TYPE_CHECKING:
+    from .asynchttpserver import AsyncHTTPServer
+
+# The asyncio classes are imported on first use; the threaded service does without them
+__getattr__ = LazyImports(__name__, {
+    'AsyncHTTPServer': '.asynchttpserver'
+})
@@ -0,0 +1,355 @@
+""" AsyncHTTPServer class module.
+"""
+
+import asyncio
+import http.client
+import io
+import logging
+import sys
+import urllib.parse
+from concurrent.futures import Executor
+from email.utils import formatdate
+from http import HTTPStatus
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from werkzeug.exceptions import HTTPException  # type: ignore
+from werkzeug.routing import Map, Rule  # type: ignore
+from werkzeug.utils import get_content_type  # type: ignore
+from werkzeug.wrappers import Request  # type: ignore
+from dms2021core.data.rest import RestResponse
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.data.metrics import ServiceMetrics
+
+
+class AsyncHTTPServer():  # pylint: disable=too-many-instance-attributes
+    """ HTTP/1.1 server running in an asyncio event loop.
+
+    Requests are routed (with the same rule syntax as Flask) to coroutines
+    receiving a `werkzeug.wrappers.Request` and the rule arguments, and returning
+    a `RestResponse`. Idle keep-alive connections only cost a coroutine, so many
+    of them can be held open. Streamed contents are iterated in an executor, as
+    they may read from the database.
+    """
+
+    # The maximum size of a request line and headers
+    MAX_HEAD_SIZE = 65536
+    # The number of parts of a streamed content sent in each chunk
+    STREAM_BATCH_SIZE = 100
+
+    def __init__(
+        self, config: AuthConfiguration, executor: Executor, *,
+        metrics: Optional[ServiceMetrics] = None
+    ):
+        """ Constructor method.
+
+        Initializes the server. Nothing is started until `serve` is awaited.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the address and server parameters.
+            - executor: The executor iterating the streamed contents.
+            - metrics: If set, where the requests served are recorded.
+        """
+        self.__config: AuthConfiguration = config
+        self.__executor: Executor = executor
+        self.__metrics: Optional[ServiceMetrics] = metrics
+        self.__url_map: Map = Map()
+        self.__connections: Set[asyncio.Task] = set()
+        self.__idle: Set[asyncio.StreamWriter] = set()
+        self.__stopping: Optional[asyncio.Event] = None
+        self.__keep_alive: float = config.get_server_keep_alive()
+        self.__max_body_size: int = config.get_server_max_body_size()
+
+    def route(self, rule: str, methods: List[str]) -> Callable:
+        """ Decorator registering a coroutine as the handler of a URL rule.
+        ---
+        Parameters:
+            - rule: The URL rule string (e.g., `/users/<string:username>`).
+            - methods: The list of HTTP methods handled.
+        Returns:
+            The decorator function, which returns the coroutine function unchanged.
+        """
+        def decorator(handler: Callable[..., Awaitable[RestResponse]]) -> Callable:
+            self.__url_map.add(Rule(rule, methods=methods, endpoint=handler))
+            return handler
+        return decorator
+
+    async def serve(self) -> None:
+        """ Serves requests until `stop` is called, then waits for the ongoing ones to finish.
+        """
+        self.__stopping = asyncio.Event()
+        server = await asyncio.start_server(
+            self.__handle_connection, self.__config.get_service_host(),
+            self.__config.get_service_port(), limit=AsyncHTTPServer.MAX_HEAD_SIZE
+        )
+        try:
+            await self.__stopping.wait()
+        finally:
+            server.close()
+            for writer in list(self.__idle):
+                writer.close()
+            if self.__connections:
+                _, pending = await asyncio.wait(
+                    list(self.__connections),
+                    timeout=self.__config.get_server_graceful_timeout()
+                )
+                for task in pending:
+                    task.cancel()
+            await server.wait_closed()
+
+    def stop(self) -> None:
+        """ Asks the server to stop accepting connections and finish the ongoing requests.
+        """
+        if self.__stopping is not None:
+            self.__stopping.set()
+
+    def __is_stopping(self) -> bool:
+        """ Determines whether the server was asked to stop.
+        ---
+        Returns:
+            True if the server is stopping; false otherwise.
+        """
+        return self.__stopping is not None and self.__stopping.is_set()
+
+    async def __handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """ Serves the requests of a connection until it is closed.
+        ---
+        Parameters:
+            - reader: The connection stream reader.
+            - writer: The connection stream writer.
+        """
+        task: Optional[asyncio.Task] = asyncio.current_task()
+        if task is not None:
+            self.__connections.add(task)
+        keep_alive: bool = True
+        try:
+            while keep_alive and not self.__is_stopping():
+                self.__idle.add(writer)
+                try:
+                    head: bytes = await asyncio.wait_for(
+                        reader.readuntil(b'\r\n\r\n'), timeout=self.__keep_alive or None
+                    )
+                finally:
+                    self.__idle.discard(writer)
+                keep_alive = await self.__handle_request(head, reader, writer)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                ConnectionError):
+            # Idle for longer than the keep-alive time, or closed by either side
+            pass
+        finally:
+            if task is not None:
+                self.__connections.discard(task)
+            writer.close()
+
+    async def __handle_request(
+        self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """ Reads the body of a request, serves it and sends the response.
+        ---
+        Parameters:
+            - head: The request line and headers.
+            - reader: The connection stream reader.
+            - writer: The connection stream writer.
+        Returns:
+            True if the connection can serve further requests; false otherwise.
+        """
+        request_line, _, header_block = head.partition(b'\r\n')
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+            headers = http.client.parse_headers(io.BytesIO(header_block))
+            content_length: int = int(headers.get('Content-Length') or 0)
+        except (ValueError, http.client.HTTPException):
+            return await self.__send(writer, 'GET', RestResponse(code=400, mime_type='text/plain'))
+        if 'chunked' in headers.get('Transfer-Encoding', '').lower():
+            return await self.__send(writer, method, RestResponse(code=411, mime_type='text/plain'))
+        if content_length > self.__max_body_size or content_length < 0:
+            return await self.__send(writer, method, RestResponse(code=413, mime_type='text/plain'))
+        if content_length > 0 and headers.get('Expect', '').lower() == '100-continue':
+            writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+        body: bytes = await reader.readexactly(content_length)
+        keep_alive: bool = (
+            self.__keep_alive > 0 and version == 'HTTP/1.1'
+            and headers.get('Connection', '').lower() != 'close'
+        )
+        environ: Dict = self.__environ(
+            method, target, version, headers=headers, body=body, writer=writer
+        )
+        response: RestResponse = await self.__dispatch(Request(environ))
+        return await self.__send(writer, method, response, keep_alive and not self.__is_stopping())
+
+    def __environ(
+        self, method: str, target: str, version: str, *, headers: http.client.HTTPMessage,
+        body: bytes, writer: asyncio.StreamWriter
+    ) -> Dict:  # pylint: disable=too-many-arguments
+        """ Builds the WSGI environment dictionary of a request.
+        ---
+        Parameters:
+            - method: The request method.
+            - target: The request target (path and query string).
+            - version: The HTTP version of the request.
+            - headers: The request headers.
+            - body: The request body.
+            - writer: The connection stream writer.
+        Returns:
+            The environment dictionary.
+        """
+        path, _, query = target.partition('?')
+        peer = writer.get_extra_info('peername') or ('', 0)
+        environ: Dict = {
+            'REQUEST_METHOD': method,
+            'SCRIPT_NAME': '',
+            'PATH_INFO': urllib.parse.unquote(path, 'latin-1'),
+            'QUERY_STRING': query,
+            'SERVER_NAME': self.__config.get_service_host(),
+            'SERVER_PORT': str(self.__config.get_service_port()),
+            'SERVER_PROTOCOL': version,
+            'REMOTE_ADDR': str(peer[0]),
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': False,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False
+        }
+        for name, value in headers.items():
+            key: str = name.upper().replace('-', '_')
+            if key == 'CONTENT_TYPE':
+                environ[key] = value
+            elif key != 'CONTENT_LENGTH':
+                key = 'HTTP_' + key
+                environ[key] = environ[key] + ',' + value if key in environ else value
+        return environ
+
+    async def __dispatch(self, request: Request) -> RestResponse:
+        """ Serves a request with the handler of the matching rule.
+        ---
+        Parameters:
+            - request: The request.
+        Returns:
+            The handler response, or an error response if no rule matches or the handler fails.
+        """
+        metrics: Optional[ServiceMetrics] = self.__metrics
+        request_metrics: Optional[Tuple[float, List]] = None
+        if metrics is not None:
+            request_metrics = metrics.begin_request()
+        rule: Optional[Rule] = None
+        try:
+            rule, arguments = self.__url_map.bind_to_environ(request.environ).match(
+                return_rule=True
+            )
+            response: RestResponse = await rule.endpoint(request, **arguments)
+        except HTTPException as error:
+            # Not found, method not allowed, redirections to the canonical URL...
+            response = RestResponse(
+                code=error.code or 500, mime_type='text/plain',
+                headers=dict(error.get_headers(request.environ))
+            )
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception(
+                'Error serving %s %s', request.method, request.path
+            )
+            response = RestResponse(code=500, mime_type='text/plain')
+        if metrics is not None and request_metrics is not None:
+            metrics.end_request(
+                request.method, None if rule is None else rule.rule, response.get_code(),
+                request_metrics
+            )
+        return response
+
+    async def __send(
+        self, writer: asyncio.StreamWriter, method: str, response: RestResponse,
+        keep_alive: bool = False
+    ) -> bool:
+        """ Sends a response.
+        ---
+        Parameters:
+            - writer: The connection stream writer.
+            - method: The request method.
+            - response: The response to send.
+            - keep_alive: Whether the connection may serve further requests.
+        Returns:
+            True if the connection can serve further requests; false otherwise.
+        """
+        code: int = response.get_code()
+        content: Union[str, Iterable[str]] = response.get_content()
+        headers: Dict[str, str] = response.get_headers()
+        if 'charset=' not in headers['Content-Type']:
+            headers['Content-Type'] = get_content_type(headers['Content-Type'], 'utf-8')
+        headers['Date'] = formatdate(usegmt=True)
+        with_body: bool = method != 'HEAD' and code not in (204, 304)
+        body: bytes = b''
+        parts: Optional[Iterator[str]] = None
+        if isinstance(content, str):
+            body = content.encode('utf-8')
+            headers['Content-Length'] = str(len(body))
+        else:
+            parts = iter(content)
+            headers['Transfer-Encoding'] = 'chunked'
+        if not keep_alive:
+            headers['Connection'] = 'close'
+        try:
+            reason: str = HTTPStatus(code).phrase
+        except ValueError:
+            reason = ''
+        head: str = 'HTTP/1.1 ' + str(code) + ' ' + reason + '\r\n' + ''.join(
+            name + ': ' + value + '\r\n' for name, value in headers.items()
+        ) + '\r\n'
+        writer.write(head.encode('latin-1') + (body if with_body else b''))
+        if parts is not None:
+            return await self.__stream(writer, parts, with_body) and keep_alive
+        await writer.drain()
+        return keep_alive
+
+    async def __stream(
+        self, writer: asyncio.StreamWriter, parts: Iterator[str], with_body: bool
+    ) -> bool:
+        """ Sends a streamed content with the chunked transfer coding.
+        ---
+        Parameters:
+            - writer: The connection stream writer.
+            - parts: The iterator of the content parts.
+            - with_body: Whether the content must be sent, or just released.
+        Returns:
+            True if the whole content was sent; false otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while with_body:
+                chunk: bytes = await loop.run_in_executor(
+                    self.__executor, AsyncHTTPServer.__next_chunk, parts
+                )
+                if not chunk:
+                    writer.write(b'0\r\n\r\n')
+                    break
+                writer.write(format(len(chunk), 'x').encode('ascii') + b'\r\n' + chunk + b'\r\n')
+                await writer.drain()
+            await writer.drain()
+            return True
+        except ConnectionError:
+            return False
+        except Exception:  # pylint: disable=broad-except
+            # The response cannot be completed; closing the connection signals it
+            logging.getLogger(__name__).exception('Error streaming a response')
+            return False
+        finally:
+            close = getattr(parts, 'close', None)
+            if close is not None:
+                await loop.run_in_executor(self.__executor, close)
+
+    @staticmethod
+    def __next_chunk(parts: Iterator[str]) -> bytes:
+        """ Takes the next parts of a streamed content.
+        ---
+        Parameters:
+            - parts: The iterator of the content parts.
+        Returns:
+            The next parts, encoded; empty once the iterator is exhausted.
+        """
+        batch: List[str] = []
+        for part in parts:
+            batch.append(part)
+            if len(batch) >= AsyncHTTPServer.STREAM_BATCH_SIZE:
+                break
+        return ''.join(batch).encode('utf-8')
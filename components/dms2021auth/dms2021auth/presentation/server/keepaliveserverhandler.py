@@ -0,0 +1,75 @@
+""" KeepAliveServerHandler class module.
+"""
+
+from http.server import BaseHTTPRequestHandler
+from typing import Dict
+from wsgiref.headers import Headers
+from wsgiref.simple_server import ServerHandler
+
+
+class KeepAliveServerHandler(ServerHandler):
+    """ WSGI handler of a request served in a persistent HTTP/1.1 connection.
+
+    The connection can only be kept alive if the response was completely sent
+    and the client can tell where it ends without the connection being closed;
+    otherwise, a `Connection: close` header is added.
+    """
+
+    http_version = '1.1'
+
+    # Set while handling the request
+    status: str
+    headers: Headers
+    environ: Dict
+    request_handler: BaseHTTPRequestHandler
+
+    def __init__(self, stdin, stdout, stderr, environ, keep_alive: bool):
+        """ Constructor method.
+
+        Initializes the handler of a request.
+        ---
+        Parameters:
+            - stdin: The request body stream.
+            - stdout: The stream to write the response to.
+            - stderr: The stream to write the errors to.
+            - environ: The WSGI environment dictionary of the request.
+            - keep_alive: Whether the connection may be kept alive after this request.
+        """
+        super().__init__(stdin, stdout, stderr, environ, multithread=True, multiprocess=True)
+        self.__keep_alive_allowed: bool = keep_alive
+        self.__delimited: bool = False
+        self.__keep_alive: bool = False
+
+    def keeps_alive(self) -> bool:
+        """ Determines whether the connection can serve further requests.
+        ---
+        Returns:
+            True if the response was completely sent and delimited; false otherwise.
+        """
+        return self.__keep_alive
+
+    def cleanup_headers(self) -> None:
+        """ Completes the response headers, announcing whether the connection will be closed.
+        """
+        super().cleanup_headers()
+        status_code: int = int(self.status[:3])
+        self.__delimited = self.__keep_alive_allowed and (
+            'Content-Length' in self.headers
+            or status_code < 200 or status_code in (204, 304)
+            or self.environ['REQUEST_METHOD'] == 'HEAD'
+        )
+        if not self.__delimited:
+            self.headers['Connection'] = 'close'
+
+    def finish_response(self) -> None:
+        """ Sends the response body.
+        """
+        super().finish_response()
+        self.__keep_alive = self.__delimited
+
+    def handle_error(self) -> None:
+        """ Logs an application error, sending an error response if still possible.
+        """
+        # If the response was already started, the rest of it is lost
+        self.__keep_alive = False
+        super().handle_error()
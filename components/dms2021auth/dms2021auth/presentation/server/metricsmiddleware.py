@@ -0,0 +1,47 @@
+""" MetricsMiddleware class module.
+"""
+
+from typing import Callable, Dict, Iterable, List, Tuple
+from dms2021auth.data.metrics import ServiceMetrics
+
+
+class MetricsMiddleware():
+    """ WSGI middleware recording the requests served by an application in the
+    service metrics.
+
+    Requests are recorded once their response starts. The route is taken from
+    the request object Werkzeug leaves in the WSGI environment, so wrapping the
+    application costs a single call per request (Flask request hooks cost
+    several).
+    """
+
+    def __init__(self, app: Callable, metrics: ServiceMetrics):
+        """ Constructor method.
+        ---
+        Parameters:
+            - app: The WSGI application to wrap.
+            - metrics: The service metrics where the requests are recorded.
+        """
+        self.__app: Callable = app
+        self.__metrics: ServiceMetrics = metrics
+
+    def __call__(self, environ: Dict, start_response: Callable) -> Iterable[bytes]:
+        """ Serves a request.
+        ---
+        Parameters:
+            - environ: The WSGI environment dictionary of the request.
+            - start_response: The WSGI function starting the response.
+        Returns:
+            The response body iterable.
+        """
+        metrics: ServiceMetrics = self.__metrics
+        request: Tuple[float, List] = metrics.begin_request()
+
+        def record_response(status: str, headers, exc_info=None):
+            rule = getattr(environ.get('werkzeug.request'), 'url_rule', None)
+            metrics.end_request(
+                environ['REQUEST_METHOD'], None if rule is None else rule.rule, int(status[:3]),
+                request
+            )
+            return start_response(status, headers, exc_info)
+        return self.__app(environ, record_response)
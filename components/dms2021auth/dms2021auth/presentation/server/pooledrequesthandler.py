@@ -0,0 +1,118 @@
+""" PooledRequestHandler class module.
+"""
+
+import logging
+from http.server import BaseHTTPRequestHandler
+from typing import IO, TYPE_CHECKING, Union, cast
+from wsgiref.simple_server import WSGIRequestHandler
+from werkzeug.serving import DechunkedInput  # type: ignore
+from werkzeug.wsgi import LimitedStream  # type: ignore
+from dms2021auth.presentation.server.keepaliveserverhandler import KeepAliveServerHandler
+
+if TYPE_CHECKING:
+    # Only for annotations, as the server module imports this one
+    from dms2021auth.presentation.server.pooledwsgiserver import PooledWSGIServer
+
+
+class PooledRequestHandler(WSGIRequestHandler):
+    """ Handler of a `PooledWSGIServer` connection.
+
+    The connection is kept alive between requests, up to the idle time
+    configured in the server, and closed after the ongoing request once the
+    server stops.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    # Responses are written in several small pieces; do not delay them
+    disable_nagle_algorithm = True
+    # Request bodies left unread are discarded to reuse the connection only up to this size
+    MAX_DISCARDED_BODY = 65536
+
+    server: 'PooledWSGIServer'
+
+    def setup(self) -> None:
+        """ Prepares the connection, applying the keep-alive setting of the server.
+        """
+        super().setup()
+        keep_alive: float = self.server.get_keep_alive()
+        if keep_alive > 0:
+            # Also bounds how long a client may take to send a request
+            self.connection.settimeout(keep_alive)
+
+    def handle(self) -> None:
+        """ Handles the requests of the connection until it is closed.
+        """
+        BaseHTTPRequestHandler.handle(self)
+
+    def handle_one_request(self) -> None:
+        """ Reads a request and serves it with the WSGI application.
+        """
+        try:
+            self.raw_requestline = self.rfile.readline(65537)
+        except (TimeoutError, ConnectionError):
+            # Idle for longer than the keep-alive time, or dropped by the client
+            self.raw_requestline = b''
+        self.close_connection = True
+        if not self.raw_requestline:
+            return
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ''
+            self.request_version = ''
+            self.command = ''
+            self.send_error(414)
+            return
+        if not self.parse_request():
+            return
+        keep_alive: bool = (
+            self.server.get_keep_alive() > 0 and self.request_version == 'HTTP/1.1'
+            and self.headers.get('Connection', '').lower() != 'close'
+            and not self.server.is_draining()
+        )
+        environ = self.get_environ()
+        request_stream: IO[bytes] = cast(IO[bytes], self.rfile)
+        body: Union[DechunkedInput, LimitedStream]
+        if 'chunked' in environ.get('HTTP_TRANSFER_ENCODING', '').lower():
+            environ['wsgi.input_terminated'] = True
+            body = DechunkedInput(request_stream)
+            keep_alive = False
+        else:
+            try:
+                body = LimitedStream(request_stream, int(environ.get('CONTENT_LENGTH') or 0))
+            except ValueError:
+                self.send_error(400, 'Bad Content-Length')
+                return
+        handler: KeepAliveServerHandler = KeepAliveServerHandler(
+            body, self.wfile, self.get_stderr(), environ, keep_alive
+        )
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+        self.close_connection = not (
+            handler.keeps_alive() and isinstance(body, LimitedStream) and self.__discard_body(body)
+        )
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        """ Logs a served request or an error.
+        ---
+        Parameters:
+            - format: The message format string.
+            - args: The format arguments.
+        """
+        logging.getLogger(__name__).info('%s - %s', self.address_string(), format % args)
+
+    def __discard_body(self, body: LimitedStream) -> bool:
+        """ Reads the rest of a request body the application did not, so the next
+        request can be read.
+        ---
+        Parameters:
+            - body: The request body stream.
+        Returns:
+            True if the body was completely read; false if it was too large or the
+            client disconnected.
+        """
+        if body.limit - body.tell() > PooledRequestHandler.MAX_DISCARDED_BODY:
+            return False
+        try:
+            body.exhaust()
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return True
@@ -0,0 +1,109 @@
+""" PooledWSGIServer class module.
+"""
+
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from wsgiref.simple_server import WSGIServer
+from dms2021auth.presentation.server.pooledrequesthandler import PooledRequestHandler
+
+
+class PooledWSGIServer(WSGIServer):  # pylint: disable=too-many-instance-attributes
+    """ WSGI server serving its connections in a bounded pool of threads.
+
+    Once every thread is busy, new connections wait in the listening socket
+    backlog instead of spawning more threads.
+    """
+
+    def __init__(self, listener: socket.socket, app: Callable, *, threads: int, keep_alive: float):
+        """ Constructor method.
+
+        Initializes the server.
+        ---
+        Parameters:
+            - listener: The (already bound and listening) socket to accept connections from.
+                        It is closed along with the server.
+            - app: The WSGI application to serve.
+            - threads: The maximum number of connections served concurrently.
+            - keep_alive: The seconds an idle connection is kept open; 0 disables keep-alive.
+        """
+        self.address_family = listener.family
+        address = listener.getsockname()
+        super().__init__(address, PooledRequestHandler, bind_and_activate=False)
+        # Replace the socket created by the base constructor
+        self.socket.close()
+        self.socket = listener
+        self.server_address = address
+        self.server_name = socket.getfqdn(address[0])
+        self.server_port = address[1]
+        self.setup_environ()
+        self.__app: Callable = app
+        self.__keep_alive: float = keep_alive
+        self.__draining: threading.Event = threading.Event()
+        self.__slots: threading.BoundedSemaphore = threading.BoundedSemaphore(threads)
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix='wsgi-worker'
+        )
+
+    def get_app(self) -> Callable:
+        """ Gets the served application.
+        ---
+        Returns:
+            The WSGI application callable.
+        """
+        return self.__app
+
+    def get_keep_alive(self) -> float:
+        """ Gets the time an idle connection is kept open.
+        ---
+        Returns:
+            The keep-alive time in seconds, or 0 if connections are closed after each request.
+        """
+        return self.__keep_alive
+
+    def is_draining(self) -> bool:
+        """ Determines whether the server stopped accepting connections.
+        ---
+        Returns:
+            True if the server is finishing its ongoing requests to stop; false otherwise.
+        """
+        return self.__draining.is_set()
+
+    def process_request(self, request, client_address) -> None:
+        """ Serves an accepted connection in the thread pool, waiting for a free thread.
+        ---
+        Parameters:
+            - request: The connection socket.
+            - client_address: The client address.
+        """
+        self.__slots.acquire()  # pylint: disable=consider-using-with
+        try:
+            self.__executor.submit(self.__process_request_thread, request, client_address)
+        except:
+            self.__slots.release()
+            raise
+
+    def server_close(self) -> None:
+        """ Stops accepting connections and waits for the ongoing ones to finish.
+
+        Idle connections are closed once their keep-alive time elapses.
+        """
+        self.__draining.set()
+        super().server_close()
+        self.__executor.shutdown(wait=True)
+
+    def __process_request_thread(self, request, client_address) -> None:
+        """ Serves a connection until it is closed.
+        ---
+        Parameters:
+            - request: The connection socket.
+            - client_address: The client address.
+        """
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # pylint: disable=broad-except
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.__slots.release()
@@ -0,0 +1,180 @@
+""" PreforkServer class module.
+"""
+
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from dms2021auth.data.config import AuthConfiguration
+from dms2021auth.presentation.server.pooledwsgiserver import PooledWSGIServer
+
+
+class PreforkServer():
+    """ Multi-process WSGI server.
+
+    The master process binds the listening socket and forks the workers, which
+    accept connections from it and serve them with a `PooledWSGIServer`. Workers
+    that die are replaced. On SIGTERM or SIGINT, every worker stops accepting
+    connections and finishes its ongoing requests before exiting. SIGUSR1 is
+    relayed to the workers, which ignore it unless they handle it (see
+    `on_worker_start`).
+
+    The master process must not hold database connections nor run threads when
+    forking, as neither can be shared with the workers.
+    """
+
+    def __init__(
+        self, config: AuthConfiguration, app, *,
+        on_worker_start: Optional[Callable[[int], None]] = None,
+        on_worker_exit: Optional[Callable[[int], None]] = None
+    ):
+        """ Constructor method.
+
+        Initializes the server. Nothing is started until `run` is called.
+        ---
+        Parameters:
+            - config: An AuthConfiguration instance with the address and server parameters.
+            - app: The WSGI application to serve.
+            - on_worker_start: Called in every worker process before it starts serving,
+                               with the worker index (from 0 to the number of workers - 1).
+                               It may install a SIGUSR1 handler.
+            - on_worker_exit: Called in every worker process once it stops serving,
+                              with the worker index.
+        """
+        self.__config: AuthConfiguration = config
+        self.__app = app
+        self.__on_worker_start: Optional[Callable[[int], None]] = on_worker_start
+        self.__on_worker_exit: Optional[Callable[[int], None]] = on_worker_exit
+        self.__workers: Dict[int, int] = {}
+        self.__stopping: bool = False
+
+    def run(self) -> None:
+        """ Runs the server until it is signaled to stop.
+        ---
+        Throws:
+            - A `RuntimeError` if the platform cannot fork processes.
+        """
+        if not hasattr(os, 'fork'):
+            raise RuntimeError('The prefork server mode is not supported in this platform.')
+        host: str = self.__config.get_service_host()
+        family = socket.AF_INET6 if ':' in host else socket.AF_INET
+        listener: socket.socket = socket.create_server(
+            (host, self.__config.get_service_port()), family=family
+        )
+        self.__stopping = False
+        previous_handlers = {
+            signum: signal.signal(signum, self.__request_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        previous_handlers[signal.SIGUSR1] = signal.signal(signal.SIGUSR1, self.__relay)
+        try:
+            for index in range(self.__config.get_server_workers()):
+                self.__spawn(index, listener)
+            while not self.__stopping:
+                time.sleep(0.5)
+                for index in self.__reap():
+                    if not self.__stopping:
+                        logging.getLogger(__name__).warning(
+                            'Server worker %d exited; replacing it', index
+                        )
+                        self.__spawn(index, listener)
+        finally:
+            self.__stop_workers()
+            listener.close()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+    def __request_stop(self, signum, frame) -> None:  # pylint: disable=unused-argument
+        """ Signal handler asking the master process to stop.
+        """
+        self.__stopping = True
+
+    def __relay(self, signum, frame) -> None:  # pylint: disable=unused-argument
+        """ Signal handler relaying the signal to every worker.
+        """
+        for pid in list(self.__workers):
+            os.kill(pid, signum)
+
+    def __spawn(self, index: int, listener: socket.socket) -> None:
+        """ Forks a worker process.
+        ---
+        Parameters:
+            - index: The worker index.
+            - listener: The listening socket.
+        """
+        pid: int = os.fork()
+        if pid == 0:
+            # The worker never returns to the code that started the master
+            exit_code: int = 1
+            try:
+                self.__run_worker(index, listener)
+                exit_code = 0
+            except BaseException:  # pylint: disable=broad-except
+                logging.getLogger(__name__).exception('Server worker %d failed', index)
+            finally:
+                os._exit(exit_code)  # pylint: disable=protected-access
+        self.__workers[pid] = index
+
+    def __run_worker(self, index: int, listener: socket.socket) -> None:
+        """ Serves connections in a worker process until it is signaled to stop.
+        ---
+        Parameters:
+            - index: The worker index.
+            - listener: The listening socket.
+        """
+        # The master relays interruptions as SIGTERM once every worker can be stopped
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+        server: PooledWSGIServer = PooledWSGIServer(
+            listener, self.__app,
+            threads=self.__config.get_server_threads(),
+            keep_alive=self.__config.get_server_keep_alive()
+        )
+        # `shutdown` waits for the serving loop, so it cannot run in the signaled thread
+        signal.signal(
+            signal.SIGTERM,
+            lambda signum, frame: threading.Thread(target=server.shutdown, daemon=True).start()
+        )
+        if self.__on_worker_start is not None:
+            self.__on_worker_start(index)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if self.__on_worker_exit is not None:
+                self.__on_worker_exit(index)
+
+    def __reap(self) -> List[int]:
+        """ Collects the worker processes that exited, without waiting.
+        ---
+        Returns:
+            A list with the indexes of the exited workers.
+        """
+        exited: List[int] = []
+        while self.__workers:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            if pid in self.__workers:
+                exited.append(self.__workers.pop(pid))
+        return exited
+
+    def __stop_workers(self) -> None:
+        """ Asks every worker to stop, killing those not done within the graceful timeout.
+        """
+        for pid in self.__workers:
+            os.kill(pid, signal.SIGTERM)
+        deadline: float = time.monotonic() + self.__config.get_server_graceful_timeout()
+        while self.__workers and time.monotonic() < deadline:
+            self.__reap()
+            time.sleep(0.1)
+        for pid in list(self.__workers):
+            logging.getLogger(__name__).warning(
+                'Server worker %d did not stop in time; killing it', self.__workers[pid]
+            )
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            del self.__workers[pid]
@@ -2,3 +2,5 @@
 """
 
 from .userrightname import UserRightName
+from .userrightmask import UserRightMask
+from .signedsessiontoken import SignedSessionToken
@@ -1,11 +1,12 @@
 """ Module containing the dms2021core.data.config.configuration.Configuration class.
 """
 
+import hashlib
+import json
 import os
 from abc import ABC, abstractmethod
 from typing import Union, Dict, List, Tuple, Optional
-from appdirs import user_config_dir  # type: ignore
-import yaml
+from appdirs import user_cache_dir, user_config_dir  # type: ignore
 
 ConfigurationValueType = Optional[
     Union[str, int, float, bool, Dict, List, Tuple]
@@ -47,13 +48,84 @@ class Configuration(ABC):
         """ Loads the configuration values from a given file.
 
         This operation will override any previously existing configuration parameters.
+
+        The parsed values are cached in the user cache directory, so the file is only
+        parsed again (and the YAML parser only imported) once it changes.
         ---
         Parameters:
             - path: A string with the path of the configuration file to load.
         """
 
-        with open(path, 'r') as stream:
-            self._set_values(yaml.load(stream, Loader=yaml.SafeLoader))
+        status: os.stat_result = os.stat(path)
+        source: List = [os.path.abspath(path), status.st_mtime_ns, status.st_size]
+        cache_path: str = os.path.join(
+            user_cache_dir(self._component_name()),
+            'config-' + hashlib.sha1(source[0].encode('utf-8')).hexdigest()[:16] + '.json'
+        )
+        values = Configuration.__read_cache(cache_path, source)
+        if values is None:
+            import yaml  # pylint: disable=import-outside-toplevel
+            with open(path, 'r') as stream:
+                values = yaml.load(stream, Loader=yaml.SafeLoader)
+            Configuration.__write_cache(cache_path, source, values)
+        self._set_values(values)
+
+    @staticmethod
+    def __read_cache(cache_path: str, source: List) -> Optional[dict]:
+        """ Reads the cached values of a configuration file.
+        ---
+        Parameters:
+            - cache_path: A string with the path of the cache file.
+            - source: A list with the path, modification time and size of the configuration file.
+        Returns:
+            The cached dictionary of configuration values, or None if they are missing, stale
+            or readable by other users.
+        """
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as stream:
+                # Files others can read are rewritten, so the secrets stop leaking
+                if os.fstat(stream.fileno()).st_mode & 0o077:
+                    return None
+                cached = json.load(stream)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get('source') != source:
+            return None
+        return cached.get('values')
+
+    @staticmethod
+    def __write_cache(cache_path: str, source: List, values) -> None:
+        """ Caches the values of a configuration file, if possible, in a file only its
+        owner can access.
+        ---
+        Parameters:
+            - cache_path: A string with the path of the cache file.
+            - source: A list with the path, modification time and size of the configuration file.
+            - values: The parsed configuration values.
+        """
+
+        try:
+            serialized: str = json.dumps({'source': source, 'values': values})
+        except (TypeError, ValueError):
+            return
+        # Values JSON cannot represent as is (e.g., dates or non-string keys) are not cached
+        if json.loads(serialized)['values'] != values:
+            return
+        temporary_path: str = cache_path + '.' + str(os.getpid())
+        try:
+            # The values may include secrets (e.g., keys or passwords), so only the owner
+            # can read them
+            os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+            descriptor: int = os.open(
+                temporary_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+            )
+            with open(descriptor, 'w', encoding='utf-8') as stream:
+                stream.write(serialized)
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            # The cache is just an optimization
+            pass
 
     def _set_values(self, values: dict) -> None:
         """ Overrides the configuration values with a given dictionary.
@@ -102,3 +174,19 @@ class Configuration(ABC):
             return self.__values[key]
         except KeyError:
             return None
+
+    def get_section_value(self, section: str, key: str) -> ConfigurationValueType:
+        """ Retrieves a single value from a configuration section (a nested dictionary).
+        ---
+        Parameters:
+            - section: A string with the name of the configuration section.
+            - key: A string with the name of the parameter inside the section.
+        Returns:
+            The value contained in the parameter, or None if either the section
+            or the key were not found, or the section is not a dictionary.
+        """
+
+        section_values: ConfigurationValueType = self.get_value(section)
+        if not isinstance(section_values, dict):
+            return None
+        return section_values.get(key)
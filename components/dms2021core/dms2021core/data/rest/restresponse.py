@@ -1,31 +1,39 @@
 """ RestResponse class module.
 """
 
+from typing import Dict, Iterable, Optional, Union
+
 
 class RestResponse():
     """ Entity data-object class used to store the data of a response to a REST request.
     """
 
-    def __init__(self, content: str = '', code: int = 200, mime_type: str = 'text/html'):
+    def __init__(
+        self, content: Union[str, Iterable[str]] = '', code: int = 200,
+        mime_type: str = 'text/html', headers: Optional[Dict[str, str]] = None
+    ):
         """ Constructor method.
 
         Initializes a RestResponse instance with its immutable data.
         ---
         Parameters:
-            - content: A string with the response content. Defaults to ''
+            - content: A string with the response content, or an iterable of strings
+                       to stream it in parts. Defaults to ''
             - code: An integer with the HTTP status code to use for the response.
                     Defaults to 200 (OK).
             - mime_type: The content type string. Defaults to 'text/html'
+            - headers: A dictionary with any additional response headers. Defaults to none.
         """
         self.__content = content
         self.__code = code
         self.__mime_type = mime_type
+        self.__headers: Dict[str, str] = dict(headers or {})
 
-    def get_content(self) -> str:
+    def get_content(self) -> Union[str, Iterable[str]]:
         """ Gets the response content.
         ---
         Returns:
-            A string with the response content.
+            A string with the response content, or an iterable of strings if streamed.
         """
         return self.__content
 
@@ -44,3 +52,13 @@ class RestResponse():
             A string with the response content/MIME type.
         """
         return self.__mime_type
+
+    def get_headers(self) -> Dict[str, str]:
+        """ Gets the response headers, including its content type.
+        ---
+        Returns:
+            A dictionary with the response header names and values.
+        """
+        headers: Dict[str, str] = dict(self.__headers)
+        headers['Content-Type'] = self.__mime_type
+        return headers
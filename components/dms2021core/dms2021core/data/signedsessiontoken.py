@@ -0,0 +1,183 @@
+""" SignedSessionToken class module.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+from typing import Optional
+
+
+class SignedSessionToken():
+    """ Entity data-object class storing the claims of a self-validating session token.
+
+    The encoded token is `<payload>.<signature>`, where the payload is the
+    URL-safe Base64 of a compact JSON dictionary with the claims, and the
+    signature its HMAC-SHA256 with a secret key shared by the services.
+    """
+
+    def __init__(
+        self, session_id: str, username: str, rights_mask: int, issued: int, expires: int
+    ):  # pylint: disable=too-many-arguments
+        """ Constructor method.
+
+        Initializes a SignedSessionToken instance with its immutable data.
+        ---
+        Parameters:
+            - session_id: The id of the session the token belongs to.
+            - username: The session owner user name.
+            - rights_mask: The integer bitmask (see `UserRightMask`) with the owner
+                           rights when the token was issued.
+            - issued: The issue time, as a UNIX timestamp.
+            - expires: The expiration time, as a UNIX timestamp.
+        """
+        self.__session_id: str = session_id
+        self.__username: str = username
+        self.__rights_mask: int = rights_mask
+        self.__issued: int = issued
+        self.__expires: int = expires
+
+    def get_session_id(self) -> str:
+        """ Gets the id of the session the token belongs to.
+        ---
+        Returns:
+            The session id string.
+        """
+        return self.__session_id
+
+    def get_username(self) -> str:
+        """ Gets the session owner.
+        ---
+        Returns:
+            The user name string.
+        """
+        return self.__username
+
+    def get_rights_mask(self) -> int:
+        """ Gets the owner rights when the token was issued.
+        ---
+        Returns:
+            The integer rights bitmask.
+        """
+        return self.__rights_mask
+
+    def get_issued(self) -> int:
+        """ Gets the issue time.
+        ---
+        Returns:
+            The UNIX timestamp of the issue time.
+        """
+        return self.__issued
+
+    def get_expires(self) -> int:
+        """ Gets the expiration time.
+        ---
+        Returns:
+            The UNIX timestamp after which the token is no longer valid.
+        """
+        return self.__expires
+
+    def is_expired(self, now: float) -> bool:
+        """ Determines whether the token has expired.
+        ---
+        Parameters:
+            - now: The current UNIX timestamp.
+        Returns:
+            True if the token is expired; false otherwise.
+        """
+        return now >= self.__expires
+
+    def encode(self, key: bytes) -> str:
+        """ Encodes and signs the token.
+        ---
+        Parameters:
+            - key: The secret signing key.
+        Returns:
+            The encoded token string.
+        """
+        claims = {
+            'sid': self.__session_id,
+            'sub': self.__username,
+            'rights': self.__rights_mask,
+            'iat': self.__issued,
+            'exp': self.__expires
+        }
+        payload: str = SignedSessionToken.__encode_segment(
+            json.dumps(claims, separators=(',', ':')).encode('utf-8')
+        )
+        return payload + '.' + SignedSessionToken.__sign(key, payload)
+
+    @staticmethod
+    def is_signed(token: str) -> bool:
+        """ Determines whether a token string looks like a signed token, as opposed
+        to an opaque session id.
+        ---
+        Parameters:
+            - token: The token string.
+        Returns:
+            True if the token has the signed token format; false otherwise.
+        """
+        # Encoded tokens are ASCII, and only ASCII strings can be signed and compared
+        return token.isascii() and token.count('.') == 1
+
+    @staticmethod
+    def decode(key: bytes, token: str) -> Optional['SignedSessionToken']:
+        """ Decodes a token, verifying its signature. Its expiration is not checked.
+        ---
+        Parameters:
+            - key: The secret signing key.
+            - token: The encoded token string.
+        Returns:
+            The SignedSessionToken, or None if the token is malformed or its signature
+            does not match.
+        """
+        if not SignedSessionToken.is_signed(token):
+            return None
+        payload, signature = token.split('.')
+        if not hmac.compare_digest(SignedSessionToken.__sign(key, payload), signature):
+            return None
+        try:
+            claims = json.loads(SignedSessionToken.__decode_segment(payload))
+            return SignedSessionToken(
+                str(claims['sid']), str(claims['sub']), int(claims['rights']),
+                int(claims['iat']), int(claims['exp'])
+            )
+        except (ValueError, KeyError, TypeError, binascii.Error):
+            return None
+
+    @staticmethod
+    def __sign(key: bytes, payload: str) -> str:
+        """ Computes the signature of a payload.
+        ---
+        Parameters:
+            - key: The secret signing key.
+            - payload: The encoded payload string.
+        Returns:
+            The encoded signature string.
+        """
+        return SignedSessionToken.__encode_segment(
+            hmac.new(key, payload.encode('ascii'), hashlib.sha256).digest()
+        )
+
+    @staticmethod
+    def __encode_segment(data: bytes) -> str:
+        """ Encodes a token segment as unpadded URL-safe Base64.
+        ---
+        Parameters:
+            - data: The raw bytes.
+        Returns:
+            The encoded string.
+        """
+        return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def __decode_segment(segment: str) -> bytes:
+        """ Decodes an unpadded URL-safe Base64 token segment.
+        ---
+        Parameters:
+            - segment: The encoded string.
+        Returns:
+            The raw bytes.
+        """
+        return base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
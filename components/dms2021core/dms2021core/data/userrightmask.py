@@ -0,0 +1,60 @@
+""" UserRightMask class module.
+"""
+
+from typing import Iterable, List
+from dms2021core.data.userrightname import UserRightName
+
+
+class UserRightMask():
+    """ Toolkit class to encode sets of user rights as integer bitmasks.
+
+    Each right is represented by the bit `1 << (value - 1)`.
+    """
+
+    @staticmethod
+    def of(right: UserRightName) -> int:
+        """ Gets the bit representing a right.
+        ---
+        Parameters:
+            - right: The right name.
+        Returns:
+            An integer with the single bit of the right set.
+        """
+        return 1 << (right.value - 1)
+
+    @staticmethod
+    def from_rights(rights: Iterable[UserRightName]) -> int:
+        """ Encodes a set of rights.
+        ---
+        Parameters:
+            - rights: An iterable of right names.
+        Returns:
+            An integer bitmask with the bits of the given rights set.
+        """
+        mask: int = 0
+        for right in rights:
+            mask |= UserRightMask.of(right)
+        return mask
+
+    @staticmethod
+    def to_rights(mask: int) -> List[UserRightName]:
+        """ Decodes a bitmask into its rights.
+        ---
+        Parameters:
+            - mask: The integer bitmask.
+        Returns:
+            A list of the right names whose bits are set, in declaration order.
+        """
+        return [right for right in UserRightName if mask & UserRightMask.of(right)]
+
+    @staticmethod
+    def contains(mask: int, required: int) -> bool:
+        """ Determines whether a bitmask includes every bit of another one.
+        ---
+        Parameters:
+            - mask: The integer bitmask being checked.
+            - required: The integer bitmask with the bits that must be set.
+        Returns:
+            True if all the required bits are set in the mask; false otherwise.
+        """
+        return mask & required == required
@@ -0,0 +1,8 @@
+#!/bin/bash
+
+# Runs the benchmark suite of dms2021auth; arguments are passed on (see --help)
+INVOCATION_DIR=$(cd "$(dirname "$0")" && pwd)
+COMPONENTS_DIR="${INVOCATION_DIR}/../components"
+
+cd "${COMPONENTS_DIR}/dms2021auth"
+PYTHONPATH="${COMPONENTS_DIR}/dms2021core:${COMPONENTS_DIR}/dms2021auth${PYTHONPATH:+:${PYTHONPATH}}" python3 -m bench "$@"